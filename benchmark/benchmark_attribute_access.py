@@ -0,0 +1,37 @@
+import montepy
+
+import time
+
+FILE = "benchmark/big_model.imcnp"
+REPEATS = 20
+
+problem = montepy.read_input(FILE)
+cells = list(problem.cells)
+print(f"Looping over {len(cells)} cells, {REPEATS} times.")
+
+start = time.time()
+total = 0
+for _ in range(REPEATS):
+    for cell in cells:
+        total += cell.number
+        material = cell.material
+        if material is not None:
+            total += material.number
+        total += cell.mass_density if cell.material else 0.0
+        total += cell.importance.neutron
+        for surface in cell.surfaces:
+            total += surface.number
+            surface.surface_type
+        cell.universe
+        cell.fill.universe
+stop = time.time()
+print(f"Attribute access took {stop - start} seconds")
+
+start = time.time()
+for _ in range(REPEATS):
+    seen = set()
+    for cell in cells:
+        seen.add(cell)
+        seen.update(cell.surfaces)
+stop = time.time()
+print(f"Hashing objects into sets took {stop - start} seconds")
@@ -0,0 +1,40 @@
+import io
+import time
+import warnings
+
+import montepy
+
+CELLS = 20_000
+
+
+def make_input():
+    lines = ["Cell modifier benchmark"]
+    for number in range(1, CELLS + 1):
+        lines.append(f"{number} 0 -{number}")
+    lines.append("")
+    for number in range(1, CELLS + 1):
+        lines.append(f"{number} SO {number}")
+    lines += [
+        "",
+        "mode n p",
+        f"imp:n 1 {CELLS - 1}r",
+        f"imp:p 1 {CELLS - 1}r",
+        f"vol 1 {CELLS - 1}r",
+        f"u 0 {CELLS - 1}r",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+print(f"Reading {CELLS} cells with data block cell modifiers.")
+start = time.time()
+problem = montepy.read_input(io.StringIO(make_input()))
+stop = time.time()
+print(f"Reading took {stop - start} seconds")
+
+start = time.time()
+problem.cells.set_equal_importance(2.0)
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    problem.write_problem(io.StringIO())
+stop = time.time()
+print(f"Editing and writing took {stop - start} seconds")
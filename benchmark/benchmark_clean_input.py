@@ -0,0 +1,26 @@
+import os
+import tempfile
+import time
+
+from montepy.input_parser.input_file import MCNP_InputFile
+
+SIZE = 1 << 30
+LINE = "1 1 -1.0 -1 2 -3 imp:n=1 $ café réflecteur\r\n".encode("utf-8")
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    path = os.path.join(tmp_dir, "big.imcnp")
+    block = LINE * (1024 * 1024 // len(LINE))
+    with open(path, "wb") as fh:
+        for _ in range(SIZE // len(block)):
+            fh.write(block)
+    size = os.path.getsize(path)
+    print(f"Cleaning {size / 1024**3:.2f} GiB of input with non-ASCII characters.")
+    input_file = MCNP_InputFile(path)
+    start = time.time()
+    with input_file.open("r", replace=True):
+        lines = 0
+        for line in input_file:
+            lines += 1
+    stop = time.time()
+    print(f"Cleaning {lines} lines took {stop - start} seconds")
+    print(f"{size / 1024**2 / (stop - start):.1f} MiB/s")
@@ -0,0 +1,46 @@
+import re
+import subprocess
+import sys
+
+FAIL_THRESHOLD = 0.5
+REPEATS = 5
+HEAVY_MODULES = ["montepy.input_parser", "montepy.mcnp_problem", "montepy.cell"]
+
+
+def import_time(statement):
+    """
+    Gets the total time in seconds of the top level imports reported by ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    top_level = re.findall(r"\|\s*(\d+) \| montepy\S*$", result.stderr, re.MULTILINE)
+    return sum(int(time) for time in top_level) / 1e6
+
+
+light = min(import_time("import montepy") for _ in range(REPEATS))
+print(f"import montepy took {light} seconds")
+full = min(import_time("import montepy.mcnp_problem") for _ in range(REPEATS))
+print(f"import montepy with the parsers took {full} seconds")
+
+loaded = subprocess.run(
+    [
+        sys.executable,
+        "-c",
+        "import sys, montepy; montepy.__version__; montepy.errors; print(*sys.modules)",
+    ],
+    capture_output=True,
+    text=True,
+    check=True,
+).stdout.split()
+for module in HEAVY_MODULES:
+    if module in loaded:
+        raise RuntimeError(f"import montepy must not import: {module}.")
+
+if light > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Importing montepy took too long. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,46 @@
+import os
+import random
+import tempfile
+import time
+
+import montepy
+
+CELLS = 500_000
+LOOKUPS = 1_000
+
+
+def write_input(path):
+    with open(path, "w") as fh:
+        fh.write("Index benchmark\n")
+        for number in range(1, CELLS + 1):
+            fh.write(
+                f"c cell {number}\n{number} {number} -1.0 -{number} {number + 1}\n"
+            )
+            fh.write(f"     imp:n=1 vol={number}\n")
+        fh.write("\n")
+        for number in range(1, CELLS + 2):
+            fh.write(f"{number} PZ {number}\n")
+        fh.write("\n")
+        for number in range(1, CELLS + 1):
+            fh.write(f"m{number} 1001.80c 2 8016.80c 1\n")
+        fh.write("mode n\n")
+
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    path = os.path.join(tmp_dir, "big.imcnp")
+    write_input(path)
+    size = os.path.getsize(path)
+    print(
+        f"Indexing {size / 1024**2:.1f} MiB with {CELLS} cells, surfaces, and materials."
+    )
+    start = time.time()
+    index = montepy.InputIndex(path)
+    stop = time.time()
+    print(f"Indexing {len(index)} inputs took {stop - start} seconds")
+    numbers = random.Random(0).sample(range(1, CELLS + 1), LOOKUPS)
+    start = time.time()
+    for number in numbers:
+        assert index.get_cell(number).number == number
+    stop = time.time()
+    print(f"Parsing one cell by number took {(stop - start) / LOOKUPS * 1e3} ms")
+    index.close()
@@ -0,0 +1,45 @@
+import io
+import time
+
+import montepy
+
+SIZE = 300
+UNIVERSES = 10
+
+
+def make_input():
+    lines = [
+        "Lattice fill benchmark",
+        f"1 0 -1 lat=1 u=100 fill=0:{SIZE - 1} 0:{SIZE - 1} 0:0",
+    ]
+    for row in range(SIZE):
+        for start in range(0, SIZE, 20):
+            lines.append(
+                "     "
+                + " ".join(
+                    str((row * SIZE + i) % UNIVERSES + 1)
+                    for i in range(start, min(start + 20, SIZE))
+                )
+            )
+    lines += [
+        "2 0 -2 fill=100 imp:n=1",
+        "3 0 2 imp:n=0",
+    ]
+    for number in range(1, UNIVERSES + 1):
+        lines.append(f"{number + 10} 0 -1 u={number}")
+    lines += ["", "1 RPP 0 1 0 1 0 1", "2 SO 1000", "", "mode n"]
+    return "\n".join(lines) + "\n"
+
+
+print(f"Reading a {SIZE}x{SIZE} lattice fill.")
+start = time.time()
+problem = montepy.read_input(io.StringIO(make_input()))
+stop = time.time()
+print(f"Reading took {stop - start} seconds")
+
+fill = problem.cells[1].fill
+assert fill.universes[SIZE - 1, SIZE - 1, 0].number == (SIZE * SIZE - 1) % UNIVERSES + 1
+start = time.time()
+fill.format_for_mcnp_input(problem.mcnp_version)
+stop = time.time()
+print(f"Writing took {stop - start} seconds")
@@ -0,0 +1,32 @@
+import io
+import time
+
+import montepy
+
+SURFACES = 50_000
+TRANSFORMS = 1_000
+
+
+def make_input():
+    lines = ["Linking benchmark", "1 0 -1 imp:n=1", "2 0 1 imp:n=0", ""]
+    for number in range(1, SURFACES + 1):
+        lines.append(f"{number} {number % TRANSFORMS + 1} PZ {number}")
+    lines.append("")
+    for number in range(1, TRANSFORMS + 1):
+        lines.append(f"tr{number} 0 0 {number}")
+    lines.append("mode n")
+    return "\n".join(lines) + "\n"
+
+
+print(f"Reading {SURFACES} surfaces with {TRANSFORMS} transforms.")
+start = time.time()
+problem = montepy.read_input(io.StringIO(make_input()))
+stop = time.time()
+print(f"Reading took {stop - start} seconds")
+
+start = time.time()
+problem._MCNP_Problem__update_internal_pointers()
+stop = time.time()
+print(f"Linking took {stop - start} seconds")
+for surface in problem.surfaces:
+    assert surface.transform.number == surface.number % TRANSFORMS + 1
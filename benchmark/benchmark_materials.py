@@ -0,0 +1,52 @@
+import io
+import time
+import tracemalloc
+
+import montepy
+
+MATERIALS = 10_000
+NUCLIDES = [
+    "1001.80c",
+    "8016.80c",
+    "40090.80c",
+    "40091.80c",
+    "40092.80c",
+    "40094.80c",
+    "92234.80c",
+    "92235.80c",
+    "92236.80c",
+    "92238.80c",
+    "93237.80c",
+    "94238.80c",
+    "94239.80c",
+    "94240.80c",
+    "94241.80c",
+    "95241.80c",
+    "95242.80c",
+    "95642.80c",
+    "54135.80c",
+    "62149.80c",
+]
+
+
+def make_input():
+    lines = ["Material benchmark", "1 0 -1 imp:n=1", "2 0 1 imp:n=0", "", "1 SO 10", ""]
+    for number in range(1, MATERIALS + 1):
+        lines.append(f"m{number}")
+        for idx, nuclide in enumerate(NUCLIDES):
+            lines.append(f"     {nuclide} {(number + idx) * 1e-5:.5e}")
+    lines.append("mode n")
+    return "\n".join(lines) + "\n"
+
+
+print(f"Reading {MATERIALS} materials with {len(NUCLIDES)} nuclides each.")
+text = make_input()
+tracemalloc.start()
+start = time.time()
+problem = montepy.read_input(io.StringIO(text))
+stop = time.time()
+_, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+print(f"Reading took {stop - start} seconds")
+print(f"Peak memory was {peak / 1024**2:.1f} MiB")
+assert len(problem.materials) == MATERIALS
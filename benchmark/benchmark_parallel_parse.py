@@ -0,0 +1,39 @@
+import os
+import time
+
+import montepy
+
+FAIL_SPEEDUP = 1.2
+MAX_WORKERS = 4
+
+
+def main():
+    path = "benchmark/big_model.imcnp"
+    cpus = os.cpu_count() or 1
+    workers = min(MAX_WORKERS, cpus)
+
+    start = time.time()
+    serial = montepy.read_input(path)
+    serial_time = time.time() - start
+    print(f"Serial parse took {serial_time} seconds")
+    del serial
+
+    if workers < 2:
+        print(f"Only {cpus} CPU available, so the parallel parse is not benchmarked.")
+    else:
+        start = time.time()
+        parallel = montepy.read_input(path, workers=workers)
+        parallel_time = time.time() - start
+        speedup = serial_time / parallel_time
+        print(
+            f"Parallel parse with {workers} workers took {parallel_time} seconds, a {speedup:.2f}x speedup"
+        )
+        if speedup < FAIL_SPEEDUP:
+            raise RuntimeError(
+                f"Parallel parse was too slow. It must be at least {FAIL_SPEEDUP}x faster than a serial parse."
+            )
+
+
+# the workers import this file again when processes are spawned.
+if __name__ == "__main__":
+    main()
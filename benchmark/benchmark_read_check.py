@@ -0,0 +1,51 @@
+import montepy
+from montepy.input_parser import input_syntax_reader
+from montepy.input_parser.mcnp_input import Input, ReadInput
+
+import time
+
+FILE = "benchmark/big_model.imcnp"
+REPEATS = 5
+
+inputs = [
+    input
+    for input in input_syntax_reader.read_input_syntax(
+        montepy.input_parser.input_file.MCNP_InputFile(FILE)
+    )
+    if isinstance(input, Input)
+]
+print(f"Checking {len(inputs)} inputs from {FILE}, {REPEATS} times.")
+
+
+def try_read_input(input):
+    try:
+        ReadInput(input.input_lines, input.block_type)
+        return True
+    except ValueError:
+        return False
+
+
+start = time.time()
+for _ in range(REPEATS):
+    for input in inputs:
+        try_read_input(input)
+stop = time.time()
+exception_time = stop - start
+print(f"Constructing a ReadInput and catching the error took {exception_time} seconds")
+
+start = time.time()
+for _ in range(REPEATS):
+    for input in inputs:
+        ReadInput.is_read_input(input.input_lines)
+stop = time.time()
+check_time = stop - start
+print(f"Checking the text first took {check_time} seconds")
+print(f"Speed up: {exception_time / check_time}x")
+
+start = time.time()
+for input in input_syntax_reader.read_input_syntax(
+    montepy.input_parser.input_file.MCNP_InputFile(FILE)
+):
+    pass
+stop = time.time()
+print(f"The whole syntax pass took {stop - start} seconds")
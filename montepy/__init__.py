@@ -5,25 +5,64 @@ This creates a semantic understanding of the MCNP input file.
 start by running montepy.read_input().
 
 You will receive an MCNP_Problem object that you will interact with.
+
+.. versionchanged:: 0.5.5
+    The parsers, and the classes that need them, are only imported when they are first used.
 """
 
-from . import input_parser
 from . import constants
-import importlib.metadata
-from .input_parser.input_reader import read_input
-from montepy.cell import Cell
-from montepy.mcnp_problem import MCNP_Problem
-from montepy.data_inputs.material import Material
-from montepy.data_inputs.transform import Transform
+import importlib
 from montepy.geometry_operators import Operator
 from montepy import geometry_operators
-from montepy.input_parser.mcnp_input import Jump
 from montepy.particle import Particle
-from montepy.surfaces.surface_type import SurfaceType
-from montepy.universe import Universe
 import montepy.errors
 import sys
 
+_LAZY_ATTRIBUTES = {
+    "iter_inputs": "montepy.input_parser.input_reader",
+    "read_input": "montepy.input_parser.input_reader",
+    "InputIndex": "montepy.input_parser.input_index",
+    "Cell": "montepy.cell",
+    "MCNP_Problem": "montepy.mcnp_problem",
+    "Material": "montepy.data_inputs.material",
+    "Transform": "montepy.data_inputs.transform",
+    "Jump": "montepy.input_parser.mcnp_input",
+    "SurfaceType": "montepy.surfaces.surface_type",
+    "Universe": "montepy.universe",
+}
+"""
+The public attributes of this package that are imported on first use, and the modules they come from.
+
+Importing these loads the parsers, which is most of the time spent importing MontePy.
+"""
+
+
+def __getattr__(name):
+    """
+    Imports the public attributes and the subpackages of MontePy when they are first used.
+
+    :param name: the name of the attribute.
+    :type name: str
+    :raises AttributeError: if there is no attribute or submodule by that name.
+    """
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise e
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 try:
     from . import _version
@@ -25,6 +25,10 @@ def _link_geometry_to_cell(self, geom):
     geom._add_new_children_to_cell(geom)
 
 
+def _link_material_to_cell(self, material):
+    self._links_changed()
+
+
 class Cell(Numbered_MCNP_Object):
     """
     Object to represent a single MCNP cell defined in CSG.
@@ -187,6 +191,7 @@ class Cell(Numbered_MCNP_Object):
         if not isinstance(value, Universe):
             raise TypeError("universe must be set to a Universe")
         self._universe.universe = value
+        self._links_changed()
 
     @property
     def not_truncated(self):
@@ -306,7 +311,12 @@ class Cell(Numbered_MCNP_Object):
         """
         pass
 
-    @make_prop_pointer("_material", (Material, type(None)), deletable=True)
+    @make_prop_pointer(
+        "_material",
+        (Material, type(None)),
+        validator=_link_material_to_cell,
+        deletable=True,
+    )
     def material(self):
         """
         The Material object for the cell.
@@ -465,6 +475,7 @@ class Cell(Numbered_MCNP_Object):
 
         :rtype: Surfaces
         """
+        self._surfaces._set_owner(self)
         return self._surfaces
 
     @property
@@ -493,6 +504,7 @@ class Cell(Numbered_MCNP_Object):
 
         :rytpe: :class:`montepy.cells.Cells`
         """
+        self._complements._set_owner(self)
         return self._complements
 
     @property
@@ -504,10 +516,16 @@ class Cell(Numbered_MCNP_Object):
         :rtype: generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if cell != self:
-                    if self in cell.complements:
-                        yield cell
+            yield from self._problem._find_linked_cells("complements", self)
+
+    def _links_changed(self):
+        """
+        Tells the problem that the surfaces, complements, material, or universe of this cell may have changed.
+
+        .. versionadded:: 0.5.5
+        """
+        if self._problem:
+            self._problem._cell_links_changed(self)
 
     def update_pointers(self, cells, materials, surfaces):
         """
@@ -533,6 +551,7 @@ class Cell(Numbered_MCNP_Object):
             else:
                 self._material = None
         self._geometry.update_pointers(cells, surfaces, self)
+        self._links_changed()
 
     def remove_duplicate_surfaces(self, deleting_dict):
         """Updates old surface numbers to prepare for deleting surfaces.
@@ -541,9 +560,9 @@ class Cell(Numbered_MCNP_Object):
         :type deleting_dict: dict
         """
         new_deleting_dict = {}
-        for dead_surface, new_surface in deleting_dict.items():
-            if dead_surface in self.surfaces:
-                new_deleting_dict[dead_surface] = new_surface
+        for surface in self.surfaces:
+            if surface in deleting_dict:
+                new_deleting_dict[surface] = deleting_dict[surface]
         if len(new_deleting_dict) > 0:
             self.geometry.remove_duplicate_surfaces(new_deleting_dict)
             for dead_surface in new_deleting_dict:
@@ -597,6 +616,8 @@ class Cell(Numbered_MCNP_Object):
 
     def link_to_problem(self, problem):
         super().link_to_problem(problem)
+        if problem is not None:
+            problem._cell_links_changed(self)
         self.complements.link_to_problem(problem)
         self.surfaces.link_to_problem(problem)
         for attr, _ in Cell._INPUTS_TO_PROPERTY.values():
@@ -2,6 +2,7 @@
 import montepy
 from montepy.numbered_object_collection import NumberedObjectCollection
 from montepy.errors import *
+import numpy as np
 import warnings
 
 
@@ -17,17 +18,44 @@ class Cells(NumberedObjectCollection):
     def __init__(self, cells=None, problem=None):
         self.__blank_modifiers = set()
         super().__init__(montepy.Cell, cells, problem)
-        self.__setup_blank_cell_modifiers()
+
+    def __getattr__(self, attr):
+        # blank cell modifiers are only made when they are first needed.
+        # Most collections of cells, e.g., the complements of a cell, never need them.
+        for card_class, (modifier_attr, _) in montepy.Cell._INPUTS_TO_PROPERTY.items():
+            if attr == modifier_attr:
+                return self.__make_blank_modifier(card_class, attr)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{attr}'"
+        )
+
+    def __make_blank_modifier(self, card_class, attr):
+        """
+        Makes a blank data-block cell modifier, and links it to the problem.
+
+        .. versionadded:: 0.5.5
+
+        :param card_class: the type of the cell modifier to make.
+        :type card_class: type
+        :param attr: the attribute to store the cell modifier in.
+        :type attr: str
+        :returns: the new cell modifier.
+        :rtype: CellModifierInput
+        """
+        card = card_class()
+        self.__blank_modifiers.add(attr)
+        setattr(self, attr, card)
+        if self._problem is not None:
+            card.link_to_problem(self._problem)
+        return card
 
     def __setup_blank_cell_modifiers(self, problem=None, check_input=False):
         inputs_to_always_update = {"_universe", "_fill"}
         inputs_to_property = montepy.Cell._INPUTS_TO_PROPERTY
         for card_class, (attr, _) in inputs_to_property.items():
             try:
-                if not hasattr(self, attr):
-                    card = card_class()
-                    self.__blank_modifiers.add(attr)
-                    setattr(self, attr, card)
+                if attr not in vars(self):
+                    card = self.__make_blank_modifier(card_class, attr)
                 else:
                     card = getattr(self, attr)
                 if problem is not None:
@@ -73,6 +101,216 @@ class Cells(NumberedObjectCollection):
         for cell in vacuum_cells:
             cell.importance.all = 0.0
 
+    def _get_cells_for_update(self, numbers, values, name):
+        """
+        Finds the cells for a bulk update, and checks that the values are numbers.
+
+        .. versionadded:: 0.5.5
+
+        :param numbers: the numbers of the cells to update.
+        :type numbers: iterable
+        :param values: the new value for each cell.
+        :type values: iterable
+        :param name: the name of the values for error messages.
+        :type name: str
+        :returns: the cells, and the values as an array.
+        :rtype: tuple
+        :raises TypeError: if the numbers aren't integers, or the values aren't numbers.
+        :raises ValueError: if the numbers and values aren't the same length.
+        :raises KeyError: if a cell number is not in this collection.
+        """
+        numbers = np.asarray(numbers)
+        values = np.asarray(values)
+        if numbers.ndim != 1 or numbers.shape != values.shape:
+            raise ValueError(
+                f"Cell numbers and {name} must be flat and the same length. "
+                f"{numbers.shape} and {values.shape} given."
+            )
+        if len(numbers) == 0:
+            return [], values
+        if numbers.dtype.kind not in "iu":
+            raise TypeError(f"Cell numbers must be integers. {numbers.dtype} given.")
+        if values.dtype.kind not in "iuf":
+            raise TypeError(f"{name} must be numbers. {values.dtype} given.")
+        cells = [self[number] for number in numbers.tolist()]
+        return cells, values
+
+    def set_densities(self, numbers, values, kind="atom"):
+        """
+        Sets the densities of many cells at once.
+
+        All of the inputs are checked before any cell is changed.
+
+        .. code-block:: python
+
+            problem.cells.set_densities([1, 2, 3], [0.1, 0.05, 0.08])
+            problem.cells.set_densities(numbers, densities, kind="mass")
+
+        .. versionadded:: 0.5.5
+
+        :param numbers: the numbers of the cells to update.
+        :type numbers: iterable
+        :param values: the new density for each cell.
+        :type values: iterable
+        :param kind: either ``"atom"`` for atom density in a/b-cm, or ``"mass"`` for mass density in g/cc.
+        :type kind: str
+        :raises TypeError: if the numbers aren't integers, or the densities aren't numbers.
+        :raises ValueError: if a density is negative, the inputs are not the same length, or kind is not valid.
+        :raises KeyError: if a cell number is not in this collection.
+        """
+        if kind not in {"atom", "mass"}:
+            raise ValueError(f"kind must be either 'atom' or 'mass'. {kind} given.")
+        cells, values = self._get_cells_for_update(numbers, values, "densities")
+        if (values < 0).any():
+            raise ValueError("Densities must be positive numbers.")
+        is_atom = kind == "atom"
+        for cell, value in zip(cells, values.astype(float).tolist()):
+            cell._is_atom_dens = is_atom
+            cell._density_node.value = value
+
+    def set_materials(self, numbers, mat_numbers):
+        """
+        Sets the materials of many cells at once.
+
+        All of the inputs are checked before any cell is changed.
+        This collection must be linked to a problem, so the materials can be found.
+
+        .. versionadded:: 0.5.5
+
+        :param numbers: the numbers of the cells to update.
+        :type numbers: iterable
+        :param mat_numbers: the new material number for each cell. Use 0 to make the cell void.
+        :type mat_numbers: iterable
+        :raises TypeError: if the numbers aren't integers.
+        :raises ValueError: if this isn't linked to a problem, a number is negative, or the inputs are not the same length.
+        :raises KeyError: if a cell or material number is not in the problem.
+        """
+        if self._problem is None:
+            raise ValueError("Cells must be linked to a problem to find materials.")
+        cells, mat_numbers = self._get_cells_for_update(
+            numbers, mat_numbers, "material numbers"
+        )
+        if mat_numbers.dtype.kind not in "iu" and len(mat_numbers) > 0:
+            raise TypeError(
+                f"Material numbers must be integers. {mat_numbers.dtype} given."
+            )
+        if (mat_numbers < 0).any():
+            raise ValueError("Material numbers must be ≥ 0.")
+        materials = self._problem.materials
+        new_materials = [
+            materials[number] if number != 0 else None
+            for number in mat_numbers.tolist()
+        ]
+        for cell, material in zip(cells, new_materials):
+            cell._material = material
+            cell._links_changed()
+
+    def set_importances(self, particle, numbers, values):
+        """
+        Sets the importances of many cells at once for a particle.
+
+        All of the inputs are checked before any cell is changed.
+
+        .. code-block:: python
+
+            problem.cells.set_importances(montepy.Particle.NEUTRON, [1, 2], [1.0, 0.5])
+
+        .. versionadded:: 0.5.5
+
+        :param particle: the particle to set the importances for.
+        :type particle: Particle
+        :param numbers: the numbers of the cells to update.
+        :type numbers: iterable
+        :param values: the new importance for each cell.
+        :type values: iterable
+        :raises TypeError: if the particle isn't a Particle, the numbers aren't integers, or the importances aren't numbers.
+        :raises ValueError: if an importance is negative, or the inputs are not the same length.
+        :raises ParticleTypeNotInProblem: if the particle is not in the problem mode.
+        :raises KeyError: if a cell number is not in this collection.
+        """
+        if not isinstance(particle, montepy.particle.Particle):
+            raise TypeError(f"particle must be a Particle. {particle} given.")
+        if self._problem and particle not in self._problem.mode:
+            raise ParticleTypeNotInProblem(
+                f"Particle type: {particle} not included in problem mode."
+            )
+        cells, values = self._get_cells_for_update(numbers, values, "importances")
+        if (values < 0).any():
+            raise ValueError("Importances must be ≥ 0.")
+        for cell, value in zip(cells, values.astype(float).tolist()):
+            cell.importance._set_value(particle, value)
+
+    def to_array(self):
+        """
+        Exports the basic information of every cell as a NumPy structured array.
+
+        Each row is a cell, in the same order as this collection, with the fields:
+
+        * ``number``: the cell number.
+        * ``material``: the material number, or 0 for void cells.
+        * ``atom_density``: the atom density, or ``nan`` if it is not in atom density.
+        * ``mass_density``: the mass density, or ``nan`` if it is not in mass density.
+        * ``volume``: the volume that was manually set, or ``nan``.
+        * ``universe``: the number of the universe the cell is in.
+        * ``importance_<particle>``: the importance for every particle in the problem,
+          e.g., ``importance_neutron``.
+
+        The material and universe numbers can be joined with :func:`montepy.materials.Materials.to_array`.
+        This can be passed straight to :class:`pandas.DataFrame`.
+
+        .. versionadded:: 0.5.5
+
+        :returns: the structured array of the cell information.
+        :rtype: numpy.ndarray
+        """
+
+        def get_density(atom):
+            def getter(cell):
+                if cell._density is None or cell.is_atom_dens != atom:
+                    return np.nan
+                return cell._density
+
+            return getter
+
+        def get_importance(particle):
+            return lambda cell: cell.importance[particle]
+
+        if self._problem:
+            particles = set(self._problem.mode)
+        else:
+            particles = set()
+            for cell in self:
+                particles.update(cell.importance)
+        fields = [
+            ("number", np.int64, lambda cell: cell.number),
+            (
+                "material",
+                np.int64,
+                lambda cell: cell.material.number if cell.material else 0,
+            ),
+            ("atom_density", np.float64, get_density(True)),
+            ("mass_density", np.float64, get_density(False)),
+            (
+                "volume",
+                np.float64,
+                lambda cell: cell.volume if cell.volume is not None else np.nan,
+            ),
+            (
+                "universe",
+                np.int64,
+                lambda cell: cell.universe.number if cell.universe else 0,
+            ),
+        ]
+        for particle in sorted(particles):
+            fields.append(
+                (
+                    f"importance_{particle.name.lower()}",
+                    np.float64,
+                    get_importance(particle),
+                )
+            )
+        return self._to_array(fields)
+
     @property
     def allow_mcnp_volume_calc(self):
         """
@@ -100,7 +338,8 @@ class Cells(NumberedObjectCollection):
         super().link_to_problem(problem)
         inputs_to_property = montepy.Cell._INPUTS_TO_PROPERTY
         for attr, _ in inputs_to_property.values():
-            getattr(self, attr).link_to_problem(problem)
+            if attr in vars(self):
+                getattr(self, attr).link_to_problem(problem)
 
     def update_pointers(
         self, cells, materials, surfaces, data_inputs, problem, check_input=False
@@ -132,9 +371,11 @@ class Cells(NumberedObjectCollection):
         inputs_to_property = montepy.Cell._INPUTS_TO_PROPERTY
         inputs_to_always_update = {"_universe", "_fill"}
         inputs_loaded = set()
+        merged = set()
         # start fresh for loading cell modifiers
         for attr in self.__blank_modifiers:
-            delattr(self, attr)
+            if attr in vars(self):
+                delattr(self, attr)
         self.__blank_modifiers = set()
         # make a copy of the list
         for input in list(data_inputs):
@@ -149,17 +390,19 @@ class Cells(NumberedObjectCollection):
                         )
                     except MalformedInputError as e:
                         handle_error(e)
-                if not hasattr(self, attr):
+                if attr not in vars(self):
                     setattr(self, attr, input)
                     problem.print_in_data_block[input._class_prefix()] = True
                 else:
                     try:
                         getattr(self, attr).merge(input)
-                        data_inputs.remove(input)
+                        merged.add(id(input))
                     except MalformedInputError as e:
                         handle_error(e)
                 if cant_repeat:
                     inputs_loaded.add(type(input))
+        if merged:
+            data_inputs[:] = [input for input in data_inputs if id(input) not in merged]
         for cell in self:
             try:
                 cell.update_pointers(cells, materials, surfaces)
@@ -59,10 +59,17 @@ class DataInputAbstract(MCNP_Object):
             if input:
                 self.__split_name(input)
         else:
-            input = copy.copy(input)
-            input.__class__ = _ClassifierInput
-            super().__init__(input, self._classifier_parser)
-            self.__split_name(input)
+            # lex the whole input once, so the full parse afterwards can replay the tokens.
+            input._get_tokens()
+            classifier_input = copy.copy(input)
+            classifier_input.__class__ = _ClassifierInput
+            try:
+                super().__init__(classifier_input, self._classifier_parser)
+                self.__split_name(classifier_input)
+            except Exception:
+                # there won't be a full parse to drop the tokens.
+                input._clear_tokens()
+                raise
 
     @staticmethod
     @abstractmethod
@@ -337,6 +344,8 @@ class DataInput(DataInputAbstract):
     :type prefix: str
     """
 
+    _special_parsers = {}
+
     def __init__(self, input=None, fast_parse=False, prefix=None):
         if prefix:
             self._load_correct_parser(prefix)
@@ -369,5 +378,9 @@ class DataInput(DataInputAbstract):
             "fs": montepy.input_parser.tally_seg_parser.TallySegmentParser,
             "sdef": PARAM_PARSER,
         }
-        if prefix.lower() in PARSER_PREFIX_MAP:
-            self._parser = PARSER_PREFIX_MAP[prefix.lower()]()
+        parser_class = PARSER_PREFIX_MAP.get(prefix.lower())
+        if parser_class is not None:
+            # parsers are stateless between inputs, so only make one of each.
+            if parser_class not in self._special_parsers:
+                self._special_parsers[parser_class] = parser_class()
+            self._parser = self._special_parsers[parser_class]
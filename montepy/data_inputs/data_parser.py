@@ -11,6 +11,7 @@ from montepy.data_inputs import (
     volume,
 )
 from montepy.data_inputs import transform
+from montepy.utilities import is_comment
 import re
 
 PREFIX_MATCHES = {
@@ -25,22 +26,53 @@ PREFIX_MATCHES = {
     universe_input.UniverseInput,
 }
 
+_PREFIX_SNIFFER = re.compile(r"\s*\*?([a-z]+[a-z\./]*)", re.I)
+"""
+Matches the text prefix of a data input, the same way the lexer would for a ``TEXT`` token.
+"""
+
+
+def _sniff_prefix(input):
+    """
+    Finds the prefix of a data input without lexing or parsing it.
+
+    .. versionadded:: 0.5.5
+
+    :param input: the Input object for this Data input
+    :type input: Input
+    :returns: the lower case prefix, or None if it can't be found this way.
+    :rtype: str
+    """
+    for line in input.input_lines:
+        if not is_comment(line):
+            if match := _PREFIX_SNIFFER.match(line):
+                return match.group(1).lower()
+            return None
+    return None
+
 
 def parse_data(input):
     """
     Parses the data input as the appropriate object if it is supported.
 
+    The prefix is found from the raw text where possible, so the input is only parsed once.
+
     .. versionchanged:: 0.2.0
         Removed the ``comment`` parameter, as it's in the syntax tree directly now.
 
+    .. versionchanged:: 0.5.5
+        The input is no longer parsed twice to find its prefix.
+
     :param input: the Input object for this Data input
     :type input: Input
     :return: the parsed DataInput object
     :rtype: DataInput
     """
 
-    base_input = data_input.DataInput(input, fast_parse=True)
-    prefix = base_input.prefix
+    prefix = _sniff_prefix(input)
+    if prefix is None:
+        base_input = data_input.DataInput(input, fast_parse=True)
+        prefix = base_input.prefix
     for data_class in PREFIX_MATCHES:
         if prefix == data_class._class_prefix():
             return data_class(input)
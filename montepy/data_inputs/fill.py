@@ -112,13 +112,14 @@ class Fill(CellModifierInput):
                     )
 
         data = value["data"]
-        if not isinstance(data, syntax_node.ListNode):
+        if isinstance(data, syntax_node.ListNode):
+            # compare plain values, as lattice fills can have a huge number of nodes
+            data = [node.value for node in data]
+        else:
             data = data.nodes
         if "(" in data:
             get_universe(value)
-            trans_data = value["data"][
-                list(value["data"]).index("(") + 1 : list(value["data"]).index(")") - 1
-            ]
+            trans_data = value["data"][data.index("(") + 1 : data.index(")") - 1]
             if len(trans_data) == 1:
                 try:
                     transform = trans_data[0]
@@ -151,7 +152,7 @@ class Fill(CellModifierInput):
         :type value: str
         """
         self._multi_universe = True
-        words = value["data"]
+        words = list(value["data"])
         self._min_index = np.zeros((3,), dtype=np.dtype(int))
         self._max_index = np.zeros((3,), dtype=np.dtype(int))
         limits_iter = (
@@ -178,20 +179,28 @@ class Fill(CellModifierInput):
                     "The minimum value must be smaller than the max value."
                     f"Min: {min_val}, Max: {max_val}, Input: {value.format()}"
                 )
-        self._old_numbers = np.zeros(self._sizes, dtype=np.dtype(int))
-        words = iter(words[9:])
-        for i in self._axis_range(0):
-            for j in self._axis_range(1):
-                for k in self._axis_range(2):
-                    val = next(words)
-                    try:
-                        val._convert_to_int()
-                        assert val.value >= 0
-                        self._old_numbers[i][j][k] = val.value
-                    except (ValueError, AssertionError) as e:
-                        raise ValueError(
-                            f"Values provided must be valid universes. {val.value} given."
-                        )
+        size = int(np.prod(self._sizes))
+        values = words[9 : 9 + size]
+        if len(values) < size:
+            raise ValueError(
+                f"The lattice fill must have {size} universes. {len(values)} were given."
+            )
+        for val in values:
+            try:
+                val._convert_to_int()
+            except (AttributeError, ValueError) as e:
+                raise ValueError(
+                    f"Values provided must be valid universes. {val.value} given."
+                )
+        try:
+            numbers = np.array([val.value for val in values], dtype=np.dtype(int))
+        except TypeError as e:
+            raise ValueError("Values provided must be valid universes. None given.")
+        if (numbers < 0).any():
+            raise ValueError(
+                f"Values provided must be valid universes. {numbers[numbers < 0][0]} given."
+            )
+        self._old_numbers = numbers.reshape(self._sizes)
 
     @staticmethod
     def _class_prefix():
@@ -404,15 +413,13 @@ class Fill(CellModifierInput):
                 or self.old_universe_numbers is not None
             ):
                 if isinstance(self.old_universe_numbers, np.ndarray):
-                    self._universes = np.empty_like(
-                        self.old_universe_numbers, dtype="O"
-                    )
-                    for i in self._axis_range(0):
-                        for j in self._axis_range(1):
-                            for k in self._axis_range(2):
-                                self._universes[i][j][k] = get_universe(
-                                    self.old_universe_numbers[i][j][k].item()
-                                )
+                    numbers = self.old_universe_numbers
+                    # look up each universe once, and then spread them out over the matrix
+                    unique_numbers, inverse = np.unique(numbers, return_inverse=True)
+                    universes = np.empty(len(unique_numbers), dtype="O")
+                    for i, number in enumerate(unique_numbers.tolist()):
+                        universes[i] = get_universe(number)
+                    self._universes = universes[inverse].reshape(numbers.shape)
                 else:
                     self._universe = get_universe(self.old_universe_number)
         else:
@@ -427,16 +434,6 @@ class Fill(CellModifierInput):
         self._old_number = None
         self._universe = None
 
-    def _axis_range(self, axis):
-        """
-        Returns an iterator for iterating over the given axis.
-
-        :param axis: the number of the axis to iterate over
-        :type axis: int
-        :returns: range
-        """
-        return range(self._axis_size(axis))
-
     def _axis_size(self, axis):
         """
         Get the length of the given axis.
@@ -511,6 +508,25 @@ class Fill(CellModifierInput):
                 new_vals = new_vals[: start + 1] + payload + new_vals[end:]
         self._tree["data"].update_with_new_values(new_vals)
 
+    def _universe_numbers(self):
+        """
+        Gets the numbers of the universes in the lattice fill matrix.
+
+        Each distinct universe is only asked for its number once.
+
+        .. versionadded:: 0.5.5
+
+        :returns: an integer array of the same shape as :func:`universes`.
+        :rtype: numpy.ndarray
+        """
+        universes = self.universes.ravel()
+        ids = np.fromiter(map(id, universes), dtype=np.intp, count=len(universes))
+        _, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        numbers = np.array(
+            [universes[i].number for i in first.tolist()], dtype=np.dtype(int)
+        )
+        return numbers[inverse].reshape(self.universes.shape)
+
     def _update_cell_universes(self, new_vals):
         def _value_node_generator():
             while True:
@@ -520,11 +536,7 @@ class Fill(CellModifierInput):
                 yield value
 
         if self.multiple_universes:
-            payload = []
-            for i in self._axis_range(0):
-                for j in self._axis_range(1):
-                    for k in self._axis_range(2):
-                        payload.append(self.universes[i][j][k].number)
+            payload = self._universe_numbers().ravel().tolist()
         else:
             payload = [
                 (
@@ -533,13 +545,13 @@ class Fill(CellModifierInput):
                     else self.old_universe_number
                 )
             ]
+        values = [val.value for val in new_vals]
         try:
-            start_transform = new_vals.index("(")
+            start_transform = values.index("(")
         except ValueError:
             start_transform = None
 
-        reverse_list = new_vals.copy()
-        reverse_list.reverse()
+        reverse_list = values[::-1]
         try:
             start_matrix = len(new_vals) - reverse_list.index(":") + 1
         except ValueError:
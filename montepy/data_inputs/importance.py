@@ -24,6 +24,8 @@ import numbers
 # * _real_tree : holds unique trees for every particle type. This is used in data block formatting.
 # * _particle_importances : a dictionary of ParameterNodes that maps a particle to it's ParameterNode
 # * _part_combos : a list of ParticleNode that show which particles were combined on the original input
+# * _shared_classifiers : the particles whose classifier is shared by every cell, after loading from the data block.
+#                         These must be copied before being changed.
 
 
 class Importance(CellModifierInput):
@@ -44,6 +46,7 @@ class Importance(CellModifierInput):
         self._particle_importances = {}
         self._real_tree = {}
         self._part_combos = []
+        self._shared_classifiers = set()
         super().__init__(input, in_cell_block, key, value)
         if self.in_cell_block:
             if key:
@@ -165,6 +168,19 @@ class Importance(CellModifierInput):
             raise TypeError("importance must be a number")
         if value < 0:
             raise ValueError("importance must be ≥ 0")
+        self._set_value(particle, value)
+
+    def _set_value(self, particle, value):
+        """
+        Sets the importance for a particle without checking the inputs.
+
+        .. versionadded:: 0.5.5
+
+        :param particle: the particle to set the importance for.
+        :type particle: Particle
+        :param value: the new importance.
+        :type value: float
+        """
         if particle not in self._particle_importances:
             self._generate_default_cell_tree(particle)
         self._particle_importances[particle]["data"][0].value = value
@@ -189,19 +205,26 @@ class Importance(CellModifierInput):
     def push_to_cells(self):
         if self._problem and not self.in_cell_block:
             self._check_redundant_definitions()
-            for particle in self._particle_importances:
-                if not self._particle_importances[particle]:
+            for particle, data_tree in self._particle_importances.items():
+                if not data_tree:
                     continue
-                for i, cell in enumerate(self._problem.cells):
-                    value = self._particle_importances[particle]["data"][i]
+                # all cells share one classifier until it is changed in _format_tree
+                classifier = copy.deepcopy(data_tree["classifier"])
+                classifier.padding = None
+                values = iter(data_tree["data"])
+                for cell in self._problem.cells:
+                    try:
+                        value = next(values)
+                    except StopIteration:
+                        raise IndexError(
+                            f"Not enough importances for particle: {particle}"
+                        )
                     # force generating the default tree
                     cell.importance[particle] = value.value
                     # replace default ValueNode with actual valueNode
                     tree = cell.importance._particle_importances[particle]
-                    tree.nodes["classifier"] = copy.deepcopy(
-                        self._particle_importances[particle]["classifier"]
-                    )
-                    tree["classifier"].padding = None
+                    tree.nodes["classifier"] = classifier
+                    cell.importance._shared_classifiers.add(particle)
                     data = tree["data"]
                     data.nodes.pop()
                     data.nodes.append(value)
@@ -228,6 +251,11 @@ class Importance(CellModifierInput):
                             particles_printed.add(other_part)
                         else:
                             to_remove.add(other_part)
+                if to_remove and particle in self._shared_classifiers:
+                    tree = self._particle_importances[particle]
+                    tree.nodes["classifier"] = copy.deepcopy(tree["classifier"])
+                    self._shared_classifiers.discard(particle)
+                    other_particles = tree["classifier"].particles
                 for removee in to_remove:
                     other_particles.remove(removee)
                 ret += self._particle_importances[particle].format()
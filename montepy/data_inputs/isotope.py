@@ -29,6 +29,21 @@ class Isotope:
     """
     Points on bounding curve for determining if "valid" isotope
     """
+    _PARSED_ZAIDS = {}
+    """
+    The parsed properties of every ZAID seen so far, so each ZAID is only parsed once.
+
+    The same nuclides are repeated across many materials, and these properties never change.
+    The :class:`~montepy.data_inputs.element.Element` is shared by all isotopes of the same ZAID.
+    """
+    _PARSED_ATTRIBUTES = (
+        "_ZAID",
+        "_Z",
+        "_element",
+        "_A",
+        "_is_metastable",
+        "_meta_state",
+    )
 
     def __init__(self, ZAID="", node=None, suppress_warning=False):
         if not suppress_warning:
@@ -49,15 +64,30 @@ class Isotope:
             int(parts[0])
         except (AssertionError, ValueError) as e:
             raise ValueError(f"ZAID: {ZAID} could not be parsed as a valid isotope")
-        self._ZAID = parts[0]
-        self.__parse_zaid()
+        self.__load_zaid(parts[0])
         if len(parts) == 2:
             self._library = parts[1]
         else:
             self._library = ""
         if node is None:
             self._tree = ValueNode(self.mcnp_str(), str, PaddingNode(" "))
-        self._handle_stupid_legacy_stupidity()
+
+    def __load_zaid(self, ZAID):
+        """
+        Loads the properties of the ZAID, and only parses it if it hasn't been seen before.
+
+        :param ZAID: the ZZZAAA identifier without the library.
+        :type ZAID: str
+        """
+        try:
+            parsed = self._PARSED_ZAIDS[ZAID]
+        except KeyError:
+            self._ZAID = ZAID
+            self.__parse_zaid()
+            self._handle_stupid_legacy_stupidity()
+            parsed = {attr: getattr(self, attr) for attr in self._PARSED_ATTRIBUTES}
+            self._PARSED_ZAIDS[ZAID] = parsed
+        self.__dict__.update(parsed)
 
     def _handle_stupid_legacy_stupidity(self):
         # TODO work on this for mat_redesign
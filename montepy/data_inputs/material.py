@@ -10,6 +10,7 @@ from montepy.numbered_mcnp_object import Numbered_MCNP_Object
 from montepy.errors import *
 from montepy.utilities import *
 import itertools
+import numpy as np
 import re
 
 import warnings
@@ -34,9 +35,12 @@ class Material(data_input.DataInputAbstract, Numbered_MCNP_Object):
         self._material_components = {}
         self._thermal_scattering = None
         self._is_atom_fraction = True
+        self._fractions_view = None
         self._number = self._generate_default_node(int, -1)
         super().__init__(input)
-        if input:
+        if not input:
+            self._generate_default_tree()
+        else:
             num = self._input_number
             self._old_number = copy.deepcopy(num)
             self._number = num
@@ -114,6 +118,318 @@ See <https://www.montepy.org/migrations/migrate0_1.html> for more information ""
         )
         return self._material_components
 
+    @property
+    def zaids(self):
+        """
+        The ZAIDs of the components of this material as a NumPy array.
+
+        The order matches :func:`fractions` and :func:`libraries`.
+
+        .. versionadded:: 0.5.5
+
+        :rtype: numpy.ndarray
+        """
+        return np.array(
+            [int(isotope.ZAID) for isotope in self._material_components], dtype=int
+        )
+
+    @property
+    def libraries(self):
+        """
+        The nuclear data libraries of the components of this material as a NumPy array.
+
+        Components without a library have an empty string.
+        The order matches :func:`zaids` and :func:`fractions`.
+
+        .. versionadded:: 0.5.5
+
+        :rtype: numpy.ndarray
+        """
+        return np.array(
+            [isotope.library for isotope in self._material_components], dtype=str
+        )
+
+    @property
+    def fractions(self):
+        """
+        The fractions of the components of this material as a NumPy array.
+
+        The fractions are atom fractions if :func:`is_atom_fraction` is true, otherwise they are weight fractions.
+        They are always positive, and are not normalized.
+        The order matches :func:`zaids` and :func:`libraries`.
+
+        The array is a view of this material: values written into it,
+        e.g., ``material.fractions[:] *= 2``,
+        are applied to the components when the material is formatted, or when the fractions are next accessed.
+        The same array is returned every time, and is updated in place when the fractions are changed,
+        until components are added to, or removed from this material.
+        After that a new array is returned, and values written into the old array are only applied
+        to the components that are still in this material.
+
+        .. versionadded:: 0.5.5
+
+        :rtype: numpy.ndarray
+        """
+        self._sync_fractions()
+        if self._fractions_view is None:
+            components = list(self._material_components.values())
+            view = np.array(
+                [component.fraction for component in components], dtype=float
+            )
+            self._fractions_view = (components, view, view.copy())
+        return self._fractions_view[1]
+
+    @fractions.setter
+    def fractions(self, fractions):
+        self._set_fractions(fractions)
+
+    def _sync_fractions(self):
+        """
+        Applies any values written into the array from :func:`fractions` to the components,
+        and then updates the array from the components.
+
+        The array is dropped if the components of this material have changed.
+
+        :raises ValueError: if a value written is not positive. The array is reverted to the fractions of the components.
+        """
+        if self._fractions_view is None:
+            return
+        components, view, snapshot = self._fractions_view
+        changed = np.flatnonzero(view != snapshot)
+        if len(changed) > 0:
+            if np.any(~(view[changed] > 0)):
+                given = view.copy()
+                # revert the bad values so this material can still be used.
+                self._refresh_fractions()
+                raise ValueError(
+                    f"Material: {self.number} component fractions must be > 0. {given} given."
+                )
+            current = self._material_components
+            for idx in changed:
+                component = components[idx]
+                # skip components that were removed since the view was made.
+                if current.get(component.isotope) is component:
+                    component._fraction.value = float(view[idx])
+        self._refresh_fractions()
+
+    def _refresh_fractions(self):
+        """
+        Updates the array from :func:`fractions` in place with the fractions of the components.
+
+        The array is dropped if the components of this material have changed.
+        """
+        if self._fractions_view is None:
+            return
+        components, view, snapshot = self._fractions_view
+        current = self._material_components.values()
+        if len(current) != len(components) or any(
+            component is not old for component, old in zip(current, components)
+        ):
+            self._fractions_view = None
+            return
+        view[:] = [component.fraction for component in components]
+        snapshot[:] = view
+
+    def _set_fractions(self, fractions):
+        """
+        Sets the fractions of every component of this material at once.
+
+        Any values written into the array from :func:`fractions` that were not applied yet are discarded.
+
+        :param fractions: the new fractions in the same order as the components.
+        :type fractions: numpy.ndarray
+        :raises ValueError: if the number of fractions is wrong, or any fraction is not positive.
+        """
+        fractions = np.array(fractions, dtype=float)
+        if fractions.shape != (len(self._material_components),):
+            raise ValueError(
+                f"Material: {self.number} has {len(self._material_components)} components. "
+                f"{fractions.shape} fractions given."
+            )
+        if np.any(~(fractions > 0)):
+            raise ValueError(
+                f"Material: {self.number} component fractions must be > 0. {fractions} given."
+            )
+        for component, fraction in zip(
+            self._material_components.values(), fractions.tolist()
+        ):
+            component._fraction.value = fraction
+        self._refresh_fractions()
+
+    def _get_masses(self, masses):
+        """
+        Checks the atomic mass of every component of this material.
+
+        MontePy doesn't have a table of atomic masses,
+        and the mass number is only a rough estimate of it, so the masses must always be given.
+
+        :param masses: the atomic masses of the components.
+        :type masses: numpy.ndarray
+        :returns: the masses in the same order as the components.
+        :rtype: numpy.ndarray
+        :raises ValueError: if the masses are not given, or a mass is not positive.
+        """
+        if masses is None:
+            raise ValueError(
+                f"Material: {self.number} needs the atomic masses of its components to convert between "
+                "atom and weight fractions."
+            )
+        masses = np.asarray(masses, dtype=float)
+        if masses.shape != (len(self._material_components),):
+            raise ValueError(
+                f"Material: {self.number} has {len(self._material_components)} components. "
+                f"{masses.shape} masses given."
+            )
+        if np.any(~(masses > 0)):
+            raise ValueError(
+                f"Material: {self.number} component masses must be > 0. {masses} given."
+            )
+        return masses
+
+    def normalize(self):
+        """
+        Scales the fractions of this material so they sum to 1.
+
+        .. versionadded:: 0.5.5
+        """
+        fractions = self.fractions
+        self._set_fractions(fractions / fractions.sum())
+
+    def get_atom_fractions(self, masses=None):
+        """
+        Gets the normalized atom fractions of this material.
+
+        Weight fractions are converted with: :math:`a_i = \\frac{w_i / m_i}{\\sum_j w_j / m_j}`.
+
+        .. versionadded:: 0.5.5
+
+        :param masses: the atomic masses of the components in amu, in the same order as :func:`zaids`.
+            These are required to convert between atom and weight fractions.
+        :type masses: numpy.ndarray
+        :returns: the atom fractions in the same order as the components.
+        :rtype: numpy.ndarray
+        :raises ValueError: if the masses are needed and are not given, or are not valid.
+        """
+        fractions = self.fractions
+        if not self.is_atom_fraction:
+            fractions = fractions / self._get_masses(masses)
+        return fractions / fractions.sum()
+
+    def get_weight_fractions(self, masses=None):
+        """
+        Gets the normalized weight fractions of this material.
+
+        Atom fractions are converted with: :math:`w_i = \\frac{a_i m_i}{\\sum_j a_j m_j}`.
+
+        .. versionadded:: 0.5.5
+
+        :param masses: the atomic masses of the components in amu, in the same order as :func:`zaids`.
+            These are required to convert between atom and weight fractions.
+        :type masses: numpy.ndarray
+        :returns: the weight fractions in the same order as the components.
+        :rtype: numpy.ndarray
+        :raises ValueError: if the masses are needed and are not given, or are not valid.
+        """
+        fractions = self.fractions
+        if self.is_atom_fraction:
+            fractions = fractions * self._get_masses(masses)
+        return fractions / fractions.sum()
+
+    def convert_to_atom_fraction(self, masses=None):
+        """
+        Converts this material to use normalized atom fractions.
+
+        .. versionadded:: 0.5.5
+
+        :param masses: the atomic masses of the components in amu, in the same order as :func:`zaids`.
+            These are required to convert between atom and weight fractions.
+        :type masses: numpy.ndarray
+        :raises ValueError: if the masses are needed and are not given, or are not valid.
+        """
+        fractions = self.get_atom_fractions(masses)
+        self._set_fractions(fractions)
+        self._is_atom_fraction = True
+
+    def convert_to_weight_fraction(self, masses=None):
+        """
+        Converts this material to use normalized weight fractions.
+
+        .. versionadded:: 0.5.5
+
+        :param masses: the atomic masses of the components in amu, in the same order as :func:`zaids`.
+            These are required to convert between atom and weight fractions.
+        :type masses: numpy.ndarray
+        :raises ValueError: if the masses are needed and are not given, or are not valid.
+        """
+        fractions = self.get_weight_fractions(masses)
+        self._set_fractions(fractions)
+        self._is_atom_fraction = False
+
+    @staticmethod
+    def mix(materials, fractions, number=None):
+        """
+        Makes a new material by mixing other materials together.
+
+        The normalized fractions of each material are scaled by its share of the mix,
+        and the fractions of the same isotope and library are added together.
+        All of the materials must use the same kind of fraction,
+        which the new material will use too.
+        Thermal scattering laws are not mixed.
+
+        .. code-block:: python
+
+            # 90% water, and 10% heavy water by atom
+            mix = Material.mix([water, heavy_water], [0.9, 0.1], number=5)
+            problem.materials.append(mix)
+
+        .. versionadded:: 0.5.5
+
+        :param materials: the materials to mix.
+        :type materials: list
+        :param fractions: the share of each material in the mix. These will be normalized.
+        :type fractions: list
+        :param number: the number for the new material. By default one more than the largest number of the materials.
+        :type number: int
+        :returns: the new material.
+        :rtype: Material
+        :raises ValueError: if the materials and fractions don't match, or the materials use different kinds of fractions.
+        """
+        materials = list(materials)
+        fractions = np.asarray(fractions, dtype=float)
+        if len(materials) == 0 or fractions.shape != (len(materials),):
+            raise ValueError(
+                f"One fraction must be given for every material. {fractions} given for {len(materials)} materials."
+            )
+        if np.any(~(fractions > 0)):
+            raise ValueError(f"Mix fractions must be > 0. {fractions} given.")
+        is_atom_fraction = materials[0].is_atom_fraction
+        if any(mat.is_atom_fraction != is_atom_fraction for mat in materials):
+            raise ValueError(
+                "Materials must all use atom fractions or all use weight fractions to be mixed."
+            )
+        if number is None:
+            number = max(mat.number for mat in materials) + 1
+        totals = {}
+        for mat, share in zip(materials, fractions / fractions.sum()):
+            mat_fractions = mat.fractions
+            if len(mat_fractions) == 0:
+                raise ValueError(f"Material: {mat.number} has no components to mix.")
+            values = share * mat_fractions / mat_fractions.sum()
+            for isotope, value in zip(mat._material_components, values):
+                name = isotope.mcnp_str()
+                totals[name] = totals.get(name, 0.0) + float(value)
+        new_mat = Material()
+        new_mat.number = number
+        new_mat._is_atom_fraction = is_atom_fraction
+        for name, total in totals.items():
+            isotope = Isotope(name, suppress_warning=True)
+            fraction = syntax_node.ValueNode(str(total), float, None)
+            fraction.is_negatable_float = True
+            new_mat._material_components[isotope] = MaterialComponent(
+                isotope, fraction, suppress_warning=True
+            )
+        return new_mat
+
     @make_prop_pointer("_thermal_scattering", thermal_scattering.ThermalScatteringLaw)
     def thermal_scattering(self):
         """
@@ -131,9 +447,7 @@ See <https://www.montepy.org/migrations/migrate0_1.html> for more information ""
         :rtype: generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if cell.material == self:
-                    yield cell
+            yield from self._problem._find_linked_cells("material", self)
 
     def format_for_mcnp_input(self, mcnp_version):
         """
@@ -150,7 +464,23 @@ See <https://www.montepy.org/migrations/migrate0_1.html> for more information ""
             lines += self.thermal_scattering.format_for_mcnp_input(mcnp_version)
         return lines
 
+    def _generate_default_tree(self):
+        classifier = syntax_node.ClassifierNode()
+        classifier.prefix = self._generate_default_node(str, "M", None)
+        classifier.number = self._generate_default_node(int, None, None)
+        self._tree = syntax_node.SyntaxNode(
+            "data",
+            {
+                "start_pad": syntax_node.PaddingNode(),
+                "classifier": classifier,
+                "keyword": syntax_node.ValueNode(None, str, None),
+                "data": syntax_node.IsotopesNode("isotope list"),
+            },
+        )
+
     def _update_values(self):
+        self._sync_fractions()
+        self._tree["classifier"].number.value = self.number
         new_list = syntax_node.IsotopesNode("new isotope list")
         for idx, (isotope, component) in enumerate(self._material_components.items()):
             isotope._tree.value = isotope.mcnp_str()
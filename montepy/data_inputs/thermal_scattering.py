@@ -127,20 +127,17 @@ class ThermalScatteringLaw(DataInputAbstract):
         """
         # use caching first
         if self._problem:
-            try:
-                mat = self._problem.materials[self.old_number]
-            except KeyError:
-                raise MalformedInputError(
-                    self._input, "MT input is detached from a parent material"
-                )
+            mat = self._problem.materials.get(self.old_number)
+            found = mat is not None
         # brute force it
-        found = False
-        for data_input in data_inputs:
-            if isinstance(data_input, montepy.data_inputs.material.Material):
-                if data_input.number == self.old_number:
-                    mat = data_input
-                    found = True
-                    break
+        else:
+            found = False
+            for data_input in data_inputs:
+                if isinstance(data_input, montepy.data_inputs.material.Material):
+                    if data_input.number == self.old_number:
+                        mat = data_input
+                        found = True
+                        break
         # actually update things
         if not found:
             raise MalformedInputError(
@@ -174,12 +174,11 @@ class UniverseInput(CellModifierInput):
                 uni_num = cell.old_universe_number
                 if uni_num is None:
                     uni_num = 0
-                if uni_num not in universes.numbers:
+                universe = universes.get(uni_num)
+                if universe is None:
                     universe = Universe(uni_num)
                     universe.link_to_problem(self._problem)
                     universes.append(universe)
-                else:
-                    universe = universes[uni_num]
                 cell._universe._universe = universe
 
     def _clear_data(self):
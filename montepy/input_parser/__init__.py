@@ -1,9 +1,10 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 __name__ = "montepy.input_parser"
+import importlib
+
 from . import block_type
 from . import cell_parser
 from . import data_parser
-from . import input_reader
 from . import material_parser
 from . import mcnp_input
 from . import parser_base
@@ -13,3 +14,10 @@ from . import surface_parser
 from . import tally_parser
 from . import tally_seg_parser
 from . import tokens
+
+
+def __getattr__(name):
+    # input_reader needs the whole problem, so it is only imported when used.
+    if name == "input_reader":
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
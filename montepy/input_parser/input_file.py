@@ -4,6 +4,18 @@ from montepy.constants import ASCII_CEILING
 from montepy.utilities import *
 import os
 
+_REPLACE_NON_ASCII = bytes(
+    code if code < ASCII_CEILING else ord(" ") for code in range(256)
+)
+"""
+A translation table for ``bytes.translate`` that replaces every non-ASCII byte with a space.
+"""
+
+_OTHER_LINE_BREAKS = ("\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e")
+"""
+The ASCII characters other than new line that ``str.splitlines`` splits lines at.
+"""
+
 
 class MCNP_InputFile:
     """
@@ -15,6 +27,9 @@ class MCNP_InputFile:
     .. versionchanged:: 0.3.0
         Added the overwrite attribute.
 
+    .. versionchanged:: 0.5.5
+        When replacing non-ASCII characters the file is read, and cleaned, in large chunks.
+
     :param path: the path to the input file
     :type path: str
     :param parent_file: the parent file for this file if any. This occurs when a "read" input is used.
@@ -23,6 +38,11 @@ class MCNP_InputFile:
     :type overwrite: bool
     """
 
+    _CHUNK_SIZE = 1 << 20
+    """
+    The number of bytes to read at once when replacing non-ASCII characters.
+    """
+
     def __init__(self, path, parent_file=None, overwrite=False):
         self._path = path
         self._parent_file = parent_file
@@ -31,6 +51,7 @@ class MCNP_InputFile:
         self._overwrite = overwrite
         self._mode = None
         self._fh = None
+        self._clean_lines = None
         self._is_stream = False
 
     @classmethod
@@ -131,6 +152,7 @@ class MCNP_InputFile:
                     f"{self.path} is a directory, and cannot be overwritten."
                 )
         self._fh = open(self.path, mode, encoding=encoding)
+        self._clean_lines = None
         return self
 
     def __enter__(self):
@@ -140,19 +162,57 @@ class MCNP_InputFile:
     def __exit__(self, exc_type, exc_val, exc_tb):
         status = self._fh.__exit__(exc_type, exc_val, exc_tb)
         self._fh = None
+        self._clean_lines = None
         return status
 
     def __iter__(self):
-        for lineno, line in enumerate(self._fh):
+        if self._mode == "rb" and self._replace_with_space:
+            # keep the chunks already read, so iteration can be stopped, and resumed.
+            if self._clean_lines is None:
+                self._clean_lines = self._read_clean_lines()
+            lines = self._clean_lines
+        else:
+            lines = self._fh
+        for lineno, line in enumerate(lines):
             self._lineno = lineno + 1
-            if self._mode == "rb" and self._replace_with_space:
-                line = self._clean_line(line)
             yield line
 
+    def _read_clean_lines(self):
+        """
+        Reads the binary file in chunks, and yields every line with the non-ASCII characters replaced.
+
+        Each chunk is cleaned, and split into lines, all at once.
+        The lines are the same as iterating over the file, and cleaning each line.
+
+        :returns: a generator of the cleaned lines.
+        :rtype: generator
+        """
+        tail = b""
+        while True:
+            chunk = self._fh.read(self._CHUNK_SIZE)
+            if not chunk:
+                break
+            chunk = tail + chunk
+            end = chunk.rfind(b"\n") + 1
+            tail = chunk[end:]
+            if not end:
+                continue
+            text = chunk[:end].translate(_REPLACE_NON_ASCII).decode("ascii")
+            text = text.replace("\r\n", "\n")
+            if not any(char in text for char in _OTHER_LINE_BREAKS):
+                yield from text.splitlines(keepends=True)
+                continue
+            lines = text.split("\n")
+            # the chunk ends with a new line, so the last split is empty.
+            lines.pop()
+            for line in lines:
+                yield line.replace("\r", "\n") + "\n"
+        if tail:
+            yield self._clean_line(tail)
+
     @staticmethod
     def _clean_line(line):
-        new_line = bytes([code if code < ASCII_CEILING else ord(" ") for code in line])
-        line = new_line.decode("ascii")
+        line = line.translate(_REPLACE_NON_ASCII).decode("ascii")
         line = line.replace("\r\n", "\n").replace("\r", "\n")
         return line
 
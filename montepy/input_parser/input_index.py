@@ -0,0 +1,464 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+"""
+Tools for finding, and parsing single inputs in a very large file without reading the rest of it.
+
+.. versionadded:: 0.5.5
+"""
+import collections
+import mmap
+import re
+import warnings
+
+from montepy.constants import *
+from montepy.errors import *
+from montepy.input_parser.block_type import BlockType
+from montepy.input_parser.input_file import MCNP_InputFile, _REPLACE_NON_ASCII
+from montepy.input_parser.input_syntax_reader import _InputSplitter
+from montepy.input_parser.mcnp_input import Input
+from montepy.particle import Particle
+
+IndexEntry = collections.namedtuple(
+    "IndexEntry",
+    ["block_type", "prefix", "number", "particles", "start", "end", "line_number"],
+)
+IndexEntry.__doc__ = """
+Where a single input is in a file.
+
+:param block_type: the block the input is in.
+:type block_type: BlockType
+:param prefix: the lower case prefix of a data input, e.g., ``m`` for ``M1``. None for cells and surfaces.
+:type prefix: str
+:param number: the number of the object, or None if it doesn't have one, e.g., ``mode``.
+:type number: int
+:param particles: the sorted, upper case particle designators of a data input, e.g., ``("N", "P")`` for ``imp:n,p``.
+    None if it doesn't have any.
+:type particles: tuple
+:param start: the byte offset in the file where the input starts, including any leading comments.
+:type start: int
+:param end: the byte offset in the file where the input ends.
+:type end: int
+:param line_number: the line number in the file where the input starts. This is 1-indexed.
+:type line_number: int
+"""
+
+_DATA_NAME = re.compile(r"\*?([a-z_]+)(\d*)(?::([^\s=]+))?", re.IGNORECASE)
+
+
+def _normalize_particles(particles):
+    """
+    Converts particle designators to the form used in the index.
+
+    :param particles: the particle designators, e.g., ``"n,p"``, or an iterable of strings, or Particles.
+    :type particles: str, Particle, iterable
+    :returns: the sorted, upper case designators, or None if there are none.
+    :rtype: tuple
+    """
+    if particles is None:
+        return None
+    if isinstance(particles, str):
+        particles = particles.split(",")
+    elif isinstance(particles, Particle):
+        particles = [particles]
+    particles = tuple(
+        sorted(
+            (
+                particle.value if isinstance(particle, Particle) else particle.upper()
+                for particle in particles
+            )
+        )
+    )
+    return particles or None
+
+
+def _get_name(block_type, word):
+    """
+    Gets the prefix and number of an input from the first word of its first line that isn't a comment.
+
+    :param block_type: the block the input is in.
+    :type block_type: BlockType
+    :param word: the first word of the input that isn't a comment.
+    :type word: str
+    :returns: the lower case prefix, or None, the number, or None, and the particle designators, or None.
+    :rtype: tuple
+    """
+    if block_type == BlockType.DATA:
+        match = _DATA_NAME.match(word)
+        if match is None:
+            return None, None, None
+        prefix, number, particles = match.groups()
+        return (
+            prefix.lower(),
+            int(number) if number else None,
+            _normalize_particles(particles),
+        )
+    if block_type == BlockType.SURFACE:
+        word = word.lstrip("*+")
+    try:
+        return None, int(word), None
+    except ValueError:
+        return None, None, None
+
+
+class InputIndex:
+    """
+    An index of where every input is in an MCNP input file.
+
+    The file is memory mapped, and the block boundaries, and the start of every input are found in one pass,
+    without parsing anything.
+    Any single cell, surface, or data input can then be read, and parsed directly by its number,
+    without reading the rest of the file.
+
+    .. code-block:: python
+
+        with montepy.InputIndex("huge.imcnp") as index:
+            cell = index.get_cell(123456)
+            material = index.get_data_input("m", 5)
+
+    .. note::
+        The objects are not linked to a problem, or to each other.
+        For example a cell's material will be None, but its ``old_mat_number`` is set.
+
+    .. note::
+        Inputs in files included with a ``READ`` input are not indexed.
+        The ``READ`` inputs themselves are skipped.
+
+    .. note::
+        The file is indexed as if non-ASCII characters were spaces, so ``encoding`` is only used
+        when an input is read. It must be compatible with ASCII, e.g., UTF-8, or CP1252.
+
+    .. versionadded:: 0.5.5
+
+    :param path: the path to the input file to index.
+    :type path: str, os.PathLike
+    :param mcnp_version: The version of MCNP that the input is intended for.
+    :type mcnp_version: tuple
+    :param replace: replace all non-ASCII characters with a space (0x20)
+    :type replace: bool
+    :param encoding: The encoding scheme to read the inputs with. If replace is true, this is ignored.
+    :type encoding: str
+    :raises UnsupportedFeature: If an input format is used that MontePy does not support.
+    """
+
+    def __init__(
+        self, path, mcnp_version=DEFAULT_VERSION, replace=True, encoding="ascii"
+    ):
+        self._path = path
+        self._mcnp_version = mcnp_version
+        self._replace = replace
+        self._encoding = encoding
+        self._input_file = MCNP_InputFile(path)
+        self._entries = []
+        self._lookup = {}
+        self._any_particles = {}
+        self._fh = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be memory mapped.
+            self._mmap = b""
+        try:
+            self._build()
+        except Exception as e:
+            self.close()
+            raise e
+
+    def _decode(self, raw):
+        """
+        Decodes raw bytes from the file the same way as reading the file.
+
+        :param raw: the bytes to decode.
+        :type raw: bytes
+        :rtype: str
+        :raises UnicodeDecodeError: if replace is false, and the bytes aren't valid for the encoding.
+        """
+        if self._replace:
+            return MCNP_InputFile._clean_line(raw)
+        return raw.decode(self._encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+    def _iter_lines(self, start, decode):
+        """
+        Iterates over the lines of the file from the given offset.
+
+        :param start: the byte offset of the first line.
+        :type start: int
+        :param decode: the function to decode the raw bytes of each line with.
+        :type decode: Callable
+        :returns: a generator of the start offset, end offset, and decoded text of each line.
+        :rtype: generator
+        """
+        buffer = self._mmap
+        size = len(buffer)
+        find = buffer.find
+        while start < size:
+            end = find(b"\n", start) + 1 or size
+            yield start, end, decode(buffer[start:end])
+            start = end
+
+    def _iter_chunks(self, start):
+        """
+        Iterates over the file from the given offset in large chunks of whole lines.
+
+        Non-ASCII bytes are always replaced with a space one for one,
+        so the offset of every character is the same as the offset of its byte in the file.
+        This is only used to find the inputs, so the encoding doesn't matter.
+
+        :param start: the byte offset of the first line.
+        :type start: int
+        :returns: a generator of the offset of each chunk, its lines without new lines,
+            and whether the lines end with a new line. Only the last line of the file may not.
+        :rtype: generator
+        """
+        buffer = self._mmap
+        size = len(buffer)
+        while start < size:
+            end = buffer.rfind(b"\n", start, start + MCNP_InputFile._CHUNK_SIZE) + 1
+            if not end:
+                end = buffer.find(b"\n", start) + 1 or size
+            lines = (
+                buffer[start:end]
+                .translate(_REPLACE_NON_ASCII)
+                .decode("ascii")
+                .split("\n")
+            )
+            has_newline = lines[-1] == ""
+            if has_newline:
+                lines.pop()
+            yield start, lines, has_newline
+            start = end
+
+    def _build(self):
+        """
+        Finds every input in the file in one pass, splitting the lines into inputs the same way as
+        :func:`~montepy.input_parser.input_syntax_reader.read_data`.
+        """
+        lines = self._iter_lines(0, MCNP_InputFile._clean_line)
+        line_number = 0
+        data_start = len(self._mmap)
+        # skip the message block, and the title
+        for _, end, line in lines:
+            line_number += 1
+            data_start = end
+            if line_number == 1 and line.upper().startswith("MESSAGE:"):
+                for _, end, line in lines:
+                    line_number += 1
+                    data_start = end
+                    if not line.strip():
+                        break
+                continue
+            break
+        splitter = _InputSplitter(self._mcnp_version)
+        input_start = None
+        input_line_number = None
+        first_line = None
+
+        def flush_input(end):
+            nonlocal input_start, first_line
+            if input_start is None:
+                return
+            word = first_line.split(None, 1)[0] if first_line else ""
+            # READ inputs are skipped, like comment only inputs.
+            if word and word.lower() != "read":
+                block_type = splitter.block_type
+                prefix, number, particles = _get_name(block_type, word)
+                entry = IndexEntry(
+                    block_type,
+                    prefix,
+                    number,
+                    particles,
+                    input_start,
+                    end,
+                    input_line_number,
+                )
+                self._entries.append(entry)
+                self._lookup.setdefault((block_type, prefix, number, particles), entry)
+                self._any_particles.setdefault((block_type, prefix, number), entry)
+            input_start = None
+            first_line = None
+
+        is_block_end = splitter.is_block_end
+        classify = splitter.classify
+        add_line = splitter.add_line
+        for offset, chunk_lines, has_newline in self._iter_chunks(data_start):
+            for line in chunk_lines:
+                start = offset
+                offset += len(line) + 1
+                line_number += 1
+                # match how the file is cleaned when it is read.
+                if "\r" in line:
+                    if line[-1] == "\r":
+                        line = line[:-1]
+                    line = line.replace("\r", "\n")
+                if "\t" in line:
+                    line = line.expandtabs(TABSIZE)
+                line_end = line + "\n" if has_newline else line
+                # transition to next block with blank line
+                if is_block_end(line_end):
+                    flush_input(start)
+                    splitter.next_block()
+                    continue
+                starts_input, line_is_comment = classify(line_end)
+                if starts_input:
+                    flush_input(start)
+                add_line(line_end, line_is_comment)
+                if input_start is None:
+                    input_start = start
+                    input_line_number = line_number
+                if first_line is None and not line_is_comment:
+                    first_line = line
+        flush_input(len(self._mmap))
+
+    @property
+    def path(self):
+        """
+        The path of the indexed file.
+
+        :rtype: str
+        """
+        return self._path
+
+    @property
+    def entries(self):
+        """
+        The entries for every input in the file, in the order they are in the file.
+
+        :rtype: list
+        """
+        return self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def find(self, block_type, number, prefix=None, particles=None):
+        """
+        Finds where an input is in the file.
+
+        If more than one input has the same number, the first one is found.
+        If no particles are given, an input without particle designators is found first,
+        and then the first input with any particle designators.
+
+        :param block_type: the block the input is in.
+        :type block_type: BlockType
+        :param number: the number of the object.
+        :type number: int
+        :param prefix: the prefix of a data input, e.g., ``m`` for materials. This is ignored for cells and surfaces.
+        :type prefix: str
+        :param particles: the particle designators of a data input, e.g., ``"n,p"``, or ``[Particle.NEUTRON]``.
+            This is ignored for cells and surfaces.
+        :type particles: str, Particle, iterable
+        :returns: the entry for the input.
+        :rtype: IndexEntry
+        :raises KeyError: if there is no such input in the file.
+        """
+        if block_type == BlockType.DATA:
+            prefix = prefix.lower() if prefix else prefix
+            particles = _normalize_particles(particles)
+        else:
+            prefix = None
+            particles = None
+        entry = self._lookup.get((block_type, prefix, number, particles))
+        if entry is None and particles is None:
+            entry = self._any_particles.get((block_type, prefix, number))
+        if entry is None:
+            name = (
+                f"{prefix}{number if number is not None else ''}" if prefix else number
+            )
+            if particles:
+                name = f"{name}:{','.join(particles)}"
+            raise KeyError(f"{block_type} input: {name} not found in {self._path}")
+        return entry
+
+    def read_input(self, entry):
+        """
+        Reads the syntax of a single input, without parsing it.
+
+        :param entry: the entry of the input to read.
+        :type entry: IndexEntry
+        :rtype: Input
+        :raises UnicodeDecodeError: if replace is false, and the input isn't valid for the encoding.
+        """
+        line_length = get_max_line_length(self._mcnp_version)
+        input_lines = []
+        for start, _, line in self._iter_lines(entry.start, self._decode):
+            if start >= entry.end:
+                break
+            line = line.expandtabs(TABSIZE)
+            old_line = line
+            line = line[:line_length]
+            if len(old_line) != len(line):
+                warnings.warn(
+                    f"The line: {old_line} exceeded the allowed line length of: {line_length} for MCNP {self._mcnp_version}",
+                    LineOverRunWarning,
+                )
+            input_lines.append(line.rstrip())
+        return Input(input_lines, entry.block_type, self._input_file, entry.line_number)
+
+    def parse(self, entry):
+        """
+        Reads, and parses a single input.
+
+        :param entry: the entry of the input to parse.
+        :type entry: IndexEntry
+        :returns: the parsed object.
+        :rtype: MCNP_Object
+        :raises MalformedInputError: If the input has a broken syntax.
+        """
+        from montepy.mcnp_problem import _BLOCK_PARSERS
+
+        return _BLOCK_PARSERS[entry.block_type](self.read_input(entry))
+
+    def get_cell(self, number):
+        """
+        Reads, and parses a single cell by its number.
+
+        :param number: the number of the cell.
+        :type number: int
+        :rtype: Cell
+        :raises KeyError: if there is no such cell in the file.
+        """
+        return self.parse(self.find(BlockType.CELL, number))
+
+    def get_surface(self, number):
+        """
+        Reads, and parses a single surface by its number.
+
+        :param number: the number of the surface.
+        :type number: int
+        :rtype: Surface
+        :raises KeyError: if there is no such surface in the file.
+        """
+        return self.parse(self.find(BlockType.SURFACE, number))
+
+    def get_data_input(self, prefix, number, particles=None):
+        """
+        Reads, and parses a single data input by its prefix, number, and particle designators.
+
+        For example ``index.get_data_input("m", 1)`` parses material 1,
+        and ``index.get_data_input("imp", None, "p")`` parses ``imp:p``.
+
+        :param prefix: the prefix of the data input, e.g., ``m`` or ``tr``.
+        :type prefix: str
+        :param number: the number of the data input, or None if it doesn't have one.
+        :type number: int
+        :param particles: the particle designators of the data input, e.g., ``"n,p"``.
+        :type particles: str, Particle, iterable
+        :rtype: DataInputAbstract
+        :raises KeyError: if there is no such data input in the file.
+        """
+        return self.parse(self.find(BlockType.DATA, number, prefix, particles))
+
+    def close(self):
+        """
+        Closes the memory map, and the file.
+        """
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
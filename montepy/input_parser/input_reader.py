@@ -1,17 +1,61 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import os
+
+import warnings
+
 from montepy import mcnp_problem
 from montepy.constants import DEFAULT_VERSION
+from montepy.errors import *
+from montepy.input_parser import input_syntax_reader, parse_cache
+from montepy.input_parser.input_file import MCNP_InputFile
+from montepy.input_parser.mcnp_input import Input
 
 
-def read_input(destination, mcnp_version=DEFAULT_VERSION, replace=True):
+def read_input(
+    destination,
+    mcnp_version=DEFAULT_VERSION,
+    replace=True,
+    workers=None,
+    cache_dir=None,
+    input_cache=None,
+    lazy=False,
+):
     """
     Reads the specified MCNP Input file.
 
     The MCNP version must be a three component tuple e.g., (6, 2, 0) and (5, 1, 60).
 
+    Large inputs can be parsed in parallel by setting ``workers`` to the number of processes to use.
+    The resulting problem is the same as a serial parse.
+    No more workers are used than there are CPUs,
+    and small inputs are parsed serially, because the workers would be slower.
+
+    If ``cache_dir`` is given the parsed problem is stored in that directory,
+    and will be loaded from there the next time the same unchanged file is read.
+    See :mod:`montepy.input_parser.parse_cache`.
+
+    When a file is being edited and re-read many times, an
+    :class:`~montepy.input_parser.parse_cache.InputCache` can be given as ``input_cache``,
+    so only the inputs that changed since the last read are parsed again.
+
+    With ``lazy=True`` only the syntax of the file is read.
+    This is for problems that are only inspected through their title, message, and original inputs,
+    or are written back unchanged.
+    If they never are, :func:`~montepy.mcnp_problem.MCNP_Problem.write_problem` writes the inputs back exactly as they were read.
+    Accessing any object collection, e.g., ``problem.cells``, builds and links every object in the problem at once,
+    which takes as long as a normal read, so editing even a few objects is not faster.
+
+    .. versionchanged:: 0.5.5
+        Added the ``workers``, ``cache_dir``, ``input_cache``, and ``lazy`` parameters.
+
     .. note::
         if a stream is provided. It will not be closed by this function.
 
+    .. note::
+        The cache is only used when ``destination`` is a path.
+        A problem read with ``lazy=True`` is loaded from the cache if possible,
+        but is not stored in it, as it hasn't been parsed.
+
     :param destination: the path to the input file to read, or a readable stream.
     :type destination: io.TextIOBase, str, os.PathLike
     :param mcnp_version: The version of MCNP that the input is intended for.
@@ -19,6 +63,15 @@ def read_input(destination, mcnp_version=DEFAULT_VERSION, replace=True):
     :returns: The MCNP_Problem instance representing this file.
     :param replace: replace all non-ASCII characters with a space (0x20)
     :type replace: bool
+    :param workers: The number of worker processes to parse inputs with. If None, or 1, inputs are parsed serially.
+        This is capped at the number of CPUs.
+    :type workers: int
+    :param cache_dir: The directory to cache parsed problems in. If None no caching is done.
+    :type cache_dir: str, os.PathLike
+    :param input_cache: A cache of the objects parsed from individual inputs, which will be updated.
+    :type input_cache: InputCache
+    :param lazy: Whether to wait to build all of the objects until any of them are first accessed.
+    :type lazy: bool
     :rtype: MCNP_Problem
     :raises UnsupportedFeature: If an input format is used that MontePy does not support.
     :raises MalformedInputError: If an input has a broken syntax.
@@ -26,7 +79,82 @@ def read_input(destination, mcnp_version=DEFAULT_VERSION, replace=True):
     :raises BrokenObjectLinkError: If a reference is made to an object that is not in the input file.
     :raises UnknownElement: If an isotope is specified for an unknown element.
     """
+    use_cache = cache_dir is not None and isinstance(destination, (str, os.PathLike))
+    if use_cache:
+        problem = parse_cache.load_problem(
+            destination, cache_dir, mcnp_version, replace
+        )
+        if problem is not None:
+            return problem
     problem = mcnp_problem.MCNP_Problem(destination)
     problem.mcnp_version = mcnp_version
-    problem.parse_input(replace=replace)
+    problem.parse_input(
+        replace=replace, workers=workers, input_cache=input_cache, lazy=lazy
+    )
+    if use_cache and not lazy:
+        parse_cache.store_problem(problem, cache_dir, replace)
     return problem
+
+
+def iter_inputs(
+    destination, mcnp_version=DEFAULT_VERSION, replace=True, check_input=False
+):
+    """
+    Reads the specified MCNP Input file one input at a time.
+
+    Each input is parsed as soon as it is read, and nothing is kept once it has been yielded,
+    so even very large files can be scanned with a bounded amount of memory.
+
+    .. code-block:: python
+
+        for block_type, line_number, obj in montepy.iter_inputs("foo.imcnp"):
+            if isinstance(obj, montepy.surfaces.surface.Surface):
+                print(line_number, obj.surface_type)
+
+    .. note::
+        The objects are not linked to a problem, or to each other.
+        For example a cell's material will be None, but its ``old_mat_number`` is set.
+
+    .. note::
+        The message and title are not yielded.
+
+    .. versionadded:: 0.5.5
+
+    :param destination: the path to the input file to read, or a readable stream.
+    :type destination: io.TextIOBase, str, os.PathLike
+    :param mcnp_version: The version of MCNP that the input is intended for.
+    :type mcnp_version: tuple
+    :param replace: replace all non-ASCII characters with a space (0x20)
+    :type replace: bool
+    :param check_input: If true, inputs with errors are skipped and the errors are collected as warnings.
+    :type check_input: bool
+    :returns: a generator of tuples of the block type, the starting line number, and the parsed object of each input.
+    :rtype: generator
+    :raises UnsupportedFeature: If an input format is used that MontePy does not support.
+    :raises MalformedInputError: If an input has a broken syntax.
+    :raises UnknownElement: If an isotope is specified for an unknown element.
+    """
+    if hasattr(destination, "read") and callable(getattr(destination, "read")):
+        input_file = MCNP_InputFile.from_open_stream(destination)
+    else:
+        input_file = MCNP_InputFile(destination)
+    reader = input_syntax_reader.read_input_syntax(
+        input_file, mcnp_version, replace=replace
+    )
+    try:
+        for input in reader:
+            if not isinstance(input, Input) or len(input.input_lines) == 0:
+                continue
+            try:
+                obj = mcnp_problem._BLOCK_PARSERS[input.block_type](input)
+            except (MalformedInputError, ParsingError, UnknownElement) as e:
+                if check_input:
+                    warnings.warn(f"{type(e).__name__}: {e.message}", stacklevel=2)
+                    continue
+                raise e
+            yield input.block_type, input.line_number, obj
+    except UnsupportedFeature as e:
+        if check_input:
+            warnings.warn(f"{type(e).__name__}: {e.message}", stacklevel=2)
+        else:
+            raise e
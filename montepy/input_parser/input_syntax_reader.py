@@ -93,6 +93,92 @@ def read_front_matters(fh, mcnp_version):
             break
 
 
+class _InputSplitter:
+    """
+    Splits the lines of the cell, surface, and data blocks into inputs, and blocks.
+
+    This holds the rules for blank lines, comments, continuation lines, vertical input format, and line lengths,
+    so every reader of MCNP inputs splits them the same way.
+    Lines must already have their tabs expanded.
+
+    .. versionadded:: 0.5.5
+
+    :param mcnp_version: The version of MCNP that the input is intended for.
+    :type mcnp_version: tuple
+    :param block_type: The type of block the lines start in. By default the cell block.
+    :type block_type: BlockType
+    """
+
+    def __init__(self, mcnp_version, block_type=None):
+        self._line_length = get_max_line_length(mcnp_version)
+        self._block_counter = 0
+        self.block_type = block_type if block_type is not None else BlockType.CELL
+        self._continue_input = False
+        self._has_non_comments = False
+        self._has_lines = False
+
+    @staticmethod
+    def is_block_end(line):
+        """
+        Whether the line is blank, and so ends the current block.
+
+        :param line: the line to check.
+        :type line: str
+        :rtype: bool
+        """
+        return not line.strip()
+
+    def next_block(self):
+        """
+        Moves on to the next block after a blank line.
+        """
+        self._block_counter += 1
+        if self._block_counter < 3:
+            self.block_type = BlockType(self._block_counter)
+        self._has_non_comments = False
+        self._has_lines = False
+
+    def classify(self, line):
+        """
+        Checks where a line that isn't blank goes, without adding it.
+
+        :param line: the line, with its new line if it has one.
+        :type line: str
+        :returns: whether the line starts a new input, so the previous input is finished,
+            and whether the line is a comment.
+        :rtype: tuple
+        """
+        stripped = line.lstrip()
+        # only lines starting with a C can be comments
+        line_is_comment = stripped[:1] in ("c", "C") and is_comment(line)
+        starts_input = (
+            len(line) - len(stripped) < BLANK_SPACE_CONTINUE
+            and not self._continue_input
+            and not line_is_comment
+            and self._has_non_comments
+            and self._has_lines
+        )
+        return starts_input, line_is_comment
+
+    def add_line(self, line, line_is_comment):
+        """
+        Adds a line that isn't blank to the current input.
+
+        :param line: the line, with its new line if it has one.
+        :type line: str
+        :param line_is_comment: whether the line is a comment, from :func:`classify`.
+        :type line_is_comment: bool
+        :raises UnsupportedFeature: if the line uses the vertical input format.
+        """
+        # die if it is a vertical syntax format
+        if "#" in line[0:BLANK_SPACE_CONTINUE] and not line_is_comment:
+            raise errors.UnsupportedFeature("Vertical Input format is not allowed")
+        # a line cut down to the allowed length loses its new line.
+        self._continue_input = line[: self._line_length].endswith(" &\n")
+        self._has_non_comments = self._has_non_comments or not line_is_comment
+        self._has_lines = True
+
+
 def read_data(fh, mcnp_version, block_type=None, recursion=False):
     """
     Reads the bulk of an MCNP file for all of the MCNP data.
@@ -124,63 +210,44 @@ def read_data(fh, mcnp_version, block_type=None, recursion=False):
     """
     current_file = fh
     line_length = get_max_line_length(mcnp_version)
-    block_counter = 0
-    if block_type is None:
-        block_type = BlockType.CELL
-    continue_input = False
-    has_non_comments = False
+    splitter = _InputSplitter(mcnp_version, block_type)
     input_raw_lines = []
 
     def flush_block():
-        nonlocal block_counter, block_type
         if len(input_raw_lines) > 0:
             yield from flush_input()
-        block_counter += 1
-        if block_counter < 3:
-            block_type = BlockType(block_counter)
+        splitter.next_block()
 
     def flush_input():
         nonlocal input_raw_lines
+        block_type = splitter.block_type
         start_line = current_file.lineno + 1 - len(input_raw_lines)
-        input = Input(
-            input_raw_lines,
-            block_type,
-            current_file,
-            start_line,
-        )
-        try:
+        # only parse likely READ inputs, instead of relying on the parser failing.
+        if ReadInput.is_read_input(input_raw_lines):
             read_input = ReadInput(
                 input_raw_lines, block_type, current_file, start_line
             )
             reading_queue.append((block_type, read_input.file_name, current_file.path))
             yield None
-        except ValueError as e:
-            if isinstance(e, ParsingError):
-                raise e
-            yield input
-        continue_input = False
+        else:
+            yield Input(
+                input_raw_lines,
+                block_type,
+                current_file,
+                start_line,
+            )
         input_raw_lines = []
 
     for line in fh:
         line = line.expandtabs(TABSIZE)
-        line_is_comment = is_comment(line)
         # transition to next block with blank line
-        if not line.strip():
+        if splitter.is_block_end(line):
             yield from flush_block()
-            has_non_comments = False
             continue
-        # if a new input
-        if (
-            line[0:BLANK_SPACE_CONTINUE].strip()
-            and not continue_input
-            and not line_is_comment
-            and has_non_comments
-            and input_raw_lines
-        ):
+        starts_input, line_is_comment = splitter.classify(line)
+        if starts_input:
             yield from flush_input()
-        # die if it is a vertical syntax format
-        if "#" in line[0:BLANK_SPACE_CONTINUE] and not line_is_comment:
-            raise errors.UnsupportedFeature("Vertical Input format is not allowed")
+        splitter.add_line(line, line_is_comment)
         # cut line down to allowed length
         old_line = line
         line = line[:line_length]
@@ -189,11 +256,6 @@ def read_data(fh, mcnp_version, block_type=None, recursion=False):
                 f"The line: {old_line} exceeded the allowed line length of: {line_length} for MCNP {mcnp_version}",
                 errors.LineOverRunWarning,
             )
-        if line.endswith(" &\n"):
-            continue_input = True
-        else:
-            continue_input = False
-        has_non_comments = has_non_comments or not line_is_comment
         input_raw_lines.append(line.rstrip())
     yield from flush_block()
 
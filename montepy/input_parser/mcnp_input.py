@@ -150,6 +150,20 @@ class Input(ParsingNode):
     :rtype: list
     """
 
+    _LEXER_CLASSES = {
+        BlockType.CELL: CellLexer,
+        BlockType.SURFACE: SurfaceLexer,
+        BlockType.DATA: DataLexer,
+    }
+
+    _lexer_pool = {}
+    """
+    Idle lexers that can be reused, by lexer class.
+
+    Lexers are only reset when they start tokenizing new text,
+    so one can't be shared by two inputs being tokenized at the same time.
+    """
+
     def __init__(self, input_lines, block_type, input_file=None, lineno=None):
         super().__init__(input_lines)
         if not isinstance(block_type, BlockType):
@@ -158,6 +172,7 @@ class Input(ParsingNode):
         self._input_file = input_file
         self._lineno = lineno
         self._lexer = None
+        self._tokens = None
 
     def __str__(self):
         return f"INPUT: {self._block_type}"
@@ -208,15 +223,28 @@ class Input(ParsingNode):
         * In a surface block :class:`~montepy.input_parser.tokens.SurfaceLexer` is used.
         * In a data block :class:`~montepy.input_parser.tokens.DataLexer` is used.
 
+        .. versionchanged:: 0.5.5
+            If the tokens have been cached by the parser that lexes this input more than once,
+            they are replayed instead of lexing the text again.
+
+        :returns: a generator of tokens.
+        :rtype: Token
+        """
+        if self._tokens is not None:
+            yield from self._tokens
+            return
+        yield from self._lex()
+
+    def _lex(self):
+        """
+        Lexes the text of this input with a lexer for its block type.
+
         :returns: a generator of tokens.
         :rtype: Token
         """
-        if self.block_type == BlockType.CELL:
-            lexer = CellLexer()
-        elif self.block_type == BlockType.SURFACE:
-            lexer = SurfaceLexer()
-        else:
-            lexer = DataLexer()
+        lexer_class = self._LEXER_CLASSES.get(self.block_type, DataLexer)
+        pool = self._lexer_pool.setdefault(lexer_class, [])
+        lexer = pool.pop() if pool else lexer_class()
         self._lexer = lexer
         # hacky way to capture final new line and remove it after lexing.
         generator = lexer.tokenize(self.input_text)
@@ -235,7 +263,35 @@ class Input(ParsingNode):
             token.value = token.value.rstrip("\n")
             if token.value:
                 yield token
-        self._lexer = None
+        finally:
+            # the lexer can only be reused once it is done with this text.
+            generator.close()
+            self._lexer = None
+            pool.append(lexer)
+
+    def _get_tokens(self):
+        """
+        Tokenizes this whole input, if it hasn't been already, and caches the tokens.
+
+        This is only for parsing an input more than once,
+        and the tokens must be dropped with :func:`_clear_tokens` once it is parsed.
+
+        .. versionadded:: 0.5.5
+
+        :returns: all of the tokens of this input.
+        :rtype: list
+        """
+        if self._tokens is None:
+            self._tokens = list(self._lex())
+        return self._tokens
+
+    def _clear_tokens(self):
+        """
+        Drops the cached tokens, once nothing else needs to parse this input.
+
+        .. versionadded:: 0.5.5
+        """
+        self._tokens = None
 
     @make_prop_pointer("_lexer")
     def lexer(self):
@@ -310,7 +366,7 @@ class ReadInput(Input):
             if not is_comment(line):
                 first_non_comment = line
                 break
-        words = first_non_comment.split()
+        words = first_non_comment.split(None, 1)
         if len(words) > 0:
             first_word = words[0].lower()
             return first_word == "read"
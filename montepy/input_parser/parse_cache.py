@@ -0,0 +1,307 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+"""
+Tools for caching parsed MCNP problems and inputs, so unchanged inputs don't need to be parsed again.
+
+.. versionadded:: 0.5.5
+"""
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+import warnings
+
+import montepy
+from montepy.input_parser.mcnp_input import Input
+
+_CACHE_SUFFIX = ".pickle"
+
+
+def _hash_file(path):
+    """
+    Hashes the raw bytes of a file.
+
+    :param path: the path to the file to hash.
+    :type path: str, os.PathLike
+    :returns: the hex digest of the file contents.
+    :rtype: str
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(2**20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def problem_cache_key(path, mcnp_version, replace=True):
+    """
+    Creates the key used to store a parsed problem in a cache directory.
+
+    The key is a hash of the absolute path and the contents of the file, the MCNP version,
+    the ``replace`` option, and the version of MontePy.
+    Files pulled in through a ``READ`` input are verified separately when the problem is loaded.
+
+    :param path: the path to the input file.
+    :type path: str, os.PathLike
+    :param mcnp_version: The version of MCNP that the input is intended for.
+    :type mcnp_version: tuple
+    :param replace: whether non-ASCII characters were replaced when reading.
+    :type replace: bool
+    :returns: the key for this problem.
+    :rtype: str
+    """
+    hasher = hashlib.sha256()
+    for part in (
+        os.path.abspath(path),
+        _hash_file(path),
+        str(tuple(mcnp_version)),
+        str(replace),
+        str(montepy.__version__),
+    ):
+        hasher.update(part.encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def _loads(data):
+    """
+    Unpickles an object with the cyclic garbage collector paused.
+
+    The garbage collector makes loading millions of small syntax nodes very slow.
+
+    :param data: the pickled object.
+    :type data: bytes
+    :returns: the unpickled object.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _get_cache_file(path, cache_dir, mcnp_version, replace):
+    key = problem_cache_key(path, mcnp_version, replace)
+    return os.path.join(cache_dir, key + _CACHE_SUFFIX)
+
+
+def _find_read_files(problem):
+    """
+    Finds all files, other than the main input file, that inputs of this problem were read from.
+
+    :param problem: the problem to find the files for.
+    :type problem: MCNP_Problem
+    :returns: the absolute paths of the files.
+    :rtype: set
+    """
+    main_file = os.path.abspath(problem.input_file.path)
+    files = set()
+    for input in problem.original_inputs:
+        if isinstance(input, Input) and input.input_file is not None:
+            path = os.path.abspath(input.input_file.path)
+            if path != main_file:
+                files.add(path)
+    return files
+
+
+def load_problem(path, cache_dir, mcnp_version, replace=True):
+    """
+    Loads a parsed problem from the cache if it is available and still valid.
+
+    .. note::
+        Any failure to read the cache is treated as a cache miss.
+
+    :param path: the path to the input file.
+    :type path: str, os.PathLike
+    :param cache_dir: the directory holding the cache.
+    :type cache_dir: str, os.PathLike
+    :param mcnp_version: The version of MCNP that the input is intended for.
+    :type mcnp_version: tuple
+    :param replace: whether non-ASCII characters were replaced when reading.
+    :type replace: bool
+    :returns: the cached problem, or None if there is no valid cached problem.
+    :rtype: MCNP_Problem
+    """
+    try:
+        cache_file = _get_cache_file(path, cache_dir, mcnp_version, replace)
+        with open(cache_file, "rb") as fh:
+            entry = pickle.load(fh)
+        for read_file, digest in entry["read_files"].items():
+            if _hash_file(read_file) != digest:
+                return None
+        return _loads(entry["problem"])
+    except Exception:
+        return None
+
+
+def store_problem(problem, cache_dir, replace=True):
+    """
+    Stores a freshly parsed problem in the cache.
+
+    This should be called before the problem is modified.
+
+    .. note::
+        Storing is best effort. If the problem can't be pickled, or the cache can't be written,
+        a warning is issued, and nothing is stored.
+
+    :param problem: the problem to store. It must have been read from a file path.
+    :type problem: MCNP_Problem
+    :param cache_dir: the directory holding the cache. It will be created if it doesn't exist.
+    :type cache_dir: str, os.PathLike
+    :param replace: whether non-ASCII characters were replaced when reading.
+    :type replace: bool
+    """
+    path = problem.input_file.path
+    temp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        entry = {
+            "read_files": {
+                read_file: _hash_file(read_file)
+                for read_file in _find_read_files(problem)
+            },
+            "problem": pickle.dumps(problem, protocol=pickle.HIGHEST_PROTOCOL),
+        }
+        cache_file = _get_cache_file(path, cache_dir, problem.mcnp_version, replace)
+        # write to a temporary file first so a partially written cache is never read
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_file)
+    except (
+        OSError,
+        pickle.PicklingError,
+        TypeError,
+        AttributeError,
+        RecursionError,
+    ) as e:
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        warnings.warn(
+            f"The parsed problem could not be cached in: {cache_dir}. {type(e).__name__}: {e}",
+            stacklevel=3,
+        )
+
+
+class InputCache:
+    """
+    An in-memory cache of the objects parsed from individual inputs.
+
+    This is meant for reading the same file over and over while it is being edited.
+    Only the inputs whose text changed since the previous read are lexed and parsed again.
+    All other objects are restored from the cache, and then linked together as normal.
+
+    .. code-block:: python
+
+        cache = montepy.input_parser.parse_cache.InputCache()
+        problem = montepy.read_input("foo.imcnp", input_cache=cache)
+        # foo.imcnp is edited
+        problem = montepy.read_input("foo.imcnp", input_cache=cache)
+
+    Entries that were not used during the most recent read are dropped.
+
+    .. versionadded:: 0.5.5
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._used = set()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _make_key(input):
+        return (input.block_type, tuple(input.input_lines))
+
+    def _start_read(self):
+        """
+        Resets the usage tracking before a new file is read.
+        """
+        self._used = set()
+        self._hits = 0
+        self._misses = 0
+
+    def _finish_read(self):
+        """
+        Drops all entries that were not used since :func:`_start_read`.
+        """
+        self._entries = {
+            key: value for key, value in self._entries.items() if key in self._used
+        }
+
+    def get(self, input):
+        """
+        Gets a new copy of the object parsed from an identical input.
+
+        :param input: the input to look up.
+        :type input: Input
+        :returns: a new unlinked object, or None if this input has not been seen before.
+        :rtype: MCNP_Object
+        """
+        key = self._make_key(input)
+        data = self._entries.get(key)
+        if data is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._used.add(key)
+        obj = _loads(data)
+        obj._input = input
+        return obj
+
+    def store(self, input, obj):
+        """
+        Stores a freshly parsed object for its input.
+
+        This must be called before the object is linked to a problem, or modified.
+
+        :param input: the input the object was parsed from.
+        :type input: Input
+        :param obj: the object parsed from the input.
+        :type obj: MCNP_Object
+        """
+        key = self._make_key(input)
+        # the input holds the open file, which can't be pickled.
+        obj_input = obj._input
+        obj._input = None
+        try:
+            self._entries[key] = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            obj._input = obj_input
+        self._used.add(key)
+
+    def clear(self):
+        """
+        Removes all entries from this cache.
+        """
+        self._entries.clear()
+        self._used.clear()
+
+    @property
+    def hits(self):
+        """
+        The number of inputs restored from this cache during the most recent read.
+
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        The number of inputs that had to be parsed during the most recent read.
+
+        :rtype: int
+        """
+        return self._misses
+
+    def __contains__(self, input):
+        return self._make_key(input) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -2,10 +2,81 @@
 from montepy.input_parser.tokens import MCNP_Lexer
 from montepy.input_parser import syntax_node
 from sly import Parser
+import hashlib
+import marshal
+import os
 import sly
+import sys
 
 _dec = sly.yacc._decorator
 
+_SLY_INTERNALS = (
+    "_Parser__validate_specification",
+    "_Parser__build_grammar",
+    "_Parser__build_lrtables",
+)
+"""
+The private methods of :class:`sly.Parser` that are used to build the grammar, and the tables separately.
+"""
+
+_HAS_SLY_INTERNALS = all(hasattr(Parser, name) for name in _SLY_INTERNALS)
+"""
+Whether this version of SLY has all of the private methods needed to build the tables lazily.
+
+If not, the tables are built by SLY when each parser class is made.
+"""
+
+
+def _get_table_cache_dir():
+    """
+    Gets the user cache directory where the LALR parsing tables are cached.
+
+    This can be set with the ``MONTEPY_CACHE_DIR`` environment variable.
+    Otherwise the usual user cache directory of the platform is used.
+
+    .. versionadded:: 0.5.5
+
+    :returns: the directory, or None if there is no user cache directory.
+    :rtype: str
+    """
+    path = os.environ.get("MONTEPY_CACHE_DIR")
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+            os.path.join("~", ".cache")
+        )
+    # expanduser leaves the path alone if there is no home directory.
+    if not base or base.startswith("~"):
+        return None
+    return os.path.join(base, "montepy", "parser_tables")
+
+
+class _CachedLRTable:
+    """
+    The LALR parsing tables loaded from the cache.
+
+    This only has the parts of :class:`sly.yacc.LRTable` that are needed for parsing.
+
+    .. versionadded:: 0.5.5
+
+    :param lr_action: the action table for every state.
+    :type lr_action: dict
+    :param lr_goto: the goto table for every state.
+    :type lr_goto: dict
+    :param defaulted_states: the states with only one possible action.
+    :type defaulted_states: dict
+    """
+
+    def __init__(self, lr_action, lr_goto, defaulted_states):
+        self.lr_action = lr_action
+        self.lr_goto = lr_goto
+        self.defaulted_states = defaulted_states
+
 
 class MetaBuilder(sly.yacc.ParserMeta):
     """
@@ -114,6 +185,9 @@ class MCNP_Parser(Parser, metaclass=MetaBuilder):
 
     .. versionadded:: 0.2.0
         This was added with the major parser rework.
+
+    .. versionchanged:: 0.5.5
+        The parsing tables are built when the parser is first used, and are cached in the user cache directory.
     """
 
     # Remove this if trying to see issues with parser
@@ -121,6 +195,92 @@ class MCNP_Parser(Parser, metaclass=MetaBuilder):
     tokens = MCNP_Lexer.tokens
     debugfile = None
 
+    @classmethod
+    def _build(cls, definitions):
+        """
+        Saves the grammar definitions, so the parsing tables are only built when the parser is first used.
+
+        This is called by SLY when the class is made.
+        If SLY doesn't have the private methods needed to build the tables later,
+        SLY builds them now instead.
+
+        .. versionadded:: 0.5.5
+
+        :param definitions: the name and value of every attribute defined in the class.
+        :type definitions: list
+        """
+        if not _HAS_SLY_INTERNALS:
+            super()._build(definitions)
+            return
+        cls._definitions = definitions
+
+    @classmethod
+    def _build_tables(cls):
+        """
+        Builds the grammar, and loads the LALR parsing tables for this parser.
+
+        Building the LALR tables is slow, so they are cached in the user cache directory,
+        and only rebuilt if the grammar has changed since they were cached.
+
+        .. versionadded:: 0.5.5
+
+        :raises sly.yacc.YaccError: if the grammar is not valid.
+        """
+        rules = [
+            (name, value)
+            for name, value in cls._definitions
+            if callable(value) and hasattr(value, "rules")
+        ]
+        if not cls._Parser__validate_specification():
+            raise sly.yacc.YaccError("Invalid parser specification")
+        cls._Parser__build_grammar(rules)
+        grammar = cls._grammar
+        cache_dir = _get_table_cache_dir()
+        # the tables are marshalled, so they are only cached for implementations with a cache tag.
+        use_cache = cache_dir is not None and sys.implementation.cache_tag is not None
+        if use_cache:
+            # the precedence of every terminal decides how shift/reduce conflicts are resolved,
+            # not just the precedence of the productions.
+            digest = hashlib.sha256(
+                "\n".join(
+                    [
+                        getattr(sly, "__version__", ""),
+                        str(grammar.Start),
+                        *sorted(grammar.Terminals),
+                    ]
+                    + [str(sorted(grammar.Precedence.items()))]
+                    + [str(production) for production in grammar.Productions]
+                ).encode()
+            ).hexdigest()
+            path = os.path.join(
+                cache_dir,
+                f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}.{sys.implementation.cache_tag}.lrtab",
+            )
+            try:
+                with open(path, "rb") as fh:
+                    cached_digest, *tables = marshal.load(fh)
+                if cached_digest == digest:
+                    cls._lrtable = _CachedLRTable(*tables)
+                    return
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+        if not cls._Parser__build_lrtables():
+            raise sly.yacc.YaccError("Can't build parsing tables")
+        if not use_cache:
+            return
+        table = cls._lrtable
+        temp_path = f"{path}.{os.getpid()}"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(temp_path, "wb") as fh:
+                marshal.dump(
+                    (digest, table.lr_action, table.lr_goto, table.defaulted_states),
+                    fh,
+                )
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
     def restart(self):
         """
         Clears internal state information about the current parse.
@@ -144,6 +304,8 @@ class MCNP_Parser(Parser, metaclass=MetaBuilder):
         :rtype: SyntaxNode
         """
         self._input = input
+        if "_lrtable" not in vars(type(self)):
+            type(self)._build_tables()
 
         # debug every time a token is taken
         def gen_wrapper():
@@ -258,7 +420,7 @@ class MCNP_Parser(Parser, metaclass=MetaBuilder):
         :rtype: ShortcutNode
         """
         sequence = p.shortcut_sequence
-        if len(p) == 2:
+        if len(p) == 2 and isinstance(sequence, syntax_node.ShortcutNode):
             sequence.end_padding = p.padding
         return sequence
 
@@ -530,6 +692,9 @@ class MCNP_Parser(Parser, metaclass=MetaBuilder):
             if self._input and self._input.lexer:
                 lexer = self._input.lexer
                 index = lexer.find_column(lexer.text, token)
+            # the tokens are being replayed from the cache
+            elif self._input and hasattr(token, "index"):
+                index = MCNP_Lexer.find_column(self._input.input_text, token)
             else:
                 index = 0
             if lineno:
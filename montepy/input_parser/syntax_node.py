@@ -31,6 +31,8 @@ class SyntaxNodeBase(ABC):
     :type name: str
     """
 
+    __slots__ = ("_name", "_nodes")
+
     def __init__(self, name):
         self._name = name
         self._nodes = []
@@ -220,6 +222,8 @@ class SyntaxNode(SyntaxNodeBase):
     :type parse_dict: dict
     """
 
+    __slots__ = ("_is_default",)
+
     def __init__(self, name, parse_dict):
         super().__init__(name)
         self._name = name
@@ -337,6 +341,17 @@ class GeometryTree(SyntaxNodeBase):
     :type right_short_type: Shortcuts
     """
 
+    __slots__ = (
+        "_operator",
+        "_left_side",
+        "_right_side",
+        "_left_short_type",
+        "_right_short_type",
+        "_iter_l_r",
+        "_iter_complete",
+        "_sub_iter",
+    )
+
     def __init__(
         self,
         name,
@@ -563,11 +578,24 @@ class PaddingNode(SyntaxNodeBase):
     :type is_comment: bool
     """
 
+    __slots__ = ()
+
     def __init__(self, token=None, is_comment=False):
         super().__init__("padding")
         if token is not None:
             self.append(token, is_comment)
 
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        new._name = self._name
+        new._nodes = [
+            node if isinstance(node, str) else copy.deepcopy(node, memo)
+            for node in self._nodes
+        ]
+        return new
+
     def __str__(self):
         return f"(Padding, {self._nodes})"
 
@@ -749,6 +777,8 @@ class CommentNode(SyntaxNodeBase):
     :type input: Token
     """
 
+    __slots__ = ("_is_dollar",)
+
     _MATCHER = re.compile(
         rf"""(?P<delim>
                 (\s{{0,{constants.BLANK_SPACE_CONTINUE-1}}}C\s?)
@@ -872,6 +902,20 @@ class ValueNode(SyntaxNodeBase):
     :type never_pad: bool
     """
 
+    __slots__ = (
+        "_token",
+        "_type",
+        "_formatter",
+        "_is_neg_id",
+        "_is_neg_val",
+        "_is_neg",
+        "_og_value",
+        "_never_pad",
+        "_value",
+        "_padding",
+        "_is_reversed",
+    )
+
     _FORMATTERS = {
         float: {
             "value_length": 0,
@@ -931,6 +975,23 @@ class ValueNode(SyntaxNodeBase):
         self._nodes = [self]
         self._is_reversed = False
 
+    def __deepcopy__(self, memo):
+        # copying the slots directly is much faster than the generic deepcopy,
+        # and data inputs can have a huge number of value nodes.
+        cls = type(self)
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        # the tokens and values are immutable, so only the containers need to be copied.
+        for slot in ("_name",) + ValueNode.__slots__:
+            try:
+                setattr(new, slot, getattr(self, slot))
+            except AttributeError:
+                pass
+        new._formatter = self._formatter.copy()
+        new._padding = copy.deepcopy(self._padding, memo)
+        new._nodes = [new]
+        return new
+
     def _convert_to_int(self):
         """
         Converts a float ValueNode to an int ValueNode.
@@ -1374,6 +1435,8 @@ class ParticleNode(SyntaxNodeBase):
     :type token: str
     """
 
+    __slots__ = ("_token", "_order", "_particles", "_formatter")
+
     _letter_finder = re.compile(r"([a-zA-Z])")
 
     def __init__(self, name, token):
@@ -1508,6 +1571,8 @@ class ListNode(SyntaxNodeBase):
     :type name: str
     """
 
+    __slots__ = ("_shortcuts",)
+
     def __init__(self, name):
         super().__init__(name)
         self._shortcuts = []
@@ -1759,6 +1824,8 @@ class IsotopesNode(SyntaxNodeBase):
     :type name: str
     """
 
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
 
@@ -1824,6 +1891,19 @@ class ShortcutNode(ListNode):
     :type short_type: Shortcuts
     """
 
+    __slots__ = (
+        "_type",
+        "_end_pad",
+        "_original",
+        "_full",
+        "_num_node",
+        "_data_type",
+        "_begin",
+        "_end",
+        "_spacing",
+        "_has_pseudo_start",
+    )
+
     _shortcut_names = {
         ("REPEAT", "NUM_REPEAT"): Shortcuts.REPEAT,
         ("JUMP", "NUM_JUMP"): Shortcuts.JUMP,
@@ -2280,6 +2360,8 @@ class ClassifierNode(SyntaxNodeBase):
     e.g., represents ``M4``, ``F104:n,p``, ``IMP:n,e``.
     """
 
+    __slots__ = ("_prefix", "_number", "_particles", "_modifier", "_padding")
+
     def __init__(self):
         super().__init__("classifier")
         self._prefix = None
@@ -2457,6 +2539,8 @@ class ParametersNode(SyntaxNodeBase):
             parameters["imp:n,p"]
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("parameters")
         self._nodes = {}
@@ -1,6 +1,7 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 import montepy
 from montepy.numbered_object_collection import NumberedDataObjectCollection
+import numpy as np
 
 Material = montepy.data_inputs.material.Material
 
@@ -19,3 +20,40 @@ class Materials(NumberedDataObjectCollection):
 
     def __init__(self, objects=None, problem=None):
         super().__init__(Material, objects, problem)
+
+    def to_array(self):
+        """
+        Exports the basic information of every material as a NumPy structured array.
+
+        Each row is a material, in the same order as this collection, with the fields:
+
+        * ``number``: the material number.
+        * ``is_atom_fraction``: whether the fractions are atom fractions, instead of weight fractions.
+        * ``components``: the number of components in the material.
+        * ``total_fraction``: the sum of the fractions of all components.
+        * ``thermal_scattering``: whether the material has any thermal scattering laws.
+
+        .. versionadded:: 0.5.5
+
+        :returns: the structured array of the material information.
+        :rtype: numpy.ndarray
+        """
+
+        def has_thermal_scattering(mat):
+            thermal = mat.thermal_scattering
+            return thermal is not None and len(thermal.thermal_scattering_laws) > 0
+
+        fields = [
+            ("number", np.int64, lambda mat: mat.number),
+            ("is_atom_fraction", np.bool_, lambda mat: mat.is_atom_fraction),
+            ("components", np.int64, lambda mat: len(mat._material_components)),
+            (
+                "total_fraction",
+                np.float64,
+                lambda mat: sum(
+                    comp.fraction for comp in mat._material_components.values()
+                ),
+            ),
+            ("thermal_scattering", np.bool_, has_thermal_scattering),
+        ]
+        return self._to_array(fields)
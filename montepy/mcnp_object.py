@@ -27,6 +27,15 @@ class _ExceptionContextAdder(ABCMeta):
     """
     A metaclass for wrapping all class properties and methods in :func:`~montepy.errors.add_line_number_to_exception`.
 
+    .. versionchanged:: 0.5.5
+        Hashing and comparison methods, and property getters made by :func:`~montepy.utilities.make_prop_val_node`,
+        or :func:`~montepy.utilities.make_prop_pointer` are no longer wrapped,
+        as they are called very often and have no errors that need more context.
+    """
+
+    _UNWRAPPED_ATTRS = {"__eq__", "__hash__", "__lt__", "__ne__"}
+    """
+    Names of methods that are never wrapped.
     """
 
     @staticmethod
@@ -34,6 +43,8 @@ class _ExceptionContextAdder(ABCMeta):
         """
         Wraps the function, and returns the modified function.
         """
+        if getattr(func, "_skip_exception_context", False):
+            return func
 
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
@@ -62,7 +73,9 @@ class _ExceptionContextAdder(ABCMeta):
         for key, value in attributes.items():
             if key.startswith("_"):
                 new_attrs[key] = value
-            if callable(value):
+            if key in _ExceptionContextAdder._UNWRAPPED_ATTRS:
+                new_attrs[key] = value
+            elif callable(value):
                 new_attrs[key] = _ExceptionContextAdder._wrap_attr_call(value)
             elif isinstance(value, property):
                 new_props = {}
@@ -115,6 +128,8 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
                 raise MalformedInputError(
                     input, f"Error parsing object of type: {type(self)}: {e.args[0]}"
                 )
+            finally:
+                input._clear_tokens()
             if self._tree is None:
                 raise ParsingError(
                     input,
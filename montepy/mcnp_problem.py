@@ -1,8 +1,10 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+from concurrent.futures import ProcessPoolExecutor
 import copy
 from enum import Enum
 import itertools
 import os
+import pickle
 import warnings
 
 from montepy.data_inputs import mode, transform
@@ -12,17 +14,85 @@ from montepy.cells import Cells
 from montepy.errors import *
 from montepy.constants import DEFAULT_VERSION
 from montepy.materials import Material, Materials
-from montepy.surfaces import surface, surface_builder
+from montepy.surfaces import duplicate_finder, surface, surface_builder
 from montepy.surface_collection import Surfaces
 
 # weird way to avoid circular imports
 from montepy.data_inputs import parse_data
-from montepy.input_parser import input_syntax_reader, block_type, mcnp_input
+from montepy.input_parser import (
+    input_syntax_reader,
+    block_type,
+    mcnp_input,
+    parse_cache,
+)
 from montepy.input_parser.input_file import MCNP_InputFile
 from montepy.universes import Universes
 from montepy.transforms import Transforms
 import montepy
 
+_BLOCK_PARSERS = {
+    block_type.BlockType.CELL: Cell,
+    block_type.BlockType.SURFACE: surface_builder.surface_builder,
+    block_type.BlockType.DATA: parse_data,
+}
+
+# below this many inputs starting the worker processes costs more than it saves.
+_MIN_PARALLEL_INPUTS = 2000
+
+
+def _parse_input_batch(batch):
+    """
+    Semantically parses a batch of inputs inside of a worker process.
+
+    Any input that raises an error, or emits a warning, is returned as ``None``
+    so the parent process can parse it again, and report the problem exactly as
+    a serial parse would.
+
+    .. versionadded:: 0.5.5
+
+    The objects are pickled here, so the parent can unpickle them with the garbage collector paused.
+
+    :param batch: a list of tuples of the block type, input lines, and starting line number of each input.
+    :type batch: list
+    :returns: the pickled list of parsed objects in the same order as the batch.
+    :rtype: bytes
+    """
+    ret = []
+    for block, lines, lineno in batch:
+        input = mcnp_input.Input(lines, block, lineno=lineno)
+        with warnings.catch_warnings(record=True) as warning_catch:
+            warnings.simplefilter("always")
+            try:
+                obj = _BLOCK_PARSERS[block](input)
+            except Exception:
+                obj = None
+        if warning_catch:
+            obj = None
+        ret.append(obj)
+    return pickle.dumps(ret, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _get_worker_count(workers):
+    """
+    Gets the number of worker processes to parse inputs with.
+
+    More workers than CPUs can't run at once, and only add the cost of passing the objects back,
+    so the number of workers is capped at the number of CPUs.
+
+    .. versionadded:: 0.5.5
+
+    :param workers: The number of worker processes requested.
+    :type workers: int
+    :returns: the number of workers to use. If this is 1 the inputs should be parsed serially.
+    :rtype: int
+    """
+    if workers is None:
+        return 1
+    cpus = os.cpu_count()
+    if cpus is not None:
+        workers = min(workers, cpus)
+    return workers
+
 
 class MCNP_Problem:
     """
@@ -43,6 +113,14 @@ class MCNP_Problem:
         montepy.universe.Universe: Universes,
     }
 
+    _CELL_LINK_KINDS = ("surfaces", "complements", "material", "universe")
+    _CELL_LINK_STATE = {
+        "_MCNP_Problem__cell_links",
+        "_MCNP_Problem__link_targets",
+        "_MCNP_Problem__changed_cells",
+        "_MCNP_Problem__cell_order",
+    }
+
     def __init__(self, destination):
         if hasattr(destination, "read") and callable(getattr(destination, "read")):
             self._input_file = MCNP_InputFile.from_open_stream(destination)
@@ -51,6 +129,11 @@ class MCNP_Problem:
         self._title = None
         self._message = None
         self.__unpickled = False
+        self.__deferred_parse = None
+        self.__deferred_error = None
+        self.__cell_links = None
+        self.__changed_cells = {}
+        self.__cell_order = None
         self._print_in_data_block = CellDataPrintController()
         self._original_inputs = []
         for collect_type in self._NUMBERED_OBJ_MAP.values():
@@ -60,9 +143,32 @@ class MCNP_Problem:
         self._mcnp_version = DEFAULT_VERSION
         self._mode = mode.Mode()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in self._CELL_LINK_STATE:
+            state.pop(key, None)
+        return state
+
     def __setstate__(self, nom_nom):
         self.__dict__.update(nom_nom)
         self.__unpickled = True
+        self.__cell_links = None
+        self.__changed_cells = {}
+        self.__cell_order = None
+
+    @property
+    def is_parsed(self):
+        """
+        Whether the objects of this problem have been built.
+
+        This is only False for a problem read with ``lazy=True``, whose objects haven't been accessed yet,
+        or whose objects could not be built.
+
+        .. versionadded:: 0.5.5
+
+        :rtype: bool
+        """
+        return self.__deferred_parse is None and self.__deferred_error is None
 
     @staticmethod
     def __get_collect_attr_name(collect_type):
@@ -121,7 +227,11 @@ class MCNP_Problem:
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, memo))
+            if k not in self._CELL_LINK_STATE:
+                setattr(result, k, copy.deepcopy(v, memo))
+        result.__cell_links = None
+        result.__changed_cells = {}
+        result.__cell_order = None
         result.__unlink_objs()
         return result
 
@@ -143,7 +253,9 @@ class MCNP_Problem:
         :return: a collection of the Cell objects, ordered by the order they were in the input file.
         :rtype: Cells
         """
+        self.__parse_deferred()
         self.__relink_objs()
+        self._cells._set_owner(self)
         return self._cells
 
     @cells.setter
@@ -164,6 +276,7 @@ class MCNP_Problem:
 
         :rtype: Mode
         """
+        self.__parse_deferred()
         return self._mode
 
     def set_mode(self, particles):
@@ -175,7 +288,7 @@ class MCNP_Problem:
         :type particles: list, str
         :raises ValueError: if string is not a valid particle shorthand.
         """
-        self._mode.set(particles)
+        self.mode.set(particles)
 
     @property
     def mcnp_version(self):
@@ -213,6 +326,7 @@ class MCNP_Problem:
         :return: a collection of the Surface objects, ordered by the order they were in the input file.
         :rtype: Surfaces
         """
+        self.__parse_deferred()
         self.__relink_objs()
         return self._surfaces
 
@@ -220,6 +334,7 @@ class MCNP_Problem:
     def surfaces(self, surfs):
         if not isinstance(surfs, (list, Surfaces)):
             raise TypeError("Surfaces must be of type list or Surfaces")
+        self.__parse_deferred()
         if isinstance(surfs, list):
             surfs = Surfaces(surfs)
         surfs.link_to_problem(self)
@@ -233,6 +348,7 @@ class MCNP_Problem:
         :return: a colection of the Material objects, ordered by the order they were in the input file.
         :rtype: Materials
         """
+        self.__parse_deferred()
         self.__relink_objs()
         return self._materials
 
@@ -240,6 +356,7 @@ class MCNP_Problem:
     def materials(self, mats):
         if not isinstance(mats, (list, Materials)):
             raise TypeError("materials must be of type list and Materials")
+        self.__parse_deferred()
         if isinstance(mats, list):
             mats = Materials(mats)
         mats.link_to_problem(self)
@@ -257,6 +374,7 @@ class MCNP_Problem:
 
         :rtype: bool
         """
+        self.__parse_deferred()
         return self._print_in_data_block
 
     @property
@@ -267,6 +385,7 @@ class MCNP_Problem:
         :return: a list of the :class:`~montepy.data_cards.data_card.DataCardAbstract` objects, ordered by the order they were in the input file.
         :rtype: list
         """
+        self.__parse_deferred()
         self.__relink_objs()
         return self._data_inputs
 
@@ -312,6 +431,7 @@ class MCNP_Problem:
         :returns: a collection of universes in the problem.
         :rtype: Universes
         """
+        self.__parse_deferred()
         return self._universes
 
     @property
@@ -322,16 +442,118 @@ class MCNP_Problem:
         :returns: a collection of transforms in the problem.
         :rtype: Transforms
         """
+        self.__parse_deferred()
         return self._transforms
 
-    def parse_input(self, check_input=False, replace=True):
+    def parse_input(
+        self,
+        check_input=False,
+        replace=True,
+        workers=None,
+        input_cache=None,
+        lazy=False,
+    ):
         """
         Semantically parses the MCNP file provided to the constructor.
 
+        .. versionchanged:: 0.5.5
+            Added the ``workers``, ``input_cache``, and ``lazy`` parameters.
+
         :param check_input: If true, will try to find all errors with input and collect them as warnings to log.
         :type check_input: bool
         :param replace: replace all non-ASCII characters with a space (0x20)
         :type replace: bool
+        :param workers: The number of worker processes to parse inputs with. If None, or 1, inputs are parsed serially.
+            This is capped at the number of CPUs.
+        :type workers: int
+        :param input_cache: A cache of previously parsed inputs. Only inputs not in the cache are parsed,
+            and the cache is updated with the inputs of this problem.
+        :type input_cache: InputCache
+        :param lazy: If true only the syntax of the file is read now.
+            All of the objects are built, and linked the first time any of them are accessed,
+            and a problem whose objects were never accessed is written back exactly as it was read.
+        :type lazy: bool
+        :raises TypeError: if workers is not an int.
+        :raises ValueError: if workers is less than 1.
+        """
+        if not isinstance(workers, (int, type(None))):
+            raise TypeError(f"workers must be an int. {workers} given.")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be >= 1. {workers} given.")
+        reader = self.__record_inputs(
+            input_syntax_reader.read_input_syntax(
+                self._input_file, self.mcnp_version, replace=replace
+            )
+        )
+        if lazy:
+            try:
+                for _ in reader:
+                    pass
+            except UnsupportedFeature as e:
+                if check_input:
+                    warnings.warn(f"{type(e).__name__}: {e.message}", stacklevel=2)
+                else:
+                    raise e
+            self.__deferred_parse = (check_input, workers, input_cache)
+            return
+        self.__parse_inputs(reader, check_input, workers, input_cache)
+
+    def __record_inputs(self, reader):
+        """
+        Stores the inputs read from the file as the original inputs, and finds the message and title.
+
+        .. versionadded:: 0.5.5
+
+        :param reader: the generator of inputs from :func:`~montepy.input_parser.input_syntax_reader.read_input_syntax`.
+        :type reader: generator
+        :returns: a generator of the same inputs.
+        :rtype: generator
+        """
+        for input in reader:
+            if not self._original_inputs and isinstance(input, mcnp_input.Message):
+                self._message = input
+            elif isinstance(input, mcnp_input.Title) and self._title is None:
+                self._title = input
+            self._original_inputs.append(input)
+            yield input
+
+    def __parse_deferred(self):
+        """
+        Builds all objects of a problem that was read with ``lazy=True``, if it hasn't been done yet.
+
+        If building the objects fails, the same error is raised again on every later access,
+        because the objects are left partially built and linked.
+
+        .. versionadded:: 0.5.5
+        """
+        if self.__deferred_error is not None:
+            raise self.__deferred_error
+        if self.__deferred_parse is not None:
+            check_input, workers, input_cache = self.__deferred_parse
+            # the objects are accessed while they are built, so don't build them again.
+            self.__deferred_parse = None
+            try:
+                self.__parse_inputs(
+                    list(self._original_inputs), check_input, workers, input_cache
+                )
+            except Exception as e:
+                self.__deferred_error = e
+                raise e
+
+    def __parse_inputs(self, reader, check_input, workers, input_cache):
+        """
+        Semantically parses the inputs, and links all of the objects together.
+
+        .. versionadded:: 0.5.5
+
+        :param reader: the inputs read from the file.
+        :type reader: iterable
+        :param check_input: If true, will try to find all errors with input and collect them as warnings to log.
+        :type check_input: bool
+        :param workers: The number of worker processes to parse inputs with.
+        :type workers: int
+        :param input_cache: A cache of previously parsed inputs.
+        :type input_cache: InputCache
         """
         trailing_comment = None
         last_obj = None
@@ -344,27 +566,32 @@ class MCNP_Problem:
             ),
             block_type.BlockType.DATA: (parse_data, self._data_inputs),
         }
+        pre_parsed = {}
+        if input_cache is not None:
+            input_cache._start_read()
+        workers = _get_worker_count(workers)
+        if workers > 1:
+            reader, pre_parsed = self.__parse_in_parallel(reader, workers, input_cache)
         try:
-            for i, input in enumerate(
-                input_syntax_reader.read_input_syntax(
-                    self._input_file, self.mcnp_version, replace=replace
-                )
-            ):
-                self._original_inputs.append(input)
-                if i == 0 and isinstance(input, mcnp_input.Message):
-                    self._message = input
-
-                elif isinstance(input, mcnp_input.Title) and self._title is None:
-                    self._title = input
-
-                elif isinstance(input, mcnp_input.Input):
+            for i, input in enumerate(reader):
+                if isinstance(input, mcnp_input.Input):
                     if last_block != input.block_type:
                         trailing_comment = None
                         last_block = input.block_type
                     obj_parser, obj_container = OBJ_MATCHER[input.block_type]
                     if len(input.input_lines) > 0:
                         try:
-                            obj = obj_parser(input)
+                            obj = None
+                            if input_cache is not None:
+                                obj = input_cache.get(input)
+                            if obj is None:
+                                obj = pre_parsed.pop(i, None)
+                                if obj is None:
+                                    obj = obj_parser(input)
+                                else:
+                                    obj._input = input
+                                if input_cache is not None:
+                                    input_cache.store(input, obj)
                             obj.link_to_problem(self)
                             obj_container.append(obj)
                         except (
@@ -394,8 +621,80 @@ class MCNP_Problem:
                 warnings.warn(f"{type(e).__name__}: {e.message}", stacklevel=2)
             else:
                 raise e
+        if input_cache is not None:
+            input_cache._finish_read()
         self.__update_internal_pointers(check_input)
 
+    @staticmethod
+    def __parse_in_parallel(reader, workers, input_cache=None):
+        """
+        Reads all inputs, and semantically parses them in a pool of worker processes.
+
+        The objects are not linked to anything. Inputs that could not be parsed by a worker
+        are left out, so they will be parsed serially.
+        If there are fewer than ``_MIN_PARALLEL_INPUTS`` inputs to parse, no workers are started,
+        and all inputs are left to be parsed serially.
+
+        .. versionadded:: 0.5.5
+
+        :param reader: the generator of inputs from :func:`~montepy.input_parser.input_syntax_reader.read_input_syntax`.
+        :type reader: generator
+        :param workers: the number of worker processes to use.
+        :type workers: int
+        :param input_cache: a cache of parsed inputs. Inputs in this cache are not sent to the workers.
+        :type input_cache: InputCache
+        :returns: a generator that replays the inputs read, and a dict mapping the index of an input to its parsed object.
+        :rtype: tuple
+        """
+        inputs = []
+        read_error = None
+        try:
+            for input in reader:
+                inputs.append(input)
+        except UnsupportedFeature as e:
+            read_error = e
+
+        def replay():
+            yield from inputs
+            if read_error is not None:
+                raise read_error
+
+        to_parse = [
+            (i, input)
+            for i, input in enumerate(inputs)
+            if isinstance(input, mcnp_input.Input)
+            and len(input.input_lines) > 0
+            and (input_cache is None or input not in input_cache)
+        ]
+        pre_parsed = {}
+        if len(to_parse) < _MIN_PARALLEL_INPUTS:
+            return replay(), pre_parsed
+        chunk_size = -(-len(to_parse) // (workers * 4))
+        chunks = [
+            to_parse[i : i + chunk_size] for i in range(0, len(to_parse), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _parse_input_batch,
+                    [
+                        (input.block_type, input.input_lines, input.line_number)
+                        for _, input in chunk
+                    ],
+                )
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    objs = parse_cache._loads(future.result())
+                # leave the whole batch to be parsed serially
+                except Exception:
+                    continue
+                for (i, _), obj in zip(chunk, objs):
+                    if obj is not None:
+                        pre_parsed[i] = obj
+        return replay(), pre_parsed
+
     def __update_internal_pointers(self, check_input=False):
         """Updates the internal pointers between objects
 
@@ -427,11 +726,11 @@ class MCNP_Problem:
                 ParticleTypeNotInCell,
             ) as e:
                 handle_error(e)
-        to_delete = []
-        for data_index, data_input in enumerate(self._data_inputs):
+        to_delete = set()
+        for data_input in self._data_inputs:
             try:
                 if data_input.update_pointers(self._data_inputs):
-                    to_delete.append(data_index)
+                    to_delete.add(id(data_input))
             except (
                 BrokenObjectLinkError,
                 MalformedInputError,
@@ -440,22 +739,171 @@ class MCNP_Problem:
             ) as e:
                 handle_error(e)
                 continue
-        for delete_index in to_delete[::-1]:
-            del self._data_inputs[delete_index]
+        if to_delete:
+            self._data_inputs[:] = [
+                input for input in self._data_inputs if id(input) not in to_delete
+            ]
+        self.__build_cell_links()
+
+    def __build_cell_links(self):
+        """
+        Builds the reverse indexes from surfaces, materials, universes, and cells to the cells that use them.
+        """
+        self.__cell_links = {kind: {} for kind in self._CELL_LINK_KINDS}
+        self.__link_targets = {kind: {} for kind in self._CELL_LINK_KINDS}
+        self.__changed_cells = {}
+        self.__cell_order = None
+        for cell in self._cells:
+            self.__index_cell(cell)
+
+    def __index_cell(self, cell):
+        """
+        Adds a cell to the reverse indexes under every object it currently links to.
+
+        :param cell: the cell to index.
+        :type cell: Cell
+        """
+        for kind, targets in (
+            ("surfaces", cell._surfaces),
+            ("complements", cell._complements),
+            ("material", (cell.material,)),
+            ("universe", (cell.universe,)),
+        ):
+            index = self.__cell_links[kind]
+            link_targets = self.__link_targets[kind]
+            for target in targets:
+                if target is not None:
+                    index.setdefault(id(target), {})[id(cell)] = cell
+                    link_targets.setdefault(target.number, {})[id(target)] = target
+
+    def _cell_links_changed(self, cell=None):
+        """
+        Marks that the surfaces, complements, material, or universe of a cell may have changed.
+
+        The cell will be indexed again the next time the reverse indexes are used.
+
+        .. versionadded:: 0.5.5
+
+        :param cell: the cell that changed, or None if any cell may have changed.
+        :type cell: Cell
+        """
+        if self.__cell_links is None:
+            return
+        if cell is None:
+            self.__cell_links = None
+        else:
+            self.__changed_cells[id(cell)] = cell
+
+    def _cell_link_renumbered(self, obj, old_number, new_number):
+        """
+        Moves an object that cells may link to, to its new number in the reverse indexes.
+
+        .. versionadded:: 0.5.5
+
+        :param obj: the object being renumbered.
+        :type obj: Numbered_MCNP_Object
+        :param old_number: the number of the object before it is changed.
+        :type old_number: int
+        :param new_number: the new number of the object.
+        :type new_number: int
+        """
+        if self.__cell_links is None:
+            return
+        for link_targets in self.__link_targets.values():
+            targets = link_targets.get(old_number, {})
+            if targets.pop(id(obj), None) is not None:
+                link_targets.setdefault(new_number, {})[id(obj)] = obj
+
+    def _links_changed(self):
+        """
+        Marks that cells were added to, or removed from the cells of this problem.
+
+        .. versionadded:: 0.5.5
+        """
+        self.__cell_order = None
+
+    def _find_linked_cells(self, kind, target):
+        """
+        Finds the cells of this problem that link to the given object, or an object equal to it.
+
+        This uses reverse indexes instead of checking every cell in the problem.
+        Index entries are checked when they are used, so entries that became stale are dropped.
+        The cells are found in the same order as they are in :func:`cells`.
+
+        .. versionadded:: 0.5.5
+
+        :param kind: the kind of link, one of: ``"surfaces"``, ``"complements"``, ``"material"``, or ``"universe"``.
+        :type kind: str
+        :param target: the object that the cells link to.
+        :type target: MCNP_Object
+        :returns: a generator of the cells linked to the target.
+        :rtype: generator
+        """
+        cells = self.cells
+        if self.__cell_links is None:
+            self.__build_cell_links()
+        elif self.__changed_cells:
+            changed = self.__changed_cells
+            self.__changed_cells = {}
+            for cell in changed.values():
+                if cells.get(cell.number) is cell:
+                    self.__index_cell(cell)
+        index = self.__cell_links[kind]
+        # only objects with the same number can be equal to the target.
+        targets = self.__link_targets[kind].get(target.number, {})
+        target_ids = {id(target), *targets}
+        found = {}
+        for target_id in target_ids:
+            indexed_target = targets.get(target_id, target)
+            candidates = index.get(target_id, {})
+            for key, cell in list(candidates.items()):
+                if cells.get(cell.number) is not cell or not self.__is_linked(
+                    kind, cell, indexed_target
+                ):
+                    del candidates[key]
+                elif indexed_target is target or self.__is_linked(kind, cell, target):
+                    found[key] = cell
+        if len(found) > 1:
+            if self.__cell_order is None:
+                self.__cell_order = {id(cell): i for i, cell in enumerate(cells)}
+            order = self.__cell_order
+            yield from sorted(found.values(), key=lambda cell: order[id(cell)])
+        else:
+            yield from found.values()
+
+    @staticmethod
+    def __is_linked(kind, cell, target):
+        if kind == "surfaces":
+            return target in cell._surfaces
+        if kind == "complements":
+            return cell != target and target in cell._complements
+        # equality can be slow, and identical objects are always equal.
+        if kind == "material":
+            return cell.material is target or cell.material == target
+        return cell.universe is target or cell.universe == target
 
     def remove_duplicate_surfaces(self, tolerance):
         """Finds duplicate surfaces in the problem, and remove them.
 
+        See :func:`~montepy.surfaces.surface.Surface.find_duplicate_surfaces` for what makes two surfaces duplicates.
+
+        .. versionchanged:: 0.5.5
+            The surface constants of all surfaces are compared at once with NumPy,
+            instead of comparing every pair of surfaces.
+            This now removes duplicates of all surface types, except macrobodies.
+
         :param tolerance: The amount of relative error to consider two surfaces identical
         :type tolerance: float
         """
         to_delete = set()
         matching_map = {}
+        candidates = duplicate_finder.find_duplicate_candidates(
+            self.surfaces, tolerance
+        )
         for surface in self.surfaces:
             if surface not in to_delete:
-                matches = surface.find_duplicate_surfaces(self.surfaces, tolerance)
-                if matches:
-                    for match in matches:
+                for match in candidates.get(id(surface), []):
+                    if duplicate_finder.transforms_match(surface, match, tolerance):
                         to_delete.add(match)
                         matching_map[match] = surface
         for cell in self.cells:
@@ -464,6 +912,34 @@ class MCNP_Problem:
         for surface in to_delete:
             self._surfaces.remove(surface)
 
+    def to_arrays(self):
+        """
+        Exports the basic information of the cells, surfaces, and materials as NumPy structured arrays.
+
+        The arrays can be joined together through the numbers of the objects.
+        See :func:`~montepy.cells.Cells.to_array`, :func:`~montepy.surface_collection.Surfaces.to_array`,
+        and :func:`~montepy.materials.Materials.to_array` for the fields of each array.
+
+        .. code-block:: python
+
+            import pandas as pd
+
+            arrays = problem.to_arrays()
+            cells = pd.DataFrame(arrays["cells"])
+            materials = pd.DataFrame(arrays["materials"])
+            cells.merge(materials, left_on="material", right_on="number")
+
+        .. versionadded:: 0.5.5
+
+        :returns: a dictionary with the keys ``"cells"``, ``"surfaces"``, and ``"materials"``.
+        :rtype: dict
+        """
+        return {
+            "cells": self.cells.to_array(),
+            "surfaces": self.surfaces.to_array(),
+            "materials": self.materials.to_array(),
+        }
+
     def add_cell_children_to_problem(self):
         """
         Adds the surfaces, materials, and transforms of all cells in this problem to this problem to the
@@ -535,6 +1011,9 @@ class MCNP_Problem:
         :param inp: Writable input file
         :type inp: MCNP_InputFile
         """
+        if not self.is_parsed:
+            self.__write_original_inputs(inp)
+            return
         with warnings.catch_warnings(record=True) as warning_catch:
             objects_list = []
             if self.message:
@@ -570,6 +1049,27 @@ class MCNP_Problem:
             inp.write("\n")
         self._handle_warnings(warning_catch)
 
+    def __write_original_inputs(self, inp):
+        """
+        Writes the inputs of a problem that was never parsed exactly as they were read.
+
+        .. versionadded:: 0.5.5
+
+        :param inp: Writable input file
+        :type inp: MCNP_InputFile
+        """
+        if self.message:
+            for line in self.message.format_for_mcnp_input(self.mcnp_version):
+                inp.write(line + "\n")
+        for line in self.title.format_for_mcnp_input(self.mcnp_version):
+            inp.write(line + "\n")
+        for block in block_type.BlockType:
+            for input in self._original_inputs:
+                if isinstance(input, mcnp_input.Input) and input.block_type == block:
+                    for line in input.input_lines:
+                        inp.write(line + "\n")
+            inp.write("\n")
+
     def _handle_warnings(self, warning_queue):
         class WarningLevels(Enum):
             SUPRESS = 0
@@ -27,6 +27,7 @@ def _number_validator(self, number):
         collection = getattr(self._problem, collection_type.__name__.lower())
         collection.check_number(number)
         collection._update_number(self.number, number, self)
+        self._problem._cell_link_renumbered(self, self.number, number)
 
 
 class Numbered_MCNP_Object(MCNP_Object):
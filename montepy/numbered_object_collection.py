@@ -1,8 +1,11 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from abc import ABC, abstractmethod
+import bisect
 import typing
 import weakref
 
+import numpy as np
+
 import montepy
 from montepy.numbered_mcnp_object import Numbered_MCNP_Object
 from montepy.errors import *
@@ -19,6 +22,12 @@ class NumberedObjectCollection(ABC):
 
     It quacks like a dict, it acts like a dict, but it's a list.
 
+    The objects are stored in insertion order, and are also indexed by their identity and their number.
+    This makes checking if an object is in the collection, getting an object by its number,
+    and removing an object constant time operations.
+    The collection of a problem also keeps its numbers sorted,
+    so finding free numbers and slicing don't depend on how large the numbers are.
+
     The items in the collection are accessible by their number.
     For instance to get the Cell with a number of 2 you can just say:
 
@@ -42,16 +51,21 @@ class NumberedObjectCollection(ABC):
     :type objects: list
     :param problem: the problem to link this collection to.
     :type problem: MCNP_Problem
+
+    .. versionchanged:: 0.5.5
+        The objects are now stored in a dictionary keyed by their identity, instead of a list.
     """
 
     def __init__(self, obj_class, objects=None, problem=None):
         self.__num_cache = {}
+        self.__sorted_numbers = None
         assert issubclass(obj_class, Numbered_MCNP_Object)
         self._obj_class = obj_class
-        self._objects = []
+        self._objects = {}
         self._start_num = 1
         self._step = 1
         self._problem_ref = None
+        self._owner_ref = None
         if problem is not None:
             self._problem_ref = weakref.ref(problem)
         if objects:
@@ -70,7 +84,7 @@ class NumberedObjectCollection(ABC):
                         )
                     )
                 self.__num_cache[obj.number] = obj
-            self._objects = objects
+            self._objects = {id(obj): obj for obj in objects}
 
     def link_to_problem(self, problem):
         """Links the card to the parent problem for this card.
@@ -86,6 +100,9 @@ class NumberedObjectCollection(ABC):
             self._problem_ref = None
         else:
             self._problem_ref = weakref.ref(problem)
+            # check_number trusts the number cache while linked, so start it fresh.
+            self.__num_cache = {obj.number: obj for obj in self._objects.values()}
+        self.__sorted_numbers = None
         for obj in self:
             obj.link_to_problem(problem)
 
@@ -95,15 +112,42 @@ class NumberedObjectCollection(ABC):
             return self._problem_ref()
         return None
 
+    def _set_owner(self, owner):
+        """
+        Sets the object that owns this collection, and is told when objects are added or removed.
+
+        .. versionadded:: 0.5.5
+
+        :param owner: the object that owns this collection, which must have a ``_links_changed`` method.
+        :type owner: Cell
+        """
+        if self._owner_ref is None or self._owner_ref() is not owner:
+            self._owner_ref = weakref.ref(owner)
+
+    def _contents_changed(self):
+        """
+        Tells the owner of this collection, if any, that objects were added or removed.
+
+        .. versionadded:: 0.5.5
+        """
+        if self._owner_ref is not None:
+            owner = self._owner_ref()
+            if owner is not None:
+                owner._links_changed()
+
     def __getstate__(self):
         state = self.__dict__.copy()
-        weakref_key = "_problem_ref"
-        if weakref_key in state:
-            del state[weakref_key]
+        for weakref_key in ("_problem_ref", "_owner_ref"):
+            if weakref_key in state:
+                del state[weakref_key]
+        # object ids are not valid after unpickling
+        state["_objects"] = list(self._objects.values())
         return state
 
     def __setstate__(self, crunchy_data):
         crunchy_data["_problem_ref"] = None
+        crunchy_data["_owner_ref"] = None
+        crunchy_data["_objects"] = {id(obj): obj for obj in crunchy_data["_objects"]}
         self.__dict__.update(crunchy_data)
 
     @property
@@ -113,11 +157,46 @@ class NumberedObjectCollection(ABC):
 
         :rtype: generator
         """
-        for obj in self._objects:
-            # update cache every time we go through all objects
-            self.__num_cache[obj.number] = obj
+        for obj in self._objects.values():
             yield obj.number
 
+    def _sorted_numbers(self):
+        """
+        Gets the numbers being used in ascending order.
+
+        The numbers of objects in a problem's own collection are kept up to date through :func:`_update_number`,
+        so the sorted numbers are kept between calls for these collections.
+        For all other collections they are found again.
+
+        .. versionadded:: 0.5.5
+
+        :returns: the sorted numbers. This must not be modified.
+        :rtype: list
+        """
+        problem = self._problem
+        if (
+            problem is None
+            or getattr(problem, f"_{type(self).__name__.lower()}", None) is not self
+        ):
+            self.__sorted_numbers = None
+            return sorted(set(self.numbers))
+        if self.__sorted_numbers is None:
+            self.__sorted_numbers = sorted(self.numbers)
+        return self.__sorted_numbers
+
+    def __add_sorted_number(self, number):
+        if self.__sorted_numbers is not None:
+            bisect.insort(self.__sorted_numbers, number)
+
+    def __remove_sorted_number(self, number):
+        numbers = self.__sorted_numbers
+        if numbers is not None:
+            index = bisect.bisect_left(numbers, number)
+            if index < len(numbers) and numbers[index] == number:
+                del numbers[index]
+            else:
+                self.__sorted_numbers = None
+
     def check_number(self, number):
         """Checks if the number is already in use, and if so raises an error.
 
@@ -156,6 +235,8 @@ class NumberedObjectCollection(ABC):
             return
         self.__num_cache.pop(old_num, None)
         self.__num_cache[new_num] = obj
+        self.__remove_sorted_number(old_num)
+        self.__add_sorted_number(new_num)
 
     @property
     def objects(self):
@@ -167,7 +248,7 @@ class NumberedObjectCollection(ABC):
 
         :rtype: list
         """
-        return self._objects[:]
+        return list(self._objects.values())
 
     def pop(self, pos=-1):
         """
@@ -180,16 +261,63 @@ class NumberedObjectCollection(ABC):
         """
         if not isinstance(pos, int):
             raise TypeError("The index for popping must be an int")
-        obj = self._objects.pop(pos)
-        self.__num_cache.pop(obj.number, None)
+        if not self._objects:
+            raise IndexError("pop from empty collection")
+        if pos == -1:
+            _, obj = self._objects.popitem()
+        else:
+            obj = list(self._objects.values())[pos]
+            del self._objects[id(obj)]
+        self.__forget_number(obj)
+        self._contents_changed()
         return obj
 
+    def __forget_number(self, obj):
+        """
+        Removes an object from the number cache, if it is cached.
+
+        :param obj: the object being removed.
+        :type obj: Numbered_MCNP_Object
+        """
+        if self.__num_cache.get(obj.number, None) is obj:
+            del self.__num_cache[obj.number]
+            self.__remove_sorted_number(obj.number)
+        else:
+            self.__sorted_numbers = None
+
+    def _find(self, obj):
+        """
+        Finds the object in this collection that is the same as, or is equal to, the given object.
+
+        .. versionadded:: 0.5.5
+
+        :param obj: the object to look for.
+        :type obj: Numbered_MCNP_Object
+        :returns: the object in this collection, or None if there is no match.
+        :rtype: Numbered_MCNP_Object
+        """
+        found = self._objects.get(id(obj), None)
+        if found is not None:
+            return found
+        if not isinstance(obj, self._obj_class):
+            return None
+        # only objects with the same number can be equal
+        found = self.__num_cache.get(obj.number, None)
+        # the cache is stale if an object was renumbered outside of a problem
+        if found is None or found.number != obj.number:
+            found = self.get(obj.number)
+        if found is not None and found == obj:
+            return found
+        return None
+
     def clear(self):
         """
         Removes all objects from this collection.
         """
         self._objects.clear()
         self.__num_cache.clear()
+        self.__sorted_numbers = None
+        self._contents_changed()
 
     def extend(self, other_list):
         """
@@ -218,11 +346,13 @@ class NumberedObjectCollection(ABC):
                     )
                 )
             nums.add(obj.number)
-        self._objects.extend(other_list)
+        self._objects.update((id(obj), obj) for obj in other_list)
         self.__num_cache.update({obj.number: obj for obj in other_list})
+        self.__sorted_numbers = None
         if self._problem:
             for obj in other_list:
                 obj.link_to_problem(self._problem)
+        self._contents_changed()
 
     def remove(self, delete):
         """
@@ -230,9 +360,14 @@ class NumberedObjectCollection(ABC):
 
         :param delete: the object to delete
         :type delete: Numbered_MCNP_Object
+        :raises ValueError: if the object is not in this collection.
         """
-        self.__num_cache.pop(delete.number, None)
-        self._objects.remove(delete)
+        obj = self._find(delete)
+        if obj is None:
+            raise ValueError(f"{delete} is not in the collection.")
+        del self._objects[id(obj)]
+        self.__forget_number(obj)
+        self._contents_changed()
 
     def clone(self, starting_number=None, step=None):
         """
@@ -270,7 +405,8 @@ class NumberedObjectCollection(ABC):
         if step is None:
             step = self.step
         objs = []
-        for obj in self:
+        # cloning adds to the problem's collection, which may be this one
+        for obj in self.objects:
             new_obj = obj.clone(starting_number, step)
             starting_number = new_obj.number
             objs.append(new_obj)
@@ -298,9 +434,28 @@ class NumberedObjectCollection(ABC):
         pass
 
     def __iter__(self):
-        self._iter = self._objects.__iter__()
+        self._iter = iter(self.objects)
         return self._iter
 
+    def _to_array(self, fields):
+        """
+        Makes a NumPy structured array with one row for each object in this collection.
+
+        The rows are in the same order as this collection.
+
+        .. versionadded:: 0.5.5
+
+        :param fields: the name, dtype, and a function to get the value from an object for every field.
+        :type fields: list
+        :returns: the structured array.
+        :rtype: numpy.ndarray
+        """
+        getters = [getter for _, _, getter in fields]
+        rows = [
+            tuple(getter(obj) for getter in getters) for obj in self._objects.values()
+        ]
+        return np.array(rows, dtype=[(name, dtype) for name, dtype, _ in fields])
+
     def __str__(self):
         base_class_name = self.__class__.__name__
         numbers = list(self.numbers)
@@ -309,7 +464,7 @@ class NumberedObjectCollection(ABC):
     def __repr__(self):
         return (
             f"Numbered_object_collection: obj_class: {self._obj_class}, problem: {self._problem}\n"
-            f"Objects: {self._objects}\n"
+            f"Objects: {self.objects}\n"
             f"Number cache: {self.__num_cache}"
         )
 
@@ -324,9 +479,11 @@ class NumberedObjectCollection(ABC):
             raise TypeError(f"object being appended must be of type: {self._obj_class}")
         self.check_number(obj.number)
         self.__num_cache[obj.number] = obj
-        self._objects.append(obj)
+        self._objects[id(obj)] = obj
+        self.__add_sorted_number(obj.number)
         if self._problem:
             obj.link_to_problem(self._problem)
+        self._contents_changed()
 
     def append_renumber(self, obj, step=1):
         """Appends the object, but will renumber the object if collision occurs.
@@ -372,6 +529,9 @@ class NumberedObjectCollection(ABC):
         .. versionchanged:: 0.5.0
             In 0.5.0 the default values were changed to reference :func:`starting_number` and :func:`step`.
 
+        .. versionchanged:: 0.5.5
+            The used numbers are now searched with bisection, instead of being checked one at a time.
+
         :param start_num: the starting number to check.
         :type start_num: int
         :param step: the increment to jump by to find new numbers.
@@ -387,15 +547,41 @@ class NumberedObjectCollection(ABC):
             start_num = self.starting_number
         if step is None:
             step = self.step
+        numbers = self._sorted_numbers()
         number = start_num
-        while True:
-            try:
-                self.check_number(number)
-                break
-            except NumberConflictError:
+        index = bisect.bisect_left(numbers, number)
+        while index < len(numbers) and numbers[index] == number:
+            if step == 1:
+                index = self.__end_of_run(numbers, index)
+                number = numbers[index - 1] + 1
+            else:
                 number += step
+                index = bisect.bisect_left(numbers, number, index)
         return number
 
+    @staticmethod
+    def __end_of_run(numbers, index):
+        """
+        Finds the end of a run of consecutive numbers.
+
+        :param numbers: the sorted, unique numbers.
+        :type numbers: list
+        :param index: the index the run starts at.
+        :type index: int
+        :returns: the index after the last number of the run.
+        :rtype: int
+        """
+        # number - index only increases after a gap
+        offset = numbers[index] - index
+        low, high = index, len(numbers)
+        while low < high:
+            middle = (low + high) // 2
+            if numbers[middle] - middle > offset:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
     def next_number(self, step=1):
         """Get the next available number, based on the maximum number.
 
@@ -409,7 +595,10 @@ class NumberedObjectCollection(ABC):
             raise TypeError("step must be an int")
         if step <= 0:
             raise ValueError("step must be > 0")
-        return max(self.numbers) + step
+        numbers = self._sorted_numbers()
+        if not numbers:
+            raise ValueError(f"There are no numbers in use in {type(self)}")
+        return numbers[-1] + step
 
     def __get_slice(self, i: slice):
         """Get a new NumberedObjectCollection over a slice of numbers
@@ -423,28 +612,45 @@ class NumberedObjectCollection(ABC):
         Because MCNP numbered objects start at 1, so do the indices.
         They are effectively 1-based and endpoint-inclusive.
 
+        .. versionchanged:: 0.5.5
+            Only the numbers in use are checked, instead of every number in the range.
+
         :rtype: NumberedObjectCollection
         """
+        numbers = self._sorted_numbers()
+        if not numbers:
+            return type(self)([])
         rstep = i.step if i.step is not None else 1
         rstart = i.start
         rstop = i.stop
+        if rstep == 0:
+            raise ValueError("slice step cannot be zero")
         if rstep < 0:  # Backwards
             if rstart is None:
-                rstart = max(self.numbers)
+                rstart = numbers[-1]
             if rstop is None:
-                rstop = min(self.numbers)
+                rstop = numbers[0]
             rstop -= 1
+            in_range = numbers[
+                bisect.bisect_right(numbers, rstop) : bisect.bisect_right(
+                    numbers, rstart
+                )
+            ][::-1]
         else:  # Forwards
             if rstart is None:
                 rstart = 0
             if rstop is None:
-                rstop = max(self.numbers)
+                rstop = numbers[-1]
             rstop += 1
+            in_range = numbers[
+                bisect.bisect_left(numbers, rstart) : bisect.bisect_left(numbers, rstop)
+            ]
         numbered_objects = []
-        for num in range(rstart, rstop, rstep):
-            obj = self.get(num)
-            if obj is not None:
-                numbered_objects.append(obj)
+        for num in in_range:
+            if (num - rstart) % rstep == 0:
+                obj = self.get(num)
+                if obj is not None:
+                    numbered_objects.append(obj)
         # obj_class is always implemented in child classes.
         return type(self)(numbered_objects)
 
@@ -462,8 +668,9 @@ class NumberedObjectCollection(ABC):
         if not isinstance(idx, int):
             raise TypeError("index must be an int")
         obj = self[idx]
-        self.__num_cache.pop(obj.number, None)
-        self._objects.remove(obj)
+        del self._objects[id(obj)]
+        self.__forget_number(obj)
+        self._contents_changed()
 
     def __setitem__(self, key, newvalue):
         if not isinstance(key, int):
@@ -478,7 +685,7 @@ class NumberedObjectCollection(ABC):
         return self
 
     def __contains__(self, other):
-        return other in self._objects
+        return self._find(other) is not None
 
     def get(self, i: int, default=None) -> (Numbered_MCNP_Object, None):
         """
@@ -497,7 +704,7 @@ class NumberedObjectCollection(ABC):
                 return ret
         except KeyError:
             pass
-        for obj in self._objects:
+        for obj in self._objects.values():
             if obj.number == i:
                 self.__num_cache[i] = obj
                 return obj
@@ -509,7 +716,7 @@ class NumberedObjectCollection(ABC):
 
         :rtype: int
         """
-        for o in self._objects:
+        for o in self._objects.values():
             yield o.number
 
     def values(self) -> typing.Generator[Numbered_MCNP_Object, None, None]:
@@ -518,8 +725,7 @@ class NumberedObjectCollection(ABC):
 
         :rtype: Numbered_MCNP_Object
         """
-        for o in self._objects:
-            yield o
+        yield from self._objects.values()
 
     def items(
         self,
@@ -529,7 +735,7 @@ class NumberedObjectCollection(ABC):
 
         :rtype: tuple(int, MCNP_Object)
         """
-        for o in self._objects:
+        for o in self._objects.values():
             yield o.number, o
 
 
@@ -558,7 +764,9 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
                 index = self._last_index
             elif len(self) > 0:
                 try:
-                    index = self._problem.data_inputs.index(self._objects[-1])
+                    index = self._problem.data_inputs.index(
+                        next(reversed(self._objects.values()))
+                    )
                 except ValueError:
                     index = len(self._problem.data_inputs)
             else:
@@ -597,8 +805,7 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
         """
         if not isinstance(pos, int):
             raise TypeError("The index for popping must be an int")
-        obj = self._objects.pop(pos)
-        super().pop(pos)
+        obj = super().pop(pos)
         if self._problem:
             self._problem.data_inputs.remove(obj)
         return obj
@@ -608,7 +815,9 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
         Removes all objects from this collection.
         """
         if self._problem:
-            for obj in self._objects:
-                self._problem.data_inputs.remove(obj)
+            data_inputs = self._problem.data_inputs
+            data_inputs[:] = [
+                input for input in data_inputs if id(input) not in self._objects
+            ]
         self._last_index = None
         super().clear()
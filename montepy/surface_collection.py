@@ -1,4 +1,6 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import numpy as np
+
 from montepy.surfaces.surface import Surface
 from montepy.surfaces.surface_type import SurfaceType
 from montepy.numbered_object_collection import NumberedObjectCollection
@@ -43,6 +45,44 @@ class Surfaces(NumberedObjectCollection):
     def __init__(self, surfaces=None, problem=None):
         super().__init__(Surface, surfaces, problem)
 
+    def to_array(self):
+        """
+        Exports the basic information of every surface as a NumPy structured array.
+
+        Each row is a surface, in the same order as this collection, with the fields:
+
+        * ``number``: the surface number.
+        * ``surface_type``: the MCNP mnemonic of the surface type, e.g., ``PZ``.
+        * ``transform``: the number of the transform, or 0 if there is none.
+        * ``periodic_surface``: the number of the periodic surface, or 0 if there is none.
+        * ``is_reflecting``: whether the surface is reflecting.
+        * ``is_white_boundary``: whether the surface is a white boundary.
+
+        .. versionadded:: 0.5.5
+
+        :returns: the structured array of the surface information.
+        :rtype: numpy.ndarray
+        """
+        fields = [
+            ("number", np.int64, lambda surf: surf.number),
+            ("surface_type", "U3", lambda surf: surf.surface_type.value),
+            (
+                "transform",
+                np.int64,
+                lambda surf: surf.transform.number if surf.transform else 0,
+            ),
+            (
+                "periodic_surface",
+                np.int64,
+                lambda surf: (
+                    surf.periodic_surface.number if surf.periodic_surface else 0
+                ),
+            ),
+            ("is_reflecting", np.bool_, lambda surf: surf.is_reflecting),
+            ("is_white_boundary", np.bool_, lambda surf: surf.is_white_boundary),
+        ]
+        return self._to_array(fields)
+
 
 def __setup_surfaces_generators():
     for surf_type in SurfaceType:
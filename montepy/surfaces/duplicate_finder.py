@@ -0,0 +1,163 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+"""
+Tools for finding surfaces that are effectively the same as each other.
+
+.. versionadded:: 0.5.5
+"""
+import collections
+
+import numpy as np
+
+from montepy.surfaces.surface_type import SurfaceType
+
+# macrobodies are never treated as duplicates, because their facets can be used in the geometry.
+_MACROBODIES = frozenset(
+    {
+        SurfaceType.BOX,
+        SurfaceType.RPP,
+        SurfaceType.SPH,
+        SurfaceType.RCC,
+        SurfaceType.RHP,
+        SurfaceType.HEX,
+        SurfaceType.REC,
+        SurfaceType.TRC,
+        SurfaceType.ELL,
+        SurfaceType.WED,
+        SurfaceType.ARB,
+    }
+)
+
+
+def _group_key(surface):
+    """
+    Gets the key for the group of surfaces this surface could be a duplicate of.
+
+    :param surface: the surface to get the key for.
+    :type surface: Surface
+    :returns: the surface type, and number of surface constants, or None if this can't be a duplicate.
+    :rtype: tuple
+    """
+    # do not assume transform and periodic surfaces are the same.
+    if surface.old_periodic_surface or surface.surface_type in _MACROBODIES:
+        return None
+    constants = surface.surface_constants
+    if not constants or any(constant is None for constant in constants):
+        return None
+    return (surface.surface_type, len(constants))
+
+
+def transforms_match(surface, other, tolerance):
+    """
+    Checks if the transforms of two surfaces are effectively the same.
+
+    :param surface: the surface that would be kept.
+    :type surface: Surface
+    :param other: the surface that would be removed.
+    :type other: Surface
+    :param tolerance: the amount of absolute error to allow.
+    :type tolerance: float
+    :returns: True if neither surface has a transform, or both transforms are equivalent.
+    :rtype: bool
+    """
+    if surface.transform:
+        if other.transform:
+            return surface.transform.equivalent(other.transform, tolerance)
+        return False
+    return other.transform is None
+
+
+def is_duplicate(surface, other, tolerance):
+    """
+    Checks if two different surfaces are effectively the same.
+
+    Two surfaces are the same if they are the same type, every surface constant is within the tolerance,
+    and their transforms are equivalent.
+    Periodic surfaces and macrobodies are never the same as another surface.
+
+    :param surface: the surface that would be kept.
+    :type surface: Surface
+    :param other: the surface that would be removed.
+    :type other: Surface
+    :param tolerance: the amount of absolute error to allow.
+    :type tolerance: float
+    :rtype: bool
+    """
+    if surface is other:
+        return False
+    key = _group_key(surface)
+    if key is None or key != _group_key(other):
+        return False
+    for constant, other_constant in zip(
+        surface.surface_constants, other.surface_constants
+    ):
+        if abs(constant - other_constant) >= tolerance:
+            return False
+    return transforms_match(surface, other, tolerance)
+
+
+def _close_pairs(constants, tolerance):
+    """
+    Finds all pairs of rows where every element is within the tolerance.
+
+    The rows are projected onto a single weighted sum.
+    Rows that are close in every element must be close in their projection,
+    so the rows are sorted by their projection, and only rows within a window
+    of the projection are compared element by element.
+
+    :param constants: the surface constants with one row per surface.
+    :type constants: numpy.ndarray
+    :param tolerance: the amount of absolute error to allow.
+    :type tolerance: float
+    :returns: the indices of the first and second rows of each pair.
+    :rtype: tuple
+    """
+    length, width = constants.shape
+    weights = np.linspace(1.0, 2.0, width)
+    projection = constants @ weights
+    order = np.argsort(projection, kind="stable")
+    projection = projection[order]
+    # widen the window to cover rounding errors; the candidates are checked exactly after.
+    rounding = 8 * width * np.finfo(float).eps * np.abs(projection).max()
+    window = tolerance * weights.sum() + rounding
+    ends = np.searchsorted(projection, projection + window, side="right")
+    counts = np.maximum(ends - np.arange(length) - 1, 0)
+    first = np.repeat(np.arange(length), counts)
+    run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + np.arange(len(first)) - run_starts + 1
+    first = order[first]
+    second = order[second]
+    close = np.all(np.abs(constants[first] - constants[second]) < tolerance, axis=1)
+    return first[close], second[close]
+
+
+def find_duplicate_candidates(surfaces, tolerance):
+    """
+    Finds all pairs of surfaces that have the same type, and surface constants within the tolerance.
+
+    The surfaces are grouped by their type, and the surface constants of each group are compared as NumPy arrays.
+    This takes roughly :math:`O(N\\log N)` time, instead of comparing every pair of surfaces.
+    Transforms are not checked; use :func:`transforms_match` for that.
+
+    :param surfaces: the surfaces to search.
+    :type surfaces: iterable
+    :param tolerance: the amount of absolute error to allow.
+    :type tolerance: float
+    :returns: a dictionary mapping the ``id`` of a surface to a list of its candidate duplicates.
+    :rtype: dict
+    """
+    groups = collections.defaultdict(list)
+    for surface in surfaces:
+        key = _group_key(surface)
+        if key is not None:
+            groups[key].append(surface)
+    candidates = collections.defaultdict(list)
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        constants = np.array(
+            [surface.surface_constants for surface in group], dtype=float
+        )
+        for first, second in zip(*_close_pairs(constants, tolerance)):
+            candidates[id(group[first])].append(group[second])
+            candidates[id(group[second])].append(group[first])
+    return candidates
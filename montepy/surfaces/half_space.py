@@ -201,6 +201,7 @@ class HalfSpace:
                     )
                 if item not in parent:
                     parent.append(item)
+        self._cell._links_changed()
 
     def remove_duplicate_surfaces(self, deleting_dict):
         """Updates old surface numbers to prepare for deleting surfaces.
@@ -554,6 +555,7 @@ class UnitHalfSpace(HalfSpace):
                 container = self._cell.surfaces
             if div not in container:
                 container.append(div)
+            self._cell._links_changed()
 
     @make_prop_pointer("_is_cell", bool)
     def is_cell(self):
@@ -5,7 +5,7 @@ from montepy.data_inputs import transform
 from montepy.input_parser import syntax_node
 from montepy.input_parser.surface_parser import SurfaceParser
 from montepy.numbered_mcnp_object import Numbered_MCNP_Object
-from montepy.surfaces import half_space
+from montepy.surfaces import duplicate_finder, half_space
 from montepy.surfaces.surface_type import SurfaceType
 from montepy.utilities import *
 import re
@@ -197,9 +197,7 @@ class Surface(Numbered_MCNP_Object):
         :rtype: generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if self in cell.surfaces:
-                    yield cell
+            yield from self._problem._find_linked_cells("surfaces", self)
 
     def __str__(self):
         return f"SURFACE: {self.number}, {self.surface_type}"
@@ -235,10 +233,16 @@ class Surface(Numbered_MCNP_Object):
                     self.old_periodic_surface,
                 )
         if self.old_transform_number:
-            for input in data_inputs:
-                if isinstance(input, transform.Transform):
-                    if input.number == self.old_transform_number:
-                        self._transform = input
+            # use the problem's transforms, which are indexed by number
+            if self._problem:
+                self._transform = self._problem.transforms.get(
+                    self.old_transform_number, self._transform
+                )
+            else:
+                for input in data_inputs:
+                    if isinstance(input, transform.Transform):
+                        if input.number == self.old_transform_number:
+                            self._transform = input
             if not self.transform:
                 raise BrokenObjectLinkError(
                     "Surface",
@@ -291,6 +295,13 @@ class Surface(Numbered_MCNP_Object):
     def find_duplicate_surfaces(self, surfaces, tolerance):
         """Finds all surfaces that are effectively the same as this one.
 
+        Surfaces are the same if they are the same type, all surface constants are within the tolerance,
+        and their transforms are equivalent.
+        Periodic surfaces and macrobodies are never considered the same as another surface.
+
+        .. versionchanged:: 0.5.5
+            This is now implemented for all surface types, and not just planes and cylinders.
+
         :param surfaces: a list of the surfaces to compare against this one.
         :type surfaces: list
         :param tolerance: the amount of relative error to allow
@@ -299,7 +310,11 @@ class Surface(Numbered_MCNP_Object):
         :returns: A list of the surfaces that are identical
         :rtype: list
         """
-        return []
+        return [
+            surface
+            for surface in surfaces
+            if duplicate_finder.is_duplicate(self, surface, tolerance)
+        ]
 
     def __neg__(self):
         return half_space.UnitHalfSpace(self, False, False)
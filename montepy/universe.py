@@ -39,9 +39,7 @@ class Universe(Numbered_MCNP_Object):
         :rtype: Generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if cell.universe == self:
-                    yield cell
+            yield from self._problem._find_linked_cells("universe", self)
 
     def claim(self, cells):
         """
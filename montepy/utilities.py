@@ -51,6 +51,24 @@ def is_comment(line):
     return blank_comment
 
 
+def _skip_exception_context(func):
+    """
+    Marks a function as too simple to need exception context added to its errors.
+
+    :class:`~montepy.mcnp_object.MCNP_Object` will not wrap these functions,
+    which avoids an extra call on every use of hot and trivial functions like property getters.
+
+    .. versionadded:: 0.5.5
+
+    :param func: the function to mark.
+    :type func: function
+    :returns: the same function.
+    :rtype: function
+    """
+    func._skip_exception_context = True
+    return func
+
+
 def make_prop_val_node(
     hidden_param, types=None, base_type=None, validator=None, deletable=False
 ):
@@ -73,7 +91,6 @@ def make_prop_val_node(
     """
 
     def decorator(func):
-        @property
         @functools.wraps(func)
         def getter(self):
             result = func(self)
@@ -85,6 +102,7 @@ def make_prop_val_node(
                     return None
                 return val.value
 
+        getter = property(_skip_exception_context(getter))
         if types is not None:
 
             def setter(self, value):
@@ -138,7 +156,6 @@ def make_prop_pointer(
     """
 
     def decorator(func):
-        @property
         @functools.wraps(func)
         def getter(self):
             result = func(self)
@@ -146,6 +163,7 @@ def make_prop_pointer(
                 return result
             return getattr(self, hidden_param)
 
+        getter = property(_skip_exception_context(getter))
         if types is not None:
 
             def setter(self, value):
@@ -73,6 +73,29 @@ class testDataInputClass(TestCase):
                 card = parse_data(input_card)
                 self.assertIsInstance(card, identifiers[ident.lower()])
 
+    def test_data_parser_sniff_prefix(self):
+        in_strs = [
+            "m235 1001.80c 1.0",
+            "MT235 grph.29t",
+            "*tr601 0.0 0.0 10.",
+            "imp:n,p 1 1",
+            "f4:n 1",
+            "fm4 1",
+            "sdef erg=1.0",
+            "kcode 1000 1.0 5 50",
+            "vol no 1",
+        ]
+        for in_str in in_strs:
+            lines = ["c foo", "C", in_str]
+            input = Input(lines, BlockType.DATA)
+            sniffed = montepy.data_inputs.data_parser._sniff_prefix(input)
+            classified = DataInput(input, fast_parse=True)
+            self.assertEqual(sniffed, classified.prefix)
+            data = parse_data(input)
+            self.assertEqual(data.prefix, sniffed)
+        input = Input(["c foo", "  $ bar"], BlockType.DATA)
+        self.assertIsNone(montepy.data_inputs.data_parser._sniff_prefix(input))
+
     def test_data_card_mutate_print(self):
         in_str = "IMP:N 1 1"
         input_card = Input([in_str], BlockType.DATA)
@@ -101,3 +101,27 @@ def test_write_guardrails(writer, exception, clearer):
             clearer(out_file)
         except FileNotFoundError:
             pass
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 20])
+def test_read_replace_non_ascii(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(MCNP_InputFile, "_CHUNK_SIZE", chunk_size)
+    path = tmp_path / "non_ascii.imcnp"
+    path.write_bytes(
+        "title café\r\n1 0 -1\rimp:n=1 $ ½\n\x0c\n\n2 0 1\x7f".encode("utf-8")
+    )
+    input_file = MCNP_InputFile(str(path))
+    with input_file.open("r"):
+        lines = []
+        for line in input_file:
+            lines.append(line)
+            # stopping, and resuming should not lose any lines.
+            break
+        lines += list(input_file)
+    assert lines == [
+        "title caf  \n",
+        "1 0 -1\nimp:n=1 $   \n",
+        "\x0c\n",
+        "\n",
+        "2 0 1 ",
+    ]
@@ -1,6 +1,7 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 import copy
 import io
+import pickle
 from pathlib import Path
 
 import pytest
@@ -8,6 +9,7 @@ import os
 
 import montepy
 from montepy.data_inputs import material, volume
+from montepy.input_parser.block_type import BlockType
 from montepy.input_parser.mcnp_input import (
     Input,
     Jump,
@@ -361,6 +363,75 @@ def test_reverse_pointers(simple_problem):
     assert len(cells) == 2
 
 
+def test_reverse_pointers_updated(simple_problem):
+    problem = copy.deepcopy(simple_problem)
+    cell = problem.cells[2]
+    material = problem.materials[1]
+    surface = problem.surfaces[1010]
+    cell.material = material
+    assert list(material.cells) == [problem.cells[1], cell]
+    assert cell not in problem.materials[2].cells
+    cell.geometry &= +surface
+    assert cell in surface.cells
+    complement = problem.cells[5]
+    problem.cells.remove(complement)
+    assert list(problem.cells[99].cells_complementing_this) == []
+    problem.cells.append(complement)
+    assert list(problem.cells[99].cells_complementing_this) == [complement]
+    universe = montepy.Universe(5)
+    problem.universes.append(universe)
+    universe.claim(cell)
+    assert list(universe.cells) == [cell]
+    assert cell not in problem.universes[0].cells
+    new_cell = cell.clone()
+    assert new_cell in material.cells
+    assert new_cell in surface.cells
+    unpickled = pickle.loads(pickle.dumps(problem))
+    assert list(unpickled.materials[1].cells) == [
+        unpickled.cells[1],
+        unpickled.cells[2],
+        unpickled.cells[new_cell.number],
+    ]
+
+
+def test_reverse_pointers_cell_collections(simple_problem):
+    problem = copy.deepcopy(simple_problem)
+    cell = problem.cells[1]
+    surface = problem.surfaces[1005]
+    gold = [c for c in problem.cells if c is not cell and surface in c.surfaces]
+    assert list(surface.cells) == gold
+    cell.surfaces.append(surface)
+    assert list(surface.cells) == [cell] + gold
+    cell.surfaces.remove(surface)
+    assert list(surface.cells) == gold
+    other = problem.cells[3]
+    cell.complements.append(other)
+    assert cell in other.cells_complementing_this
+    cell.complements.remove(other)
+    assert cell not in other.cells_complementing_this
+
+
+def test_reverse_pointers_order(simple_problem):
+    problem = copy.deepcopy(simple_problem)
+    for collection, kind in [
+        (problem.surfaces, "surfaces"),
+        (problem.materials, "material"),
+    ]:
+        # index the cells in reverse order
+        for cell in reversed(list(problem.cells)):
+            cell._links_changed()
+        for obj in collection:
+            if kind == "surfaces":
+                gold = [cell for cell in problem.cells if obj in cell.surfaces]
+            else:
+                gold = [cell for cell in problem.cells if cell.material == obj]
+            assert list(obj.cells) == gold
+    # equal materials are still matched
+    material = problem.materials[1]
+    problem.cells[2].material = copy.deepcopy(material)
+    assert [cell.number for cell in material.cells] == [1, 2]
+
+
 def test_surface_card_pass_through():
     problem = montepy.read_input("tests/inputs/test_surfaces.imcnp")
     surf = problem.surfaces[1]
@@ -391,6 +462,15 @@ def test_surface_broken_link():
         montepy.read_input("tests/inputs/test_broken_transform_link.imcnp")
 
 
+def test_surface_transform_link():
+    problem = montepy.read_input(
+        io.StringIO("title\n1 0 -1 -2\n\n1 5 PZ 0\n2 5 PZ 1\n\ntr5 0 0 1\n")
+    )
+    transform = problem.transforms[5]
+    for surface in problem.surfaces:
+        assert surface.transform is transform
+
+
 def test_material_broken_link():
     with pytest.raises(montepy.errors.BrokenObjectLinkError):
         problem = montepy.read_input("tests/inputs/test_broken_mat_link.imcnp")
@@ -573,6 +653,28 @@ def test_importance_write_mutated(importance_problem):
     fh.close()
 
 
+def test_importance_write_cell_split_particles(importance_problem):
+    problem = copy.deepcopy(importance_problem)
+    problem.print_in_data_block["imp"] = False
+    problem.cells[1].importance.photon = 0.5
+    with pytest.warns(LineExpansionWarning):
+        output = "\n".join(problem.cells[1].format_for_mcnp_input((6, 2, 0)))
+    assert "imp:n=1" in output
+    assert "imp:p=0.5" in output
+    # the other cells shouldn't be split up
+    output = "\n".join(problem.cells[2].format_for_mcnp_input((6, 2, 0)))
+    assert "imp:n,p=1" in output
+
+
+def test_blank_cells_modifiers():
+    cells = montepy.cells.Cells()
+    assert "_volume" not in vars(cells)
+    assert cells.allow_mcnp_volume_calc
+    assert "_volume" in vars(cells)
+    with pytest.raises(AttributeError):
+        cells._foo
+
+
 def test_importance_write_cell(importance_problem):
     for state in ["no change", "new unmutated cell", "new mutated cell"]:
         fh = io.StringIO()
@@ -970,6 +1072,12 @@ def test_fill_cell_format(simple_problem, universe_problem):
     output = fill.format_for_mcnp_input((6, 2, 0))
     answers = ["fill= 0:1 0:1 0:0 1 0 R 1 (5)"]
     assert output == answers
+    universes = fill.universes.copy()
+    universes[0, 1, 0] = problem.universes[1]
+    universes[1, 1, 0] = problem.universes[0]
+    fill.universes = universes
+    output = fill.format_for_mcnp_input((6, 2, 0))
+    assert output == ["fill= 0:1 0:1 0:0 1 R 0 0 (5)"]
     problem.print_in_data_block["FILL"] = True
     # test that complex fill is not printed in data block
     with pytest.raises(ValueError):
@@ -1109,6 +1217,91 @@ def test_alternate_encoding():
     )
 
 
+def _write_to_string(problem):
+    fh = io.StringIO()
+    fh.close = lambda: None
+    problem.write_problem(fh)
+    return fh.getvalue()
+
+
+@pytest.fixture
+def force_parallel(monkeypatch):
+    monkeypatch.setattr(montepy.mcnp_problem, "_MIN_PARALLEL_INPUTS", 0)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+
+@pytest.mark.parametrize(
+    "file", ["test.imcnp", "test_universe.imcnp", "testRead.imcnp"]
+)
+def test_parallel_parse(file, force_parallel):
+    path = os.path.join("tests", "inputs", file)
+    serial = montepy.read_input(path)
+    parallel = montepy.read_input(path, workers=2)
+    assert _write_to_string(parallel) == _write_to_string(serial)
+    assert [type(i) for i in parallel.original_inputs] == [
+        type(i) for i in serial.original_inputs
+    ]
+    for cell in parallel.cells:
+        assert cell._problem is parallel
+        assert cell._input.input_file is not None
+        if cell.material:
+            assert cell.material is parallel.materials[cell.material.number]
+        for surf in cell.surfaces:
+            assert surf is parallel.surfaces[surf.number]
+
+
+@pytest.mark.parametrize(
+    "file, error",
+    [
+        ("test_bad_syntax.imcnp", ParsingError),
+        ("number_conflict_pin_cell.imcnp", NumberConflictError),
+        ("testVerticalMode.imcnp", UnsupportedFeature),
+    ],
+)
+def test_parallel_parse_errors(file, error, force_parallel):
+    with pytest.raises(error):
+        montepy.read_input(os.path.join("tests", "inputs", file), workers=2)
+
+
+@pytest.mark.parametrize("cpus, min_inputs", [(1, 0), (2, 10_000)])
+def test_parallel_parse_serial_fallback(monkeypatch, cpus, min_inputs):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("A process pool should not be started.")
+
+    monkeypatch.setattr(montepy.mcnp_problem, "_MIN_PARALLEL_INPUTS", min_inputs)
+    monkeypatch.setattr(montepy.mcnp_problem, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+    path = os.path.join("tests", "inputs", "test.imcnp")
+    problem = montepy.read_input(path, workers=2)
+    assert _write_to_string(problem) == _write_to_string(montepy.read_input(path))
+
+
+@pytest.mark.parametrize("cpus, expected", [(2, 2), (None, 9)])
+def test_parallel_parse_worker_cap(monkeypatch, cpus, expected):
+    pools = []
+    real_pool = montepy.mcnp_problem.ProcessPoolExecutor
+
+    def record_pool(max_workers):
+        pools.append(max_workers)
+        return real_pool(max_workers=2)
+
+    monkeypatch.setattr(montepy.mcnp_problem, "_MIN_PARALLEL_INPUTS", 0)
+    monkeypatch.setattr(montepy.mcnp_problem, "ProcessPoolExecutor", record_pool)
+    monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+    path = os.path.join("tests", "inputs", "test.imcnp")
+    problem = montepy.read_input(path, workers=9)
+    assert pools == [expected]
+    assert _write_to_string(problem) == _write_to_string(montepy.read_input(path))
+
+
+def test_parallel_parse_bad_workers():
+    path = os.path.join("tests", "inputs", "test.imcnp")
+    with pytest.raises(TypeError):
+        montepy.read_input(path, workers="2")
+    with pytest.raises(ValueError):
+        montepy.read_input(path, workers=0)
+
+
 _SKIP_LINES = {
     # skip lines of added implied importances
     "tests/inputs/test_universe_data.imcnp": {5: True, 14: True, 15: True},
@@ -1166,3 +1359,280 @@ def test_read_write_cycle(file):
                     )
                 else:
                     raise e
+
+
+@pytest.mark.parametrize(
+    "file", ["test.imcnp", "test_universe.imcnp", "testRead.imcnp"]
+)
+def test_lazy_parse(file):
+    path = os.path.join("tests", "inputs", file)
+    problem = montepy.read_input(path)
+    lazy = montepy.read_input(path, lazy=True)
+    assert not lazy.is_parsed
+    assert lazy.title.title == problem.title.title
+    assert len(lazy.original_inputs) == len(problem.original_inputs)
+    assert not lazy.is_parsed
+    assert len(lazy.cells) == len(problem.cells)
+    assert lazy.is_parsed
+    assert _write_to_string(lazy) == _write_to_string(problem)
+    for cell in lazy.cells:
+        assert cell._problem is lazy
+
+
+def test_lazy_parse_write_verbatim(tmp_path):
+    path = os.path.join("tests", "inputs", "test.imcnp")
+    lazy = montepy.read_input(path, lazy=True)
+    out = tmp_path / "out.imcnp"
+    lazy.write_problem(out)
+    assert not lazy.is_parsed
+    with open(out) as fh:
+        lines = fh.read().splitlines()
+    for input in lazy.original_inputs:
+        if isinstance(input, Input):
+            for line in input.input_lines:
+                assert line in lines
+    original = montepy.read_input(path)
+    new_problem = montepy.read_input(out)
+    assert _write_to_string(new_problem) == _write_to_string(original)
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_lazy_parse_modify():
+    path = os.path.join("tests", "inputs", "test.imcnp")
+    lazy = montepy.read_input(path, lazy=True)
+    lazy.materials[1].number = 100
+    output = _write_to_string(lazy)
+    assert "m100" in output.lower()
+
+
+def test_lazy_parse_errors():
+    path = os.path.join("tests", "inputs", "test_bad_syntax.imcnp")
+    lazy = montepy.read_input(path, lazy=True)
+    with pytest.raises(ParsingError):
+        lazy.cells
+    # the error is raised again, instead of returning a partially linked problem
+    path = os.path.join("tests", "inputs", "test_broken_mat_link.imcnp")
+    lazy = montepy.read_input(path, lazy=True)
+    for _ in range(2):
+        with pytest.raises(BrokenObjectLinkError):
+            lazy.cells
+    assert not lazy.is_parsed
+
+
+@pytest.mark.parametrize(
+    "file", ["test.imcnp", "test_universe.imcnp", "testRead.imcnp"]
+)
+def test_iter_inputs(file):
+    path = os.path.join("tests", "inputs", file)
+    problem = montepy.read_input(path)
+    found = list(montepy.iter_inputs(path))
+    objs = [obj for _, _, obj in found]
+    assert [type(obj) for obj in objs if isinstance(obj, montepy.Cell)] == [
+        type(cell) for cell in problem.cells
+    ]
+    assert [cell.number for cell in objs if isinstance(cell, montepy.Cell)] == [
+        cell.number for cell in problem.cells
+    ]
+    assert [
+        surf.number
+        for block, _, surf in found
+        if block == montepy.input_parser.block_type.BlockType.SURFACE
+    ] == [surf.number for surf in problem.surfaces]
+    for block, line_number, obj in found:
+        assert obj._problem is None
+        assert obj._input.block_type == block
+        assert obj._input.line_number == line_number
+
+
+def test_iter_inputs_stream():
+    with open(os.path.join("tests", "inputs", "test.imcnp")) as fh:
+        cells = [
+            obj
+            for _, _, obj in montepy.iter_inputs(fh)
+            if isinstance(obj, montepy.Cell)
+        ]
+    assert len(cells) == 5
+    assert cells[0].old_mat_number == 1
+    assert cells[0].material is None
+
+
+def test_iter_inputs_errors():
+    path = os.path.join("tests", "inputs", "test_bad_syntax.imcnp")
+    with pytest.raises(ParsingError):
+        list(montepy.iter_inputs(path))
+    with pytest.warns(UserWarning):
+        objs = list(montepy.iter_inputs(path, check_input=True))
+    assert objs == []
+    with pytest.raises(UnsupportedFeature):
+        list(
+            montepy.iter_inputs(
+                os.path.join("tests", "inputs", "testVerticalMode.imcnp")
+            )
+        )
+
+
+@pytest.mark.parametrize("file", ["test.imcnp", "test_universe.imcnp"])
+def test_input_index(file):
+    path = os.path.join("tests", "inputs", file)
+    problem = montepy.read_input(path)
+    with montepy.InputIndex(path) as index:
+        entries = list(index)
+        assert len(index) == len(entries)
+        for cell in problem.cells:
+            new_cell = index.get_cell(cell.number)
+            assert new_cell.number == cell.number
+            assert new_cell.old_mat_number == cell.old_mat_number
+            assert new_cell._input.input_lines == cell._input.input_lines
+            assert new_cell._problem is None
+        for surface in problem.surfaces:
+            new_surface = index.get_surface(surface.number)
+            assert new_surface.surface_type == surface.surface_type
+            assert new_surface.surface_constants == surface.surface_constants
+        for material in problem.materials:
+            new_mat = index.get_data_input("M", material.number)
+            assert new_mat.number == material.number
+            assert new_mat._input.input_lines == material._input.input_lines
+        with pytest.raises(KeyError):
+            index.get_cell(123456)
+        with pytest.raises(KeyError):
+            index.get_data_input("tr", 123456)
+    with open(path, "rb") as fh:
+        data = fh.read()
+    for entry in entries:
+        assert data[: entry.start].count(b"\n") + 1 == entry.line_number
+        assert data[entry.start : entry.end].strip()
+
+
+def test_input_index_non_ascii(tmp_path):
+    path = tmp_path / "index.imcnp"
+    path.write_bytes(
+        "title\nc caf\u00e9\n1 0 -1 $ \u00b5m\n\n1 SO 1\n\nmode n\n".encode("utf-8")
+    )
+    with montepy.InputIndex(str(path)) as index:
+        assert index.get_cell(1)._input.input_lines == ["c caf", "1 0 -1 $   m"]
+    with montepy.InputIndex(str(path), replace=False) as index:
+        assert len(index) == 3
+        with pytest.raises(UnicodeDecodeError):
+            index.get_cell(1)
+        assert index.get_surface(1).surface_constants == [1.0]
+    with montepy.InputIndex(str(path), replace=False, encoding="utf-8") as index:
+        assert index.get_cell(1)._input.input_lines == [
+            "c caf\u00e9",
+            "1 0 -1 $ \u00b5m",
+        ]
+        assert index.get_surface(1).number == 1
+
+
+def test_input_index_message(tmp_path):
+    path = tmp_path / "index.imcnp"
+    path.write_text(
+        "message: foo\n\ntitle\nc comment\n1 0 -1\n     imp:n=1\n"
+        "2 0 1 imp:n=0 &\n3 1\n\n*1 SO 1\n\nm1 1001.80c 1\nmode n\n"
+        "read file=foo.imcnp\nf4:n 1\nimp:n 1 0\nimp:P,e 1 1"
+    )
+    with montepy.InputIndex(str(path)) as index:
+        assert [
+            (
+                entry.block_type,
+                entry.prefix,
+                entry.number,
+                entry.particles,
+                entry.line_number,
+            )
+            for entry in index
+        ] == [
+            (BlockType.CELL, None, 1, None, 4),
+            (BlockType.CELL, None, 2, None, 7),
+            (BlockType.SURFACE, None, 1, None, 10),
+            (BlockType.DATA, "m", 1, None, 12),
+            (BlockType.DATA, "mode", None, None, 13),
+            (BlockType.DATA, "f", 4, ("N",), 15),
+            (BlockType.DATA, "imp", None, ("N",), 16),
+            (BlockType.DATA, "imp", None, ("E", "P"), 17),
+        ]
+        cell = index.get_cell(2)
+        assert cell._input.input_lines == ["2 0 1 imp:n=0 &", "3 1"]
+        assert index.get_surface(1).is_reflecting
+        assert index.get_data_input("F", 4)._input.input_lines == ["f4:n 1"]
+        assert index.find(BlockType.DATA, None, "mode").line_number == 13
+        assert index.find(BlockType.DATA, None, "imp").line_number == 16
+        assert index.find(BlockType.DATA, None, "imp", "N").line_number == 16
+        imp = index.get_data_input("imp", None, "e,p")
+        assert imp._input.input_lines == ["imp:P,e 1 1"]
+        entry = index.find(BlockType.DATA, None, "IMP", [Particle.PHOTON, "e"])
+        assert entry.line_number == 17
+        with pytest.raises(KeyError):
+            index.find(BlockType.DATA, None, "imp", "h")
+    with pytest.raises(UnsupportedFeature):
+        montepy.InputIndex(os.path.join("tests", "inputs", "testVerticalMode.imcnp"))
+
+
+def test_problem_to_arrays(importance_problem):
+    arrays = importance_problem.to_arrays()
+    cells = arrays["cells"]
+    assert list(cells["number"]) == list(importance_problem.cells.numbers)
+    assert list(cells["material"]) == [1, 2, 3, 0, 0]
+    assert cells["atom_density"][0] == pytest.approx(20.0)
+    assert np.isnan(cells["atom_density"][2])
+    assert cells["mass_density"][2] == pytest.approx(1.0)
+    assert np.isnan(cells["volume"][0])
+    assert cells["volume"][1] == pytest.approx(3.5)
+    assert cells["universe"][0] == 350
+    assert list(cells["importance_neutron"]) == [1.0, 1.0, 1.0, 0.0, 3.0]
+    assert list(cells["importance_electron"]) == [0.0, 0.0, 0.0, 1.0, 1.0]
+    surfaces = arrays["surfaces"]
+    assert list(surfaces["number"]) == [1000, 1005, 1010]
+    assert list(surfaces["surface_type"]) == ["SO", "RCC", "SO"]
+    assert not surfaces["is_reflecting"].any()
+    materials = arrays["materials"]
+    assert list(materials["number"]) == [1, 2, 3]
+    assert list(materials["thermal_scattering"]) == [False, False, True]
+    # the materials can be joined to the cells
+    used = np.isin(materials["number"], cells["material"])
+    assert used.all()
+    assert len(montepy.cells.Cells().to_array()) == 0
+
+
+def test_cells_bulk_setters(importance_problem):
+    problem = copy.deepcopy(importance_problem)
+    cells = problem.cells
+    cells.set_densities([1, 2], np.array([0.5, 0.25]))
+    assert cells[1].atom_density == pytest.approx(0.5)
+    assert cells[2].atom_density == pytest.approx(0.25)
+    cells.set_densities([3], [2], kind="mass")
+    assert cells[3].mass_density == pytest.approx(2.0)
+    assert "-2" in cells[3].format_for_mcnp_input((6, 2, 0))[0]
+    cells.set_materials([1, 2], [3, 0])
+    assert cells[1].material is problem.materials[3]
+    assert cells[2].material is None
+    assert cells[1] in list(problem.materials[3].cells)
+    cells.set_importances(montepy.Particle.NEUTRON, [1, 99], [0.5, 2])
+    assert cells[1].importance.neutron == pytest.approx(0.5)
+    assert cells[99].importance.neutron == pytest.approx(2.0)
+    # nothing is changed if any input is bad
+    with pytest.raises(ValueError):
+        cells.set_densities([1, 2], [1.0, -1.0])
+    assert cells[1].atom_density == pytest.approx(0.5)
+    with pytest.raises(ValueError):
+        cells.set_densities([1, 2], [1.0])
+    with pytest.raises(ValueError):
+        cells.set_densities([1], [1.0], kind="foo")
+    with pytest.raises(TypeError):
+        cells.set_densities([1], ["a"])
+    with pytest.raises(TypeError):
+        cells.set_densities([1.5], [1.0])
+    with pytest.raises(KeyError):
+        cells.set_densities([1, 1000], [1.0, 1.0])
+    with pytest.raises(KeyError):
+        cells.set_materials([1, 2], [1, 1000])
+    assert cells[1].material is problem.materials[3]
+    with pytest.raises(TypeError):
+        cells.set_materials([1], [1.5])
+    with pytest.raises(ValueError):
+        montepy.cells.Cells().set_materials([], [])
+    with pytest.raises(TypeError):
+        cells.set_importances("n", [1], [1.0])
+    with pytest.raises(ValueError):
+        cells.set_importances(montepy.Particle.NEUTRON, [1], [-1.0])
+    with pytest.raises(montepy.errors.ParticleTypeNotInProblem):
+        cells.set_importances(montepy.Particle.NEGATIVE_MUON, [1], [1.0])
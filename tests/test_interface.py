@@ -3,6 +3,9 @@ import io
 import glob
 import montepy
 import os
+import pytest
+import subprocess
+import sys
 import unittest
 from tests import constants
 
@@ -39,3 +42,25 @@ class TestBrinyFermentation(unittest.TestCase):
                     for obj in getattr(new_problem, attr):
                         assert obj._problem is not None
                         assert obj._problem is new_problem
+
+
+def test_lazy_imports():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, montepy; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "montepy.input_parser" not in result.stdout.split()
+    assert "montepy.mcnp_problem" not in result.stdout.split()
+    for name in montepy._LAZY_ATTRIBUTES:
+        assert name in dir(montepy)
+        assert getattr(montepy, name) is not None
+    from montepy.mcnp_problem import MCNP_Problem
+
+    assert montepy.MCNP_Problem is MCNP_Problem
+    assert montepy.input_parser.input_reader.read_input is montepy.read_input
+    with pytest.raises(AttributeError):
+        montepy.foo
+    with pytest.raises(AttributeError):
+        montepy.input_parser.foo
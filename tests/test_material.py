@@ -10,7 +10,7 @@ from montepy.data_inputs.isotope import Isotope
 from montepy.data_inputs.material import Material
 from montepy.data_inputs.material_component import MaterialComponent
 from montepy.data_inputs.thermal_scattering import ThermalScatteringLaw
-from montepy.errors import MalformedInputError, UnknownElement
+from montepy.errors import LineExpansionWarning, MalformedInputError, UnknownElement
 from montepy.input_parser.block_type import BlockType
 from montepy.input_parser.mcnp_input import Input
 
@@ -270,6 +270,111 @@ def test_cell_clone_bad(args, error):
         mat.clone(*args)
 
 
+def test_material_arrays():
+    mat = Material(Input(["m1 1001.80c 2 8016.70c 1 6000.80c 1"], BlockType.DATA))
+    assert list(mat.zaids) == [1001, 8016, 6000]
+    assert list(mat.libraries) == ["80c", "70c", "80c"]
+    fractions = mat.fractions
+    assert list(fractions) == [2.0, 1.0, 1.0]
+    fractions[0] = 4.0
+    output = mat.format_for_mcnp_input((6, 2, 0))
+    assert output == ["m1 1001.80c 4 8016.70c 1 6000.80c 1"]
+    mat.fractions = [1.0, 2.0, 1.0]
+    assert list(mat.fractions) == [1.0, 2.0, 1.0]
+    mat.normalize()
+    assert mat.fractions == pytest.approx([0.25, 0.5, 0.25])
+    mat.fractions[1] = -1.0
+    with pytest.raises(ValueError):
+        mat.format_for_mcnp_input((6, 2, 0))
+    for bad_fractions in [[1.0, 2.0], [1.0, 0.0, 1.0]]:
+        with pytest.raises(ValueError):
+            mat.fractions = bad_fractions
+    # the masses must be given
+    with pytest.raises(ValueError):
+        mat.get_weight_fractions()
+    with pytest.raises(ValueError):
+        mat.get_weight_fractions([1.0, 16.0, 0.0])
+    assert mat.get_weight_fractions([1.0, 16.0, 12.0]) == pytest.approx(
+        [1 / 45, 32 / 45, 12 / 45]
+    )
+
+
+def test_material_fractions_persistent():
+    mat = Material(Input(["m1 1001.80c 2 8016.80c 1"], BlockType.DATA))
+    fractions = mat.fractions
+    assert mat.fractions is fractions
+    fractions[0] = 4.0
+    assert mat.fractions is fractions
+    fractions[1] = 2.0
+    mat.normalize()
+    assert fractions == pytest.approx([2 / 3, 1 / 3])
+    fractions[:] = [1.0, 3.0]
+    assert mat.get_atom_fractions() == pytest.approx([0.25, 0.75])
+    mat.fractions = [1.0, 1.0]
+    assert list(fractions) == [1.0, 1.0]
+    fractions[0] = 0.0
+    with pytest.raises(ValueError):
+        mat.fractions
+    assert list(fractions) == [1.0, 1.0]
+    # the components changed, so the old array is detached
+    isotope = Isotope("2004.80c", suppress_warning=True)
+    with pytest.deprecated_call():
+        mat.material_components[isotope] = MaterialComponent(isotope, 0.5)
+    fractions[1] = 5.0
+    new_fractions = mat.fractions
+    assert new_fractions is not fractions
+    assert list(new_fractions) == [1.0, 5.0, 0.5]
+
+
+def test_material_fraction_conversion():
+    mat = Material(Input(["m1 1001.80c 2 8016.80c 1"], BlockType.DATA))
+    masses = [1.00782503, 15.99491462]
+    water_mass = 2 * masses[0] + masses[1]
+    with pytest.raises(ValueError):
+        mat.convert_to_weight_fraction()
+    assert mat.is_atom_fraction
+    mat.convert_to_weight_fraction(masses)
+    assert not mat.is_atom_fraction
+    assert mat.fractions == pytest.approx(
+        [2 * masses[0] / water_mass, masses[1] / water_mass]
+    )
+    with pytest.warns(LineExpansionWarning):
+        output = mat.format_for_mcnp_input((6, 2, 0))
+    assert output == ["m1 1001.80c -0.111915 8016.80c -0.888085"]
+    with pytest.raises(ValueError):
+        mat.get_atom_fractions()
+    assert mat.get_atom_fractions(masses) == pytest.approx([2 / 3, 1 / 3])
+    mat.convert_to_atom_fraction(masses)
+    assert mat.is_atom_fraction
+    assert mat.fractions == pytest.approx([2 / 3, 1 / 3])
+
+
+def test_material_mix():
+    water = Material(Input(["m1 1001.80c 2 8016.80c 1"], BlockType.DATA))
+    heavy_water = Material(Input(["m2 1002.80c 0.2 8016.80c 0.1"], BlockType.DATA))
+    mix = Material.mix([water, heavy_water], [9, 1])
+    assert mix.number == 3
+    assert mix.is_atom_fraction
+    assert list(mix.zaids) == [1001, 8016, 1002]
+    assert mix.fractions == pytest.approx([0.6, 1 / 3, 2 / 30])
+    assert [isotope.library for isotope in mix.material_components] == ["80c"] * 3
+    output = mix.format_for_mcnp_input((6, 2, 0))
+    assert output[0].startswith("M3 1001.80c 0.6 8016.80c")
+    new_mat = Material(Input(output, BlockType.DATA))
+    assert new_mat.number == 3
+    assert new_mat.fractions == pytest.approx(mix.fractions)
+    mix = Material.mix([water], [1], number=10)
+    assert mix.number == 10
+    assert mix.fractions == pytest.approx([2 / 3, 1 / 3])
+    heavy_water.convert_to_weight_fraction([2.01410178, 15.99491462])
+    with pytest.raises(ValueError):
+        Material.mix([water, heavy_water], [0.5, 0.5])
+    with pytest.raises(ValueError):
+        Material.mix([water, water], [1])
+    with pytest.raises(ValueError):
+        Material.mix([water], [0])
+
+
 class TestIsotope(TestCase):
     def test_isotope_init(self):
         with pytest.warns(FutureWarning):
@@ -284,6 +389,19 @@ class TestIsotope(TestCase):
         with self.assertRaises(ValueError):
             Isotope("hi.80c", suppress_warning=True)
 
+    def test_isotope_parse_cache(self):
+        first = Isotope("95642.80c", suppress_warning=True)
+        second = Isotope("95642.70c", suppress_warning=True)
+        self.assertIn("95642", Isotope._PARSED_ZAIDS)
+        self.assertIsNot(first, second)
+        self.assertIs(first.element, second.element)
+        self.assertEqual(second.library, "70c")
+        self.assertEqual(second.mcnp_str(), "95642.70c")
+        self.assertEqual(second.A, 242)
+        self.assertFalse(second.is_metastable)
+        second.library = "00c"
+        self.assertEqual(first.library, "80c")
+
     def test_isotope_metastable_init(self):
         isotope = Isotope("13426.02c", suppress_warning=True)
         self.assertEqual(isotope.ZAID, "13426")
@@ -8,6 +8,7 @@ from montepy.errors import NumberConflictError
 import unittest
 import pytest
 import os
+import pickle
 
 
 class TestNumberedObjectCollection(unittest.TestCase):
@@ -152,6 +153,22 @@ class TestNumberedObjectCollection(unittest.TestCase):
         with self.assertRaises(ValueError):
             cells.next_number(-1)
 
+    def test_sorted_numbers_updated(self):
+        cells = self.simple_problem.cells
+        self.assertEqual(cells.request_number(1), 4)
+        cells[5].number = 4
+        self.assertEqual(cells.request_number(1), 5)
+        cell = copy.deepcopy(cells[1])
+        cell.number = 5
+        cells.append(cell)
+        self.assertEqual(cells.request_number(1), 6)
+        cells.remove(cells[2])
+        self.assertEqual(cells.request_number(1), 2)
+        self.assertEqual(cells.request_number(3, 2), 7)
+        cells[99].number = 90000000
+        self.assertEqual(cells.next_number(), 90000001)
+        self.assertEqual([c.number for c in cells[2:]], [3, 4, 5, 90000000])
+
     def test_getitem(self):
         cells = self.simple_problem.cells
         list_version = list(cells)
@@ -173,6 +190,42 @@ class TestNumberedObjectCollection(unittest.TestCase):
         with self.assertRaises(TypeError):
             del cells["5"]
 
+    def test_remove_contains(self):
+        cells = copy.deepcopy(self.simple_problem.cells)
+        size = len(cells)
+        cell = cells[2]
+        self.assertIn(cell, cells)
+        cells.remove(cell)
+        self.assertNotIn(cell, cells)
+        self.assertNotIn(5, cells)
+        self.assertEqual(size - 1, len(cells))
+        self.assertIsNone(cells.get(2))
+        with self.assertRaises(ValueError):
+            cells.remove(cell)
+        # equal objects are still found
+        surfaces = copy.deepcopy(self.simple_problem.surfaces)
+        surface = copy.deepcopy(surfaces[1000])
+        self.assertIn(surface, surfaces)
+        surfaces.remove(surface)
+        self.assertNotIn(1000, surfaces.numbers)
+        popped = surfaces.pop(0)
+        self.assertEqual(popped.number, 1005)
+        self.assertEqual(list(surfaces.numbers), [1010, 1015, 1020, 1025])
+        unpickled = pickle.loads(pickle.dumps(surfaces))
+        self.assertIn(unpickled[1010], unpickled)
+        unpickled.remove(unpickled[1010])
+        self.assertEqual(list(unpickled.numbers), [1015, 1020, 1025])
+
+    def test_contains_renumbered(self):
+        problem = copy.deepcopy(self.simple_problem)
+        surface = problem.surfaces[1000]
+        cell = next(cell for cell in problem.cells if surface in cell.surfaces)
+        surface.number = 1001
+        equal = copy.deepcopy(surface)
+        self.assertIn(equal, cell.surfaces)
+        cell.surfaces.remove(equal)
+        self.assertNotIn(surface, cell.surfaces)
+
     def test_setitem(self):
         cells = copy.deepcopy(self.simple_problem.cells)
         cell = cells[1]
@@ -233,6 +286,20 @@ class TestNumberedObjectCollection(unittest.TestCase):
         test_numbers = [m.number for m in self.simple_problem.materials[::2]]
         self.assertEqual([2], test_numbers)
 
+    def test_slice_sparse(self):
+        cells = montepy.cells.Cells()
+        for number in [1, 90000000]:
+            cell = montepy.Cell()
+            cell.number = number
+            cells.append(cell)
+        self.assertEqual([c.number for c in cells[:]], [1, 90000000])
+        self.assertEqual([c.number for c in cells[::-1]], [90000000, 1])
+        self.assertEqual(cells.request_number(1), 2)
+        self.assertEqual(cells.next_number(), 90000001)
+        self.assertEqual(len(montepy.cells.Cells()[:]), 0)
+        with self.assertRaises(ValueError):
+            cells[::0]
+
     def test_get(self):
         cell_found = self.simple_problem.cells.get(1)
         self.assertEqual(self.simple_problem.cells[1], cell_found)
@@ -383,14 +450,45 @@ def test_data_clear(cp_simple_problem):
 
 def test_data_pop(cp_simple_problem):
     old_mat = next(reversed(list(cp_simple_problem.materials)))
+    size = len(cp_simple_problem.materials)
     popper = cp_simple_problem.materials.pop()
     assert popper is old_mat
+    assert len(cp_simple_problem.materials) == size - 1
     assert old_mat not in cp_simple_problem.materials
     assert old_mat not in cp_simple_problem.data_inputs
     with pytest.raises(TypeError):
         cp_simple_problem.materials.pop("foo")
 
 
+@given(
+    numbers=st.sets(st.integers(1, 10_000_000), max_size=20),
+    start=st.one_of(st.none(), st.integers(0, 10_000_000)),
+    stop=st.one_of(st.none(), st.integers(0, 10_000_000)),
+    step=st.integers(-1_000_000, 1_000_000).filter(lambda step: step != 0),
+)
+def test_num_collect_slice_matches_range(numbers, start, stop, step):
+    cells = []
+    for number in numbers:
+        cell = montepy.Cell()
+        cell.number = number
+        cells.append(cell)
+    cells = montepy.cells.Cells(cells)
+    sliced = [cell.number for cell in cells[start:stop:step]]
+    if not numbers:
+        assert sliced == []
+        return
+    if step < 0:
+        start = max(numbers) if start is None else start
+        stop = (min(numbers) if stop is None else stop) - 1
+        expected = sorted(numbers, reverse=True)
+    else:
+        start = 0 if start is None else start
+        stop = (max(numbers) if stop is None else stop) + 1
+        expected = sorted(numbers)
+    valid = range(start, stop, step)
+    assert sliced == [number for number in expected if number in valid]
+
+
 # disable function scoped fixtures
 @settings(suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture])
 @given(start_num=st.integers(), step=st.integers())
@@ -0,0 +1,143 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import io
+import os
+import shutil
+
+import pytest
+
+import montepy
+from montepy.input_parser import parse_cache
+
+
+def _copy_inputs(tmp_path, *files):
+    for file in files:
+        shutil.copy(os.path.join("tests", "inputs", file), tmp_path / file)
+
+
+def _write_to_string(problem):
+    fh = io.StringIO()
+    fh.close = lambda: None
+    problem.write_problem(fh)
+    return fh.getvalue()
+
+
+def test_cache_hit(tmp_path):
+    _copy_inputs(tmp_path, "test.imcnp")
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "test.imcnp"
+    problem = montepy.read_input(path, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+    cached = montepy.read_input(path, cache_dir=cache_dir)
+    assert cached is not problem
+    assert _write_to_string(cached) == _write_to_string(problem)
+    for cell in cached.cells:
+        assert cell._problem is cached
+        if cell.material:
+            assert cell.material is cached.materials[cell.material.number]
+
+
+def test_cache_key_changes(tmp_path):
+    _copy_inputs(tmp_path, "test.imcnp")
+    path = tmp_path / "test.imcnp"
+    key = parse_cache.problem_cache_key(path, (6, 2, 0))
+    assert key == parse_cache.problem_cache_key(path, (6, 2, 0))
+    assert key != parse_cache.problem_cache_key(path, (6, 3, 0))
+    assert key != parse_cache.problem_cache_key(path, (6, 2, 0), False)
+    with open(path, "a") as fh:
+        fh.write("c new comment\n")
+    assert key != parse_cache.problem_cache_key(path, (6, 2, 0))
+
+
+def test_cache_file_changed(tmp_path):
+    _copy_inputs(tmp_path, "testRead.imcnp", "testReadTarget.imcnp")
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "testRead.imcnp"
+    problem = montepy.read_input(path, cache_dir=cache_dir)
+    assert list(problem.cells.keys()) == [1]
+    with open(tmp_path / "testReadTarget.imcnp", "w") as fh:
+        fh.write("2 0 -1\n")
+    problem = montepy.read_input(path, cache_dir=cache_dir)
+    assert list(problem.cells.keys()) == [2]
+
+
+def test_cache_corrupt(tmp_path):
+    _copy_inputs(tmp_path, "test.imcnp")
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "test.imcnp"
+    montepy.read_input(path, cache_dir=cache_dir)
+    for cache_file in os.listdir(cache_dir):
+        with open(cache_dir / cache_file, "wb") as fh:
+            fh.write(b"not a pickle")
+    assert parse_cache.load_problem(path, cache_dir, (6, 2, 0)) is None
+    problem = montepy.read_input(path, cache_dir=cache_dir)
+    assert len(problem.cells) == 5
+    assert parse_cache.load_problem(path, cache_dir, (6, 2, 0)) is not None
+
+
+def test_cache_stream_ignored(tmp_path):
+    cache_dir = tmp_path / "cache"
+    with open(os.path.join("tests", "inputs", "test.imcnp")) as fh:
+        problem = montepy.read_input(fh, cache_dir=cache_dir)
+    assert len(problem.cells) == 5
+    assert not os.path.exists(cache_dir)
+
+
+def test_input_cache_reuse(tmp_path):
+    _copy_inputs(tmp_path, "test.imcnp")
+    path = tmp_path / "test.imcnp"
+    cache = parse_cache.InputCache()
+    problem = montepy.read_input(path, input_cache=cache)
+    assert cache.hits == 0
+    assert cache.misses > 0
+    total = cache.misses
+    assert len(cache) > 0
+    cached = montepy.read_input(path, input_cache=cache)
+    assert cache.hits == total
+    assert cache.misses == 0
+    assert _write_to_string(cached) == _write_to_string(problem)
+    for cell in cached.cells:
+        assert cell._problem is cached
+        assert cell._input.input_file is not None
+        if cell.material:
+            assert cell.material is cached.materials[cell.material.number]
+    cached.cells[1].number = 50
+    assert problem.cells[1].number == 1
+
+
+def test_input_cache_edited(tmp_path):
+    _copy_inputs(tmp_path, "test.imcnp")
+    path = tmp_path / "test.imcnp"
+    cache = parse_cache.InputCache()
+    montepy.read_input(path, input_cache=cache)
+    old_size = len(cache)
+    with open(path) as fh:
+        text = fh.read()
+    with open(path, "w") as fh:
+        fh.write(text.replace("1020 PZ 10", "1020 PZ 12"))
+    problem = montepy.read_input(path, input_cache=cache)
+    assert cache.misses == 1
+    assert len(cache) == old_size
+    assert problem.surfaces[1020].location == pytest.approx(12)
+    assert problem.surfaces[1020] in problem.cells[2].surfaces
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_store_failure(tmp_path, monkeypatch):
+    _copy_inputs(tmp_path, "test.imcnp")
+    path = tmp_path / "test.imcnp"
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+    with pytest.warns(UserWarning, match="could not be cached"):
+        problem = montepy.read_input(path, cache_dir=blocker / "cache")
+    assert len(problem.cells) == 5
+    cache_dir = tmp_path / "cache"
+
+    def bad_dump(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(parse_cache.pickle, "dump", bad_dump)
+    with pytest.warns(UserWarning, match="disk full"):
+        problem = montepy.read_input(path, cache_dir=cache_dir)
+    assert len(problem.cells) == 5
+    assert os.listdir(cache_dir) == []
@@ -1,5 +1,6 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from unittest import TestCase
+import io
 
 import montepy
 
@@ -9,6 +10,7 @@ from montepy.input_parser.mcnp_input import Input
 from montepy.surfaces.axis_plane import AxisPlane
 from montepy.surfaces.cylinder_on_axis import CylinderOnAxis
 from montepy.surfaces.cylinder_par_axis import CylinderParAxis
+from montepy.surfaces import duplicate_finder
 from montepy.surfaces.general_plane import GeneralPlane
 from montepy.surfaces.surface import Surface
 from montepy.surfaces.surface_builder import surface_builder
@@ -304,3 +306,53 @@ class testSurfaces(TestCase):
         # test length issues
         with self.assertRaises(ValueError):
             surf.coordinates = [3, 4, 5]
+
+    def test_find_duplicate_surfaces(self):
+        problem = montepy.read_input(
+            io.StringIO(
+                "\n".join(
+                    [
+                        "duplicate surfaces",
+                        "1 0 -1 imp:n=1",
+                        "2 0 1 imp:n=0",
+                        "",
+                        "1 SO 1.0",
+                        "2 SO 1.00001",
+                        "3 GQ 1 2 3 4 5 6 7 8 9 10",
+                        "4 GQ 1 2 3 4 5 6 7 8 9 10.00001",
+                        "5 -1 PZ 1.0",
+                        "6 PZ 1.0",
+                        "7 1 PZ 1.0",
+                        "8 RPP 0 1 0 1 0 1",
+                        "9 RPP 0 1 0 1 0 1",
+                        "",
+                        "tr1 0 0 0",
+                        "mode n",
+                    ]
+                )
+                + "\n"
+            )
+        )
+        surfs = problem.surfaces
+        self.assertEqual(surfs[1].find_duplicate_surfaces(surfs, 1e-4), [surfs[2]])
+        self.assertEqual(surfs[3].find_duplicate_surfaces(surfs, 1e-4), [surfs[4]])
+        self.assertEqual(surfs[3].find_duplicate_surfaces(surfs, 1e-6), [])
+        # periodic surfaces and macrobodies are never duplicates
+        self.assertEqual(surfs[5].find_duplicate_surfaces(surfs, 1e-4), [])
+        self.assertNotIn(surfs[5], surfs[6].find_duplicate_surfaces(surfs, 1e-4))
+        self.assertEqual(surfs[8].find_duplicate_surfaces(surfs, 1e-4), [])
+        # transformed surfaces are different
+        self.assertEqual(surfs[6].find_duplicate_surfaces(surfs, 1e-4), [])
+        candidates = duplicate_finder.find_duplicate_candidates(surfs, 1e-4)
+        for surf in surfs:
+            expected = {
+                id(other)
+                for other in surfs
+                if duplicate_finder.is_duplicate(surf, other, 1e-4)
+            }
+            found = {
+                id(other)
+                for other in candidates.get(id(surf), [])
+                if duplicate_finder.transforms_match(surf, other, 1e-4)
+            }
+            self.assertEqual(found, expected)
@@ -1,5 +1,8 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 import copy
+import pickle
+import os
+import sys
 from io import StringIO
 import pytest
 from unittest import TestCase
@@ -10,6 +13,7 @@ from montepy.input_parser import input_syntax_reader
 from montepy.input_parser.mcnp_input import Input, Jump, Message, ReadInput, Title
 from montepy.input_parser.block_type import BlockType
 from montepy.input_parser.input_file import MCNP_InputFile
+from montepy.input_parser import parser_base
 from montepy.input_parser.parser_base import MCNP_Parser
 from montepy.input_parser.shortcuts import Shortcuts
 from montepy.input_parser import syntax_node
@@ -1053,6 +1057,86 @@ class ShortcutGeometryTestFixture(montepy.input_parser.cell_parser.CellParser):
         return p[0]
 
 
+def test_parser_table_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("MONTEPY_CACHE_DIR", str(tmp_path))
+
+    class CacheTestFixture(MCNP_Parser):
+        @_("number_sequence")
+        def sequence(self, p):
+            return p[0]
+
+    # tables aren't built until the parser is used
+    assert "_lrtable" not in vars(CacheTestFixture)
+    CacheTestFixture._build_tables()
+    built = CacheTestFixture._lrtable
+    assert not isinstance(built, parser_base._CachedLRTable)
+    assert len(list(tmp_path.iterdir())) == 1
+    CacheTestFixture._build_tables()
+    cached = CacheTestFixture._lrtable
+    assert isinstance(cached, parser_base._CachedLRTable)
+    assert cached.lr_action == built.lr_action
+    assert cached.lr_goto == built.lr_goto
+    assert cached.defaulted_states == built.defaulted_states
+    input = Input(["1 2 3"], BlockType.DATA)
+    node = CacheTestFixture().parse(input.tokenize())
+    assert [value.value for value in node] == [1.0, 2.0, 3.0]
+    # a corrupt cache is rebuilt
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"foo")
+    CacheTestFixture._build_tables()
+    assert not isinstance(CacheTestFixture._lrtable, parser_base._CachedLRTable)
+    # a change in precedence rebuilds the tables, even if no production ends in that terminal.
+    monkeypatch.setattr(
+        CacheTestFixture,
+        "precedence",
+        (("left", "SPACE"), ("left", "TEXT"), ("left", "(")),
+    )
+    CacheTestFixture._build_tables()
+    assert not isinstance(CacheTestFixture._lrtable, parser_base._CachedLRTable)
+    CacheTestFixture._build_tables()
+    assert isinstance(CacheTestFixture._lrtable, parser_base._CachedLRTable)
+    # nothing is cached without a cache tag
+    for path in tmp_path.iterdir():
+        path.unlink()
+    monkeypatch.setattr(sys.implementation, "cache_tag", None)
+    CacheTestFixture._build_tables()
+    assert not isinstance(CacheTestFixture._lrtable, parser_base._CachedLRTable)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parser_table_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MONTEPY_CACHE_DIR", str(tmp_path))
+    assert parser_base._get_table_cache_dir() == str(tmp_path)
+    monkeypatch.delenv("MONTEPY_CACHE_DIR")
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert parser_base._get_table_cache_dir() == os.path.join(
+        str(tmp_path), "montepy", "parser_tables"
+    )
+    # the package directory is never used.
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.delenv("HOME", raising=False)
+    monkeypatch.setattr(os.path, "expanduser", lambda path: path)
+    assert parser_base._get_table_cache_dir() is None
+
+
+def test_parser_without_sly_internals(tmp_path, monkeypatch):
+    monkeypatch.setenv("MONTEPY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(parser_base, "_HAS_SLY_INTERNALS", False)
+
+    class FallbackTestFixture(MCNP_Parser):
+        @_("number_sequence")
+        def sequence(self, p):
+            return p[0]
+
+    # SLY builds the tables when the class is made.
+    assert "_lrtable" in vars(FallbackTestFixture)
+    input = Input(["1 2 3"], BlockType.DATA)
+    node = FallbackTestFixture().parse(input.tokenize())
+    assert [value.value for value in node] == [1.0, 2.0, 3.0]
+    assert list(tmp_path.iterdir()) == []
+
+
 class TestShortcutListIntegration(TestCase):
     def setUp(self):
         self.parser = ShortcutTestFixture()
@@ -1182,6 +1266,64 @@ class TestSyntaxParsing(TestCase):
         with self.assertRaises(TypeError):
             Input(["5"], "5")
 
+    def testInputTokenizeReusesLexer(self):
+        lines = ["1 0 -2 imp:n=1"]
+        expected = [
+            (token.type, token.value)
+            for token in Input(lines, BlockType.CELL).tokenize()
+        ]
+        input = Input(lines, BlockType.CELL)
+        # abandon a tokenization part way through
+        tokens = input.tokenize()
+        next(tokens)
+        lexer = input.lexer
+        other = Input(["5 PZ 10"], BlockType.SURFACE)
+        self.assertEqual(
+            [token.value for token in other.tokenize()], ["5", " ", "PZ", " ", "10"]
+        )
+        tokens.close()
+        self.assertIsNone(input.lexer)
+        actual = [(token.type, token.value) for token in input.tokenize()]
+        self.assertEqual(actual, expected)
+        self.assertIn(lexer, Input._lexer_pool[type(lexer)])
+
+    def testInputTokenizeCache(self):
+        input = Input(["c foo", "m1 1001.80c 1.0"], BlockType.DATA)
+        tokens = list(input.tokenize())
+        self.assertIsNone(input.lexer)
+        # tokens are only cached when asked for
+        self.assertIsNone(input._tokens)
+        self.assertIs(input._get_tokens(), input._tokens)
+        self.assertEqual(
+            [token.value for token in input.tokenize()],
+            [token.value for token in tokens],
+        )
+        input._clear_tokens()
+        self.assertIsNone(input._tokens)
+        # the tokens are no longer needed once an object is parsed
+        montepy.data_inputs.data_parser.parse_data(input)
+        self.assertIsNone(input._tokens)
+        # the classifier parse caches the tokens for the full parse
+        montepy.data_inputs.data_input.DataInput(input, fast_parse=True)
+        self.assertIsNotNone(input._tokens)
+        montepy.data_inputs.material.Material(input)
+        self.assertIsNone(input._tokens)
+        input = Input(["1 2 3"], BlockType.DATA)
+        with self.assertRaises(montepy.errors.ParsingError):
+            montepy.data_inputs.data_input.DataInput(input, fast_parse=True)
+        self.assertIsNone(input._tokens)
+
+    def testSyntaxNodeSlots(self):
+        input = Input(["1 0 -2 imp:n=1"], BlockType.CELL)
+        cell = montepy.Cell(input)
+        tree = cell._tree
+        nodes = [tree, tree["geometry"], tree["parameters"], tree["cell_num"]]
+        for node in nodes:
+            self.assertFalse(hasattr(node, "__dict__"))
+        unpickled = pickle.loads(pickle.dumps(tree))
+        self.assertEqual(unpickled.format(), tree.format())
+        self.assertEqual(unpickled["cell_num"].value, 1)
+
     def testMessageInit(self):
         with self.assertRaises(TypeError):
             Message(["hi"], "5")
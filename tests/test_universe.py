@@ -283,6 +283,18 @@ class TestFill(TestCase):
         self.assertEqual(fill.max_index[2], 1)
         answer = np.array([[[1, 2], [3, 4]], [[5, 6], [7, 8]]])
         self.assertTrue((fill.old_universe_numbers == answer).all())
+        # test shortcuts in the matrix
+        input = Input(["1 0 -1 fill=0:1 0:1 0:1 1 2 3R 7 2R"], BlockType.CELL)
+        cell = Cell(input)
+        answer = np.array([[[1, 2], [2, 2]], [[2, 7], [7, 7]]])
+        self.assertTrue((cell.fill.old_universe_numbers == answer).all())
+        # test too few universes
+        with self.assertRaises(ValueError):
+            input = Input(["1 0 -1 fill=0:1 0:1 0:1 1 2 3"], BlockType.CELL)
+            cell = Cell(input)
+        with self.assertRaises(ValueError):
+            input = Input(["1 0 -1 fill=0:1 0:1 0:0 1 2 3 (5)"], BlockType.CELL)
+            cell = Cell(input)
         # test string universe
         with self.assertRaises(ValueError):
             input = Input(["1 0 -1 fill=0:1 0:1 0:1 hi"], BlockType.CELL)
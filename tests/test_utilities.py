@@ -1,6 +1,9 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from unittest import TestCase
 
+import montepy
+from montepy.input_parser.block_type import BlockType
+from montepy.input_parser.mcnp_input import Input
 from montepy.utilities import fortran_float
 
 
@@ -18,3 +21,22 @@ class testFortranFloat(TestCase):
     def test_raise_error(self):
         with self.assertRaises(ValueError):
             fortran_float("Dog")
+
+
+class testExceptionContext(TestCase):
+    def test_trivial_getters_not_wrapped(self):
+        self.assertTrue(montepy.Cell.number.fget._skip_exception_context)
+        self.assertFalse(
+            getattr(montepy.Cell.number.fset, "_skip_exception_context", False)
+        )
+        self.assertFalse(
+            hasattr(montepy.surfaces.surface.Surface.__hash__, "__wrapped__")
+        )
+
+    def test_setter_errors_have_context(self):
+        input = Input(["1 0 -2"], BlockType.CELL)
+        cell = montepy.Cell(input)
+        self.assertEqual(cell.number, 1)
+        with self.assertRaises(ValueError) as context:
+            cell.number = -1
+        self.assertIn("Error came from CELL: 1", context.exception.args[0])